@@ -2,20 +2,15 @@
 # [모듈 임포트]
 # ================================================================
 # 이 프로그램은 'Mission Computer'라는 가상 시스템을 시뮬레이션한다.
-# - platform: OS, CPU 정보 조회
-# - psutil  : CPU, 메모리 등 자원 사용량 측정
-# - json     : 출력 데이터를 JSON 형식으로 변환
-# - time     : 일정 시간 간격을 두고 반복 실행
 # - threading: 멀티스레드 동시 실행 지원
-# - multiprocessing: 멀티프로세스 동시 실행 지원
-# - random   : 더미 센서 데이터 생성을 위해 난수 활용
-import platform
-import psutil
-import json
-import time
+# - multiprocessing: 멀티프로세스 동시 실행 지원 (run_processes()에서 import)
+# - collector_engine: 수집 플러그인(시스템 정보, 부하, 센서)과 공용 수집 엔진
+# - mars_mission_computer: 더미 센서 (DummySensor)
 import threading
-import multiprocessing
-import random
+
+from collector_engine import (CollectorEngine, DummySensorSource, JsonFormat, PsutilLoadSource,
+                              SystemInfoSource)
+from mars_mission_computer import DummySensor
 
 
 # ================================================================
@@ -24,42 +19,8 @@ import random
 # - 가상의 '환경 센서' 역할을 한다.
 # - 실제 센서에서 데이터를 가져오는 대신, 무작위(random) 값을 생성한다.
 # - 이런 방식은 소프트웨어 개발에서 '테스트 시뮬레이션' 용도로 자주 사용된다.
+# - 세 변형이 같은 센서를 쓰도록 mars_mission_computer.py의 DummySensor를 가져다 쓴다.
 # ================================================================
-class DummySensor:
-    """
-    화성 기지(Mars Base)의 환경 데이터를 모사하는 더미 센서 클래스
-    """
-
-    def __init__(self):
-        # 센서 데이터는 딕셔너리(Dictionary)로 관리한다.
-        # 미리 측정 항목들을 정의하고, 초기값은 0.0으로 둔다.
-        self.env_values = {
-            'mars_base_internal_temperature': 0.0,   # 내부 온도 (°C)
-            'mars_base_external_temperature': 0.0,   # 외부 온도 (°C)
-            'mars_base_internal_humidity': 0.0,      # 내부 습도 (%)
-            'mars_base_external_illuminance': 0.0,   # 외부 조도 (lux)
-            'mars_base_internal_co2': 0.0,           # 내부 CO2 농도 (%)
-            'mars_base_internal_oxygen': 0.0         # 내부 산소 농도 (%)
-        }
-
-    def set_env(self):
-        """
-        환경 값을 난수로 갱신한다.
-        - random.uniform(a, b): [a, b] 사이의 실수 난수를 발생시킴
-        - round(val, n): 소수점 n자리로 반올림
-        """
-        self.env_values['mars_base_internal_temperature'] = round(random.uniform(18.0, 30.0), 2)
-        self.env_values['mars_base_external_temperature'] = round(random.uniform(0.0, 21.0), 2)
-        self.env_values['mars_base_internal_humidity'] = round(random.uniform(50.0, 60.0), 2)
-        self.env_values['mars_base_external_illuminance'] = round(random.uniform(500.0, 715.0), 2)
-        self.env_values['mars_base_internal_co2'] = round(random.uniform(0.02, 0.1), 3)
-        self.env_values['mars_base_internal_oxygen'] = round(random.uniform(4.0, 7.0), 2)
-
-    def get_env(self):
-        """
-        현재 저장된 센서 데이터를 반환한다.
-        """
-        return self.env_values
 
 
 # ================================================================
@@ -70,65 +31,42 @@ class DummySensor:
 #   1) 시스템 기본 정보 제공
 #   2) 자원 사용률(CPU, 메모리) 모니터링
 #   3) 센서 데이터 수집
+# - 수집 → 직렬화 → 출력 과정은 공용 수집 엔진(collector_engine.py)이 맡고,
+#   이 클래스는 어떤 수집 플러그인을 몇 초 주기로 쓸지만 정한다.
 # ================================================================
-class MissionComputer:
-    def __init__(self, name='MissionComputer'):
-        self.name = name
+class MissionComputer(CollectorEngine):
+    # 수집 주기 (초)
+    INFO_PERIOD = 20
+    LOAD_PERIOD = 20
+    SENSOR_PERIOD = 5
+
+    def __init__(self, name='MissionComputer', **options):
         self.ds = DummySensor()  # 센서 연결
+        super().__init__(name, sources=(
+            SystemInfoSource(self.INFO_PERIOD),     # platform/psutil 시스템 정보 (캐시)
+            PsutilLoadSource(self.LOAD_PERIOD),     # CPU/메모리 사용률 (블로킹 없음)
+            DummySensorSource(self.ds, self.SENSOR_PERIOD),
+        ), formatter=JsonFormat('Instance'), **options)
 
     def get_mission_computer_info(self):
         """
         [역할] 20초마다 시스템 기본 정보를 JSON 형식으로 출력
-        - platform 모듈로 운영체제/CPU 정보 조회
-        - psutil 모듈로 메모리 용량 조회
+        - 운영체제/CPU 정보와 메모리 용량 (SystemInfoSource)
         """
-        while True:
-            try:
-                info = {
-                    'Instance': self.name,
-                    '운영체계': platform.system(),                  # 예: Windows, Linux, Darwin
-                    '운영체계_버전': platform.version(),            # OS 버전 문자열
-                    'CPU_타입': platform.processor(),              # CPU 모델명
-                    'CPU_코어_수': psutil.cpu_count(logical=False), # 물리적 코어 수
-                    '메모리_크기_GB': round(psutil.virtual_memory().total / (1024 ** 3), 2)
-                }
-                print(json.dumps(info, indent=4, ensure_ascii=False))
-            except Exception as e:
-                print(f"[{self.name}] 시스템 정보 조회 에러: {e}")
-            time.sleep(20)
+        self.run_collector('info')
 
     def get_mission_computer_load(self):
         """
         [역할] 20초마다 CPU 및 메모리 사용량을 출력
-        - psutil.cpu_percent(interval=1): 1초 평균 CPU 사용률
-        - psutil.virtual_memory().percent: 메모리 사용률(%)
+        - CPU 사용률은 직전 측정 이후의 평균 (1초씩 기다리지 않음)
         """
-        while True:
-            try:
-                load = {
-                    'Instance': self.name,
-                    'CPU_실시간_사용량_%': psutil.cpu_percent(interval=1),
-                    '메모리_실시간_사용량_%': psutil.virtual_memory().percent
-                }
-                print(json.dumps(load, indent=4, ensure_ascii=False))
-            except Exception as e:
-                print(f"[{self.name}] 시스템 부하 조회 에러: {e}")
-            time.sleep(20)
+        self.run_collector('load')
 
     def get_sensor_data(self):
         """
         [역할] 5초마다 'DummySensor'로부터 환경 데이터를 수집하여 출력
         """
-        while True:
-            try:
-                self.ds.set_env()                   # 센서 데이터 갱신
-                sensor_data = self.ds.get_env()     # 새 데이터 가져오기
-                result = {'Instance': self.name}    # 인스턴스 정보 추가
-                result.update(sensor_data)
-                print(json.dumps(result, indent=4, ensure_ascii=False))
-            except Exception as e:
-                print(f"[{self.name}] 센서 데이터 조회 에러: {e}")
-            time.sleep(5)
+        self.run_collector('sensor')
 
 
 # ================================================================
@@ -172,6 +110,8 @@ def run_threads():
 #   → 자원을 따로 쓰므로 안정적이지만, 생성 비용이 크고 공유가 불편하다.
 # ================================================================
 def run_processes():
+    import multiprocessing  # 프로세스 실행을 고를 때만 불러온다 (스레드 실행은 시작이 빨라진다)
+
     runComputer1 = MissionComputer('Process-1')
     runComputer2 = MissionComputer('Process-2')
     runComputer3 = MissionComputer('Process-3')
@@ -204,17 +144,21 @@ if __name__ == '__main__':
 
     print('--- 멀티프로세스 실행 ---')
     run_processes()  # 프로세스 방식 병렬 실행
-DummySensor
-→ 가상의 환경 센서. 실제 하드웨어가 없어도 난수를 활용해 "측정값"처럼 보이는 데이터를 만든다.
-→ 소프트웨어 테스트에서 흔히 쓰는 Mock 객체(Mock Object) 개념.
-
-MissionComputer
-→ 센서 데이터를 수집하고, 시스템 정보를 출력한다.
-→ 실제 임무용 컴퓨터에서는 "우주비행사 생존환경 모니터링" 역할에 대응한다고 볼 수 있다.
-
-멀티스레드 vs 멀티프로세스
 
-스레드: 한 프로세스 안에서 자원을 공유, 메모리 효율↑ / 동시성 제어 필요
 
-프로세스: 독립된 메모리 공간, 안정성↑ / 공유 어려움, 성능 비용↑'''
-'''
+# ================================================================
+# [정리]
+# ================================================================
+# DummySensor
+# → 가상의 환경 센서. 실제 하드웨어가 없어도 난수를 활용해 "측정값"처럼 보이는 데이터를 만든다.
+# → 소프트웨어 테스트에서 흔히 쓰는 Mock 객체(Mock Object) 개념.
+#
+# MissionComputer
+# → 센서 데이터를 수집하고, 시스템 정보를 출력한다.
+# → 실제 임무용 컴퓨터에서는 "우주비행사 생존환경 모니터링" 역할에 대응한다고 볼 수 있다.
+#
+# 멀티스레드 vs 멀티프로세스
+#
+# 스레드: 한 프로세스 안에서 자원을 공유, 메모리 효율↑ / 동시성 제어 필요
+#
+# 프로세스: 독립된 메모리 공간, 안정성↑ / 공유 어려움, 성능 비용↑
@@ -0,0 +1,129 @@
+# ----------------------------- 모듈 임포트 -----------------------------
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+
+# ----------------------------- JobDrift 클래스 -----------------------------
+class JobDrift:
+    """
+    작업 하나의 스케줄링 지연(drift) 통계
+    - 예정 시각 대비 실제 시작 시각이 얼마나 늦었는지 누적한다
+    """
+
+    __slots__ = ('computer', 'job', 'count', 'total', 'max')
+
+    def __init__(self, computer, job):
+        self.computer = computer
+        self.job = job
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, lateness):
+        self.count += 1
+        self.total += lateness
+        if lateness > self.max:
+            self.max = lateness
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else 0.0
+
+
+# ----------------------------- AsyncCollectorRunner 클래스 -----------------------------
+class AsyncCollectorRunner:
+    """
+    여러 MissionComputer 인스턴스의 수집 작업을 하나의 이벤트 루프에서 실행
+    - 인스턴스마다 collector_jobs()가 돌려주는 (이름, 함수, 주기, 블로킹 여부)를 사용
+    - 예정 시각은 시작 시각 + k * 주기 로 고정하여 지연이 누적되지 않게 한다
+    - 블로킹 작업(psutil 호출)은 크기가 제한된 스레드 풀에서 실행한다
+    """
+
+    def __init__(self, computers, max_workers=4):
+        self.computers = list(computers)
+        self.max_workers = max_workers
+        self.drift = []
+
+    async def _run_job(self, computer, name, step, period, blocking, executor, deadline):
+        loop = asyncio.get_running_loop()
+        stats = JobDrift(getattr(computer, 'name', getattr(computer, 'computer_id', None)), name)
+        self.drift.append(stats)
+        instrumentation = getattr(computer, 'instrumentation', None)
+        start = loop.time()
+        tick = 0
+        while True:
+            scheduled = start + tick * period
+            if deadline is not None and scheduled >= deadline:
+                return
+            delay = scheduled - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            lateness = max(0.0, loop.time() - scheduled)
+            stats.record(lateness)
+            if instrumentation is not None:
+                instrumentation.record_lateness(name, lateness)
+            if blocking:
+                await loop.run_in_executor(executor, step)
+            else:
+                step()
+            tick += 1
+            # 작업이 주기보다 오래 걸렸다면 밀린 회차는 건너뛴다
+            behind = int((loop.time() - start) // period)
+            if behind > tick:
+                tick = behind
+
+    async def run(self, duration=None):
+        """ 모든 작업을 실행 (duration초 후 종료, None이면 무한 실행) """
+        loop = asyncio.get_running_loop()
+        deadline = None if duration is None else loop.time() + duration
+        with ThreadPoolExecutor(max_workers=self.max_workers,
+                                thread_name_prefix='collector') as executor:
+            tasks = [
+                asyncio.create_task(
+                    self._run_job(computer, name, step, period, blocking, executor, deadline)
+                )
+                for computer in self.computers
+                for name, step, period, blocking in computer.collector_jobs()
+            ]
+            try:
+                await asyncio.gather(*tasks)
+            finally:
+                for task in tasks:
+                    task.cancel()
+
+    def drift_report(self):
+        """ 작업별 지연 통계를 딕셔너리 목록으로 반환 """
+        return [
+            {
+                'Instance': stats.computer,
+                'job': stats.job,
+                'runs': stats.count,
+                'mean_drift_ms': round(stats.mean * 1000, 3),
+                'max_drift_ms': round(stats.max * 1000, 3),
+            }
+            for stats in self.drift
+        ]
+
+    def print_drift_report(self):
+        print(f'{"Instance":<20} {"job":<8} {"runs":>6} {"mean_ms":>10} {"max_ms":>10}')
+        for row in self.drift_report():
+            print(f'{str(row["Instance"]):<20} {row["job"]:<8} {row["runs"]:>6} '
+                  f'{row["mean_drift_ms"]:>10.3f} {row["max_drift_ms"]:>10.3f}')
+
+
+def run_async(computers, duration=None, max_workers=4):
+    """
+    asyncio 러너로 computers의 수집 작업을 실행하고 종료 시 지연 통계를 출력
+    - Ctrl+C로 중단해도 통계는 출력된다
+    """
+    runner = AsyncCollectorRunner(computers, max_workers=max_workers)
+    started = time.perf_counter()
+    try:
+        asyncio.run(runner.run(duration))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        print(f'--- 스케줄링 지연 통계 ({time.perf_counter() - started:.1f}s) ---')
+        runner.print_drift_report()
+    return runner
@@ -0,0 +1,118 @@
+"""
+변화 감지 출력(불감대) 벤치마크
+
+가상 시계로 센서 수집기를 n회 실행하며 전체 출력(JsonFormat)과 ChangeFilter 델타 출력의
+레코드 수, 바이트 수, 샘플당 CPU 시간을 비교한다.
+- steady: 정상 상태 기지 (채널마다 작은 랜덤 워크 - 대부분 불감대 안)
+- uniform: DummySensor 기본 동작 (범위 전체에서 매번 새로 뽑음 - 최악의 경우)
+델타 스트림은 DeltaReconstructor로 복원해 매 샘플의 복원 오차가 불감대 이내인지 확인한다.
+
+실행: python -m benchmarks.bench_deadband [샘플 수]
+"""
+
+import random
+import sys
+import time
+
+from deadband import EXACT, ChangeFilter, DeltaReconstructor
+from mars_mission_computer import DEADBANDS, SENSOR_CHANNELS, DummySensor, MissionComputer
+from sim_clock import RealClock
+
+
+class SteppingClock(RealClock):
+    """ 벤치마크가 직접 시각을 옮기는 시계 """
+
+    def __init__(self, start=1_700_000_000.0):
+        self.now = start
+
+    def time(self):
+        return self.now
+
+
+class CountingSink:
+    """ 출력 레코드 수/바이트 수만 세고, keep=True면 레코드를 보관 """
+
+    def __init__(self, keep=False):
+        self.records = 0
+        self.bytes = 0
+        self.lines = [] if keep else None
+
+    def write(self, text):
+        self.records += 1
+        self.bytes += len(text.encode('utf-8'))
+        if self.lines is not None:
+            self.lines.append(text)
+        return True
+
+
+class SteadySensor(DummySensor):
+    """ 정상 상태 기지: 범위 가운데에서 시작해 매 샘플 범위의 step 비율만큼 랜덤 워크 """
+
+    def __init__(self, step=0.002, seed=0):
+        super().__init__()
+        self.rng = random.Random(seed)
+        self.step = step
+        self.level = {key: (low + high) / 2 for key, low, high, _ in SENSOR_CHANNELS}
+
+    def set_env(self):
+        values = {}
+        for key, low, high, ndigits in SENSOR_CHANNELS:
+            level = self.level[key] + self.rng.gauss(0.0, (high - low) * self.step)
+            self.level[key] = level = min(max(level, low), high)
+            values[key] = round(level, ndigits)
+        self.env_values = values
+
+
+def run(sensor_factory, changes, n):
+    """ (sink, 샘플당 CPU 시간 us) """
+    clock = SteppingClock()
+    sink = CountingSink()
+    computer = MissionComputer('Bench', sink=sink, clock=clock)
+    computer.ds = computer.sources['sensor'].sensor = sensor_factory()
+    computer.changes = changes
+    period = MissionComputer.SENSOR_PERIOD
+    began = time.process_time()
+    for _ in range(n):
+        clock.now += period
+        computer.collect('sensor')
+    cpu_us = (time.process_time() - began) / n * 1e6
+    return sink, cpu_us
+
+
+def verify(sensor_factory, deadbands, n):
+    """ 매 샘플 후 복원 상태와 실제 값을 비교 - 불감대를 넘은 채널 수 (0이어야 함) """
+    clock = SteppingClock()
+    sink = CountingSink(keep=True)
+    computer = MissionComputer('Bench', sink=sink, clock=clock)
+    computer.ds = computer.sources['sensor'].sensor = sensor = sensor_factory()
+    computer.changes = ChangeFilter(deadbands, heartbeat=600)
+    reconstructor = DeltaReconstructor()
+    violations = 0
+    for _ in range(n):
+        clock.now += MissionComputer.SENSOR_PERIOD
+        computer.collect('sensor')
+        for line in sink.lines:
+            reconstructor.apply(line)
+        sink.lines.clear()
+        state = reconstructor.current('Bench', 'sensor')
+        for key, value in sensor.get_env().items():
+            if deadbands.get(key, EXACT).exceeded(state[key], value):
+                violations += 1
+    return violations
+
+
+def main(n=50_000):
+    print(f'{"workload":<8} {"mode":<7} {"records":>9} {"bytes":>12} {"B/sample":>9} '
+          f'{"cpu us/sample":>14}')
+    for label, factory in (('steady', SteadySensor), ('uniform', DummySensor)):
+        for mode in ('full', 'delta'):
+            changes = ChangeFilter(DEADBANDS, heartbeat=60) if mode == 'delta' else None
+            sink, cpu_us = run(factory, changes, n)
+            print(f'{label:<8} {mode:<7} {sink.records:>9,} {sink.bytes:>12,} '
+                  f'{sink.bytes / n:>9.1f} {cpu_us:>14.2f}')
+        violations = verify(factory, DEADBANDS, min(n, 10_000))
+        print(f'{label:<8} reconstruction: {violations} channel samples outside deadband')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50_000)
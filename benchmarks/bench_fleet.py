@@ -0,0 +1,49 @@
+"""
+함대(Fleet) 실행 벤치마크
+
+MissionComputer 객체 N개와 Fleet 인스턴스 N대의 인스턴스당 메모리를 비교하고,
+run_fleet()으로 작업 프로세스 풀에서 시뮬레이션 시간 duration초 분량을
+VirtualClock으로 최대 속도로 돌려 지속 초당 샘플 수를 측정한다.
+
+실행: python -m benchmarks.bench_fleet [인스턴스 수] [시뮬레이션 초] [작업 프로세스 수]
+"""
+
+import sys
+import tracemalloc
+
+import numpy as np
+
+from fleet import Fleet, run_fleet
+from mars_mission_computer import MissionComputer
+
+
+def traced_bytes_per_instance(factory, count):
+    tracemalloc.start()
+    objects = factory(count)
+    used, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return used / count
+
+
+def main(instances=10_000, duration=3_600, workers=None):
+    # MissionComputer는 인스턴스마다 24시간 센서 이력을 가지므로 이력 크기를 최소로 잡아 비교
+    per_computer = traced_bytes_per_instance(
+        lambda n: [MissionComputer(f'M-{i}', history_capacity=1) for i in range(n)],
+        min(instances, 1_000))
+    per_fleet = traced_bytes_per_instance(lambda n: Fleet(np.arange(1, n + 1)), instances)
+    print(f'MissionComputer : {per_computer:10,.0f} B/instance (history_capacity=1)')
+    print(f'Fleet           : {per_fleet:10,.0f} B/instance')
+
+    report = run_fleet(instances, duration, workers=workers, seed=0)
+    print(f'fleet run       : {report["instances"]:,} instances x {duration:,} simulated s, '
+          f'{report["workers"]} workers')
+    print(f'samples         : {report["samples"]:,} in {report["wall_s"]:.2f}s wall')
+    print(f'samples/s       : {report["samples_per_s"]:,.0f} (가장 느린 작업 프로세스 기준)')
+    print(f'state           : {report["state_bytes_per_instance"]:,.0f} B/instance, '
+          f'RSS +{report["rss_bytes_per_instance"]:,.0f} B/instance')
+
+
+if __name__ == '__main__':
+    args = [int(arg) for arg in sys.argv[1:4]]
+    main(*args)
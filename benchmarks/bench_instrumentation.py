@@ -0,0 +1,50 @@
+"""
+계측 오버헤드 벤치마크
+
+report_info/report_load/report_sensor 1회 비용을 계측 꺼짐(NULL_INSTRUMENTATION)과
+켜짐(Instrumentation)으로 비교하고, 켜졌을 때 모은 단계별 지연 표와
+StackSampler가 찍은 핫 스택을 출력한다.
+
+실행: python -m benchmarks.bench_instrumentation [반복 횟수]
+"""
+
+import sys
+import time
+
+import mars_mission_computer
+import mars_mission_computerz34er0
+from instrumentation import NULL_INSTRUMENTATION, Instrumentation, StackSampler
+from output_sink import NullSink
+
+
+def per_call_us(computer, method, n):
+    func = getattr(computer, method)
+    start = time.perf_counter()
+    for _ in range(n):
+        func()
+    return (time.perf_counter() - start) / n * 1e6
+
+
+def main(n=20_000):
+    computers = (
+        ('mars', mars_mission_computer.MissionComputer('Bench', sink=NullSink())),
+        ('z34er0', mars_mission_computerz34er0.MissionComputer(1, sink=NullSink())),
+    )
+    sampler = StackSampler().start()
+    for label, computer in computers:
+        instrumentation = Instrumentation()
+        for method in ('report_info', 'report_load', 'report_sensor'):
+            computer.instrumentation = NULL_INSTRUMENTATION
+            off = per_call_us(computer, method, n)
+            computer.instrumentation = instrumentation
+            on = per_call_us(computer, method, n)
+            print(f'{label:<7} {method:<14} off {off:8.2f} us  on {on:8.2f} us  '
+                  f'(+{on - off:.2f} us)')
+        print(instrumentation.format_report())
+        print()
+    sampler.stop()
+    sampler.dump(top=3, file=sys.stdout)
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20_000)
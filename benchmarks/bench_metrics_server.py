@@ -0,0 +1,91 @@
+"""
+HTTP 메트릭 서버 스크레이프 지연 벤치마크
+
+MissionComputer N개를 MetricsRegistry에 연결하고 localhost MetricsServer를 띄운 뒤,
+(1) 수집기가 쉬는 동안 (2) 수집기 스레드 4개가 합계 rate 샘플/초로 report_sensor를
+호출하는 동안 /metrics와 /metrics.json 스크레이프 지연 백분위수를 비교하고,
+스크레이프마다 다시 렌더링했다면 들었을 비용(refresh 1회)도 함께 보여 준다.
+(수집기 스레드가 CPU를 100% 쓰도록 rate를 올리면 스크레이프 지연은 잠금이 아니라
+GIL 전환 간격에 좌우된다)
+
+실행: python -m benchmarks.bench_metrics_server [인스턴스 수] [스크레이프 횟수] [초당 샘플 수]
+"""
+
+import http.client
+import sys
+import threading
+import time
+
+import numpy as np
+
+from mars_mission_computer import MissionComputer
+from metrics_server import serve_metrics
+from output_sink import NullSink
+
+
+def scrape(server, path, count):
+    host, port = server.httpd.server_address[:2]
+    connection = http.client.HTTPConnection(host, port)
+    latencies = []
+    size = 0
+    for _ in range(count):
+        start = time.perf_counter()
+        connection.request('GET', path)
+        response = connection.getresponse()
+        size = len(response.read())
+        latencies.append(time.perf_counter() - start)
+    connection.close()
+    return np.percentile(np.array(latencies) * 1e3, [50, 99]), size
+
+
+def main(instances=200, count=300, rate=10_000):
+    computers = [MissionComputer(f'M-{i}', instance_id=i, sink=NullSink())
+                 for i in range(1, instances + 1)]
+    server = serve_metrics(computers, refresh_interval=0.1)
+    for computer in computers:
+        computer.report_info()
+        computer.report_load()
+        computer.report_sensor()
+    server.registry.refresh()
+    server.registry._rendered_version = -1  # 같은 조각을 다시 렌더링
+    start = time.perf_counter()
+    server.registry.refresh()
+    print(f'render 1회 (refresh): {(time.perf_counter() - start) * 1e3:.3f} ms '
+          f'- 스크레이프 경로에서는 하지 않음')
+
+    stop = threading.Event()
+    published = [0]
+
+    def hammer(group):
+        interval = len(group) / (rate / 4)
+        deadline = time.perf_counter()
+        while not stop.is_set():
+            for computer in group:
+                computer.report_sensor()
+            published[0] += len(group)
+            deadline += interval
+            stop.wait(max(0.0, deadline - time.perf_counter()))
+
+    try:
+        for label in ('idle', 'busy'):
+            threads = []
+            if label == 'busy':
+                threads = [threading.Thread(target=hammer, args=(computers[i::4],))
+                           for i in range(4)]
+                for thread in threads:
+                    thread.start()
+            for path in ('/metrics', '/metrics.json'):
+                (p50, p99), size = scrape(server, path, count)
+                print(f'{label:<5} {path:<14} p50 {p50:7.3f} ms  p99 {p99:7.3f} ms  ({size:,} bytes)')
+            stop.set()
+            for thread in threads:
+                thread.join()
+            stop.clear()
+        print(f'busy 동안 수집기 샘플: {published[0]:,} (목표 {rate:,}/s)')
+    finally:
+        server.close()
+
+
+if __name__ == '__main__':
+    args = [int(arg) for arg in sys.argv[1:4]]
+    main(*args)
@@ -0,0 +1,60 @@
+"""
+JSON 출력 경로와 바이너리 레코드 형식 비교 벤치마크
+
+센서 샘플 1개당 바이트 수와 인코딩/디코딩 CPU 시간을 비교한다.
+- json     : 기존 get_sensor_data() 경로 (json.dumps(indent=4, ensure_ascii=False))
+- encode   : RecordSchema.encode() 레코드 1개씩
+- pack_many: RecordSchema.pack_many() 로 한 번에
+
+실행: python -m benchmarks.bench_record_format [샘플 수]
+"""
+
+import json
+import sys
+import time
+
+from mars_mission_computer import SENSOR_KEYS, SENSOR_RECORD, DummySensor
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def main(n=100_000):
+    block = DummySensor().generate(n, seed=0)
+    timestamps = [1_700_000_000.0 + 5 * i for i in range(n)]
+    rows = block.T.tolist()
+    dicts = [dict(zip(SENSOR_KEYS, row)) for row in rows]
+
+    def json_encode():
+        out = []
+        for ts, values in zip(timestamps, dicts):
+            record = {'Instance': 'Bench', 'Timestamp': ts}
+            record.update(values)
+            out.append(json.dumps(record, indent=4, ensure_ascii=False))
+        return out
+
+    def binary_encode():
+        encode = SENSOR_RECORD.encode
+        return [encode(ts, 1, row) for ts, row in zip(timestamps, rows)]
+
+    json_out, json_enc = timed(json_encode)
+    bin_out, bin_enc = timed(binary_encode)
+    packed, pack_enc = timed(lambda: SENSOR_RECORD.pack_many(timestamps, 1, block.T))
+
+    _, json_dec = timed(lambda: [json.loads(text) for text in json_out])
+    _, bin_dec = timed(lambda: [SENSOR_RECORD.decode(raw) for raw in bin_out])
+    _, bulk_dec = timed(lambda: SENSOR_RECORD.unpack_many(packed)['values'].sum())
+
+    json_bytes = sum(len(text.encode('utf-8')) + 1 for text in json_out) / n
+    print(f'samples: {n}')
+    print(f'{"path":<12} {"bytes/sample":>13} {"encode us":>10} {"decode us":>10}')
+    print(f'{"json":<12} {json_bytes:>13.1f} {json_enc / n * 1e6:>10.3f} {json_dec / n * 1e6:>10.3f}')
+    print(f'{"encode":<12} {SENSOR_RECORD.size:>13.1f} {bin_enc / n * 1e6:>10.3f} {bin_dec / n * 1e6:>10.3f}')
+    print(f'{"pack_many":<12} {len(packed) / n:>13.1f} {pack_enc / n * 1e6:>10.3f} {bulk_dec / n * 1e6:>10.3f}')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
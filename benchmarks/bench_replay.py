@@ -0,0 +1,87 @@
+"""
+녹화 재생 벤치마크
+
+Fleet(simulate=True)로 인스턴스 n대의 info/load/sensor 녹화(TelemetryLog 디렉터리)를 만든 뒤
+(1) iter_recording(): 청크 단위 읽기 처리량과 최대 메모리 (녹화 크기와 무관해야 함)
+(2) Replayer: 최대 속도(speed=None)로 MissionComputer n대에 재생할 때 초당 레코드 수
+(3) run_replay(): 작업 프로세스로 나눠 배속 재생할 때 원래 박자(녹화 구간 / speed) 유지 여부
+
+실행: python -m benchmarks.bench_replay [인스턴스 수] [녹화 시간(초)]
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+
+from fleet import Fleet
+from mars_mission_computer import RECORD_SCHEMAS, MissionComputer
+from output_sink import NullSink
+from replay import Replayer, iter_recording, run_replay
+from sim_clock import VirtualClock
+from telemetry_log import TelemetryLog
+
+START = 1_700_000_000.0
+
+
+def record(directory, instances, duration):
+    with TelemetryLog(directory, RECORD_SCHEMAS, fsync_batch=1 << 30) as log:
+        fleet = Fleet(np.arange(1, instances + 1), seed=0, clock=VirtualClock(start=START),
+                      log=log, simulate=True)
+        return fleet.run(duration)
+
+
+def make_computer(instance_id):
+    return MissionComputer(f'Replay-{instance_id}', history_capacity=64, instance_id=instance_id,
+                           sink=NullSink())
+
+
+def main(instances=100, duration=3600, target_rate=10_000):
+    directory = tempfile.mkdtemp(prefix='replay-bench-')
+    try:
+        recorded = record(directory, instances, duration)
+        size = sum(os.path.getsize(os.path.join(directory, name))
+                   for name in os.listdir(directory))
+        print(f'recording : {recorded:,} samples, {size / 2 ** 20:.1f} MB '
+              f'({instances} instances x {duration} s)')
+
+        tracemalloc.start()
+        began = time.perf_counter()
+        count = sum(len(records) for kind in RECORD_SCHEMAS
+                    for _, records in iter_recording(directory, kind))
+        read_sec = time.perf_counter() - began
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print(f'read      : {count / read_sec / 1e6:8.2f} M records/s, '
+              f'peak memory {peak / 2 ** 10:,.0f} KiB')
+
+        replayer = Replayer(directory, [make_computer(i) for i in range(1, instances + 1)],
+                            speed=None)
+        began = time.perf_counter()
+        replayed = replayer.run()
+        print(f'replay max: {replayed / (time.perf_counter() - began):10,.0f} records/s '
+              f'(1 process, {replayed:,} records)')
+
+        for workers in sorted({1, os.cpu_count() or 1}):
+            report = run_replay(directory, make_computer, range(1, instances + 1), workers,
+                                speed=None)
+            print(f'run_replay: {report["records_per_s"]:10,.0f} records/s '
+                  f'({workers} workers, speed=None)')
+        # 최대 처리량보다 낮은 목표 속도로 배속 재생 - 녹화 구간 / speed에 맞춰 끝나야 한다
+        speed = target_rate * duration / replayed
+        report = run_replay(directory, make_computer, range(1, instances + 1), speed=speed,
+                            lead=0.2)
+        expected = (duration - MissionComputer.SENSOR_PERIOD) / speed + 0.2
+        print(f'paced     : {report["wall_s"]:.2f} s wall for {expected:.2f} s expected '
+              f'(speed={speed:,.0f}x ≈ {target_rate:,} records/s, {report["replayed"]:,} records)')
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == '__main__':
+    args = [int(arg) for arg in sys.argv[1:3]]
+    main(*args)
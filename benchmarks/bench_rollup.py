@@ -0,0 +1,61 @@
+"""
+다단계 요약(rollup) 벤치마크
+
+인스턴스 묶음 단위로 센서 샘플을 RollupEngine에 넣어 초당 처리 샘플 수를 재고,
+긴 구간 질의를 SensorHistory 원시 샘플 집계와 요약 집계로 비교한다.
+
+실행: python -m benchmarks.bench_rollup [인스턴스 수] [시뮬레이션 일수]
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from mars_mission_computer import SENSOR_KEYS, DummySensor, MissionComputer
+from rollup import RollupEngine
+from sensor_history import SensorHistory
+
+
+def main(instances=1_000, days=7):
+    period = MissionComputer.SENSOR_PERIOD
+    ticks = days * 86400 // period
+    start_time = 1_700_000_000.0
+    engine = RollupEngine({'sensor': SENSOR_KEYS})
+    history = SensorHistory(SENSOR_KEYS, ticks)  # 인스턴스 1의 원시 이력 (비교용)
+    block = DummySensor().generate(instances * 64, seed=0).T.copy()
+    ids = np.arange(1, instances + 1)
+
+    began = time.perf_counter()
+    for tick in range(ticks):
+        now = start_time + tick * period
+        offset = (tick * 7) % (len(block) - instances)
+        values = block[offset:offset + instances]
+        engine.update('sensor', ids, values, now)
+        history.extend(values[:1].T, [now])
+    ingest = time.perf_counter() - began
+    print(f'ingest    : {instances * ticks / ingest:14,.0f} samples/s '
+          f'({instances:,} instances x {days} days, 3 tiers)')
+    print(f'memory    : {engine.nbytes / instances:14,.0f} B/instance')
+
+    channel = 'mars_base_internal_co2'
+    # 요약은 구간 단위로 집계하므로 질의 경계를 1시간 구간 경계에 맞춘다
+    t0 = (start_time // 3600 + 2) * 3600
+    t1 = ((start_time + (days - 1) * 86400) // 3600) * 3600 - 1
+
+    began = time.perf_counter()
+    raw = history.stats(channel, start_time=t0, end_time=t1)
+    raw_sec = time.perf_counter() - began
+    began = time.perf_counter()
+    summary = engine.aggregate('sensor', 1, channel, t0, t1, tier='1h')
+    rollup_sec = time.perf_counter() - began
+    assert raw['count'] == summary['count']
+    assert abs(raw['mean'] - summary['mean']) < 1e-6
+    print(f'raw scan  : {raw_sec * 1e3:10.3f} ms ({raw["count"]:,} samples)')
+    print(f'rollup 1h : {rollup_sec * 1e3:10.3f} ms '
+          f'({len(engine.query("sensor", 1, channel, t0, t1, tier="1h")["start"])} buckets)')
+
+
+if __name__ == '__main__':
+    args = [int(arg) for arg in sys.argv[1:3]]
+    main(*args)
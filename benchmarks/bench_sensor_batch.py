@@ -0,0 +1,44 @@
+"""
+DummySensor 배치 생성 벤치마크
+
+set_env() 반복 호출과 generate(n) 한 번 호출의 처리량을 비교한다.
+
+실행: python -m benchmarks.bench_sensor_batch [샘플 수]
+"""
+
+import sys
+import time
+
+from mars_mission_computer import DummySensor
+
+
+def bench_set_env_loop(n):
+    """ set_env()를 n번 호출하고 매 샘플을 복사해 보관 (기존 방식) """
+    ds = DummySensor()
+    start = time.perf_counter()
+    readings = []
+    for _ in range(n):
+        ds.set_env()
+        readings.append(dict(ds.get_env()))
+    return time.perf_counter() - start
+
+
+def bench_generate(n):
+    """ generate(n)으로 한 번에 n개 샘플 생성 """
+    ds = DummySensor()
+    start = time.perf_counter()
+    ds.generate(n, seed=0)
+    return time.perf_counter() - start
+
+
+def main(n=200_000):
+    loop_sec = bench_set_env_loop(n)
+    batch_sec = bench_generate(n)
+    print(f'samples           : {n}')
+    print(f'set_env() loop    : {loop_sec:.4f}s ({n / loop_sec:,.0f} samples/s)')
+    print(f'generate(n)       : {batch_sec:.4f}s ({n / batch_sec:,.0f} samples/s)')
+    print(f'speedup           : {loop_sec / batch_sec:.1f}x')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
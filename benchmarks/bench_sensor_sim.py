@@ -0,0 +1,100 @@
+"""
+상관된 센서 시뮬레이션 벤치마크
+
+(1) 처리량: SensorSimulator.step()으로 기지 n개를 한 틱씩 진행할 때 초당 샘플 수
+    (샘플 = 기지 1개의 6채널 값), Fleet 균등 분포 난수 대비 Fleet(simulate=True)
+(2) 현실성: 기지 1개를 5초 주기로 며칠 진행한 값과 DummySensor.generate() 균등 난수 비교
+    - 채널별 lag-1 자기상관, CO2-O2 상관계수, 외부 조도/온도 일주기 진폭
+    - ts_codec 압축 크기 (연속된 값이라 델타 부호화가 잘 듣는다)
+
+실행: python -m benchmarks.bench_sensor_sim [최대 기지 수] [일수]
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from fleet import Fleet
+from mars_mission_computer import SENSOR_CHANNELS, SENSOR_KEYS, DummySensor, make_simulator
+from sensor_sim import SOL_SECONDS
+from sim_clock import VirtualClock
+from ts_codec import encode_block
+
+PERIOD = 5.0
+
+
+def throughput(count, ticks):
+    simulator = make_simulator(count, seed=0)
+    began = time.perf_counter()
+    for _ in range(ticks):
+        simulator.step(PERIOD)
+    return count * ticks / (time.perf_counter() - began)
+
+
+def fleet_rate(count, duration, simulate):
+    fleet = Fleet(np.arange(1, count + 1), seed=0, clock=VirtualClock(start=0.0),
+                  simulate=simulate)
+    began = time.perf_counter()
+    samples = fleet.run(duration)
+    return samples / (time.perf_counter() - began)
+
+
+def series(days):
+    """ 기지 1개를 5초 주기로 days일 진행한 값: shape (채널 수, 샘플 수) """
+    simulator = make_simulator(1, seed=0)
+    ticks = int(days * SOL_SECONDS / PERIOD)
+    values = np.empty((ticks, len(SENSOR_KEYS)))
+    for tick in range(ticks):
+        values[tick] = simulator.rounded(simulator.step(PERIOD)[0])
+    return values.T
+
+
+def describe(label, values):
+    lag1 = [np.corrcoef(row[:-1], row[1:])[0, 1] for row in values]
+    co2, o2 = values[SENSOR_KEYS.index('mars_base_internal_co2')], \
+        values[SENSOR_KEYS.index('mars_base_internal_oxygen')]
+    # 솔 단위 시각 24구간 평균의 최대-최소 = 일주기 진폭 (기지 경도와 무관)
+    phase = (np.arange(values.shape[1]) * PERIOD / SOL_SECONDS % 1 * 24).astype(int)
+    swings = []
+    for key in ('mars_base_external_illuminance', 'mars_base_external_temperature'):
+        row = values[SENSOR_KEYS.index(key)]
+        means = np.bincount(phase, row, 24) / np.bincount(phase, minlength=24)
+        swings.append(means.max() - means.min())
+    timestamps = np.arange(values.shape[1]) * PERIOD
+    digits = [channel[3] for channel in SENSOR_CHANNELS]
+    size = sum(len(encode_block(timestamps[i:i + 4096], values[:, i:i + 4096], digits))
+               for i in range(0, values.shape[1], 4096))
+    print(f'--- {label} ({values.shape[1]:,} samples) ---')
+    print('lag-1 autocorr : ' + ' '.join(f'{value:6.3f}' for value in lag1))
+    print(f'corr(CO2, O2)  : {np.corrcoef(co2, o2)[0, 1]:6.3f}')
+    print(f'diurnal swing  : illuminance {swings[0]:7.2f} lux, '
+          f'external temperature {swings[1]:5.2f} °C')
+    print(f'ts_codec       : {size / values.shape[1]:6.2f} B/sample')
+
+
+def main(max_count=1_000_000, days=3):
+    print('=== SensorSimulator.step() ===')
+    for count in (1_000, 100_000, max_count):
+        if count > max_count:
+            continue
+        rate = throughput(count, max(10, 2_000_000 // count))
+        print(f'{count:>10,} bases : {rate / 1e6:8.2f} M samples/s '
+              f'({rate * len(SENSOR_KEYS) / 1e6:.1f} M values/s)')
+
+    print()
+    print('=== Fleet (10,000 instances, 1 simulated hour) ===')
+    for simulate in (False, True):
+        rate = fleet_rate(10_000, 3600, simulate)
+        print(f'{"simulate" if simulate else "uniform":<10}: {rate / 1e6:8.2f} M samples/s')
+
+    print()
+    simulated = series(days)
+    describe('SensorSimulator', simulated)
+    describe('DummySensor.generate (uniform)',
+             DummySensor().generate(simulated.shape[1], seed=0))
+
+
+if __name__ == '__main__':
+    args = [int(arg) for arg in sys.argv[1:3]]
+    main(*args)
@@ -0,0 +1,148 @@
+"""
+DummySensor 스냅샷 경합 벤치마크
+
+쓰기 스레드 1개가 set_env()를 계속 부르는 동안 읽기 스레드 n개가 get_env() 결과를
+채널별로 읽어(버스/이력 기록과 같은 방식) 한 회차의 값인지 검사한다.
+쓰기 값은 회차 번호라서 채널 값이 서로 다르면 찢어진(torn) 읽기다.
+- in-place: 이전 DummySensor - env_values를 채널 하나씩 고쳐 쓴다
+- lock: 쓰기/읽기 모두 threading.Lock (읽기는 잠금 안에서 복사)
+- swap: 현재 DummySensor - 새 딕셔너리를 다 채운 뒤 참조 1번으로 교체 (잠금 없음)
+경합을 드러내려고 실행 중에는 GIL 전환 간격을 짧게 줄인다 (sys.setswitchinterval).
+
+실행: python -m benchmarks.bench_sensor_snapshot [구성당 초]
+"""
+
+import sys
+import threading
+import time
+
+from mars_mission_computer import SENSOR_KEYS, DummySensor
+
+
+class InPlaceSensor:
+    """ 이전 방식: 같은 딕셔너리를 채널 하나씩 고친다 """
+
+    def __init__(self):
+        self.generation = 0
+        self.env_values = dict.fromkeys(SENSOR_KEYS, 0)
+
+    def set_env(self):
+        self.generation += 1
+        for key in SENSOR_KEYS:
+            self.env_values[key] = self.generation
+
+    def get_env(self):
+        return self.env_values
+
+
+class LockedSensor(InPlaceSensor):
+    """ 잠금: 쓰는 동안 읽기를 막고, 읽기는 잠금 안에서 복사본을 만든다 """
+
+    def __init__(self):
+        super().__init__()
+        self.lock = threading.Lock()
+
+    def set_env(self):
+        with self.lock:
+            super().set_env()
+
+    def get_env(self):
+        with self.lock:
+            return dict(self.env_values)
+
+
+class SwapSensor(InPlaceSensor):
+    """ DummySensor.set_env()와 같은 방식: 새 딕셔너리를 만들어 참조를 교체 """
+
+    def set_env(self):
+        self.generation += 1
+        self.env_values = dict.fromkeys(SENSOR_KEYS, self.generation)
+
+
+STRATEGIES = (('in-place', InPlaceSensor), ('lock', LockedSensor), ('swap', SwapSensor))
+
+
+def contend(sensor, readers, seconds):
+    """ (초당 읽기 수, 초당 쓰기 수, 찢어진 읽기 수) """
+    stop = threading.Event()
+    reads = [0] * readers
+    torn = [0] * readers
+    writes = [0]
+
+    def write():
+        set_env = sensor.set_env
+        count = 0
+        while not stop.is_set():
+            set_env()
+            count += 1
+        writes[0] = count
+
+    def read(slot):
+        get_env = sensor.get_env
+        count = bad = 0
+        while not stop.is_set():
+            snapshot = get_env()
+            values = [snapshot[key] for key in SENSOR_KEYS]
+            if values.count(values[0]) != len(values):
+                bad += 1
+            count += 1
+        reads[slot] = count
+        torn[slot] = bad
+
+    threads = [threading.Thread(target=write)]
+    threads += [threading.Thread(target=read, args=(slot,)) for slot in range(readers)]
+    began = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    time.sleep(seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    # 스레드가 많으면 메인 스레드가 GIL을 늦게 받으므로 실제 경과 시간으로 나눈다
+    elapsed = time.perf_counter() - began
+    return sum(reads) / elapsed, writes[0] / elapsed, sum(torn)
+
+
+def main(seconds=1.0):
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-5)
+    try:
+        print(f'{"strategy":<9} {"readers":>7} {"reads/s":>12} {"writes/s":>12} {"torn":>8}')
+        for readers in (1, 4, 16):
+            for label, factory in STRATEGIES:
+                read_rate, write_rate, torn = contend(factory(), readers, seconds)
+                print(f'{label:<9} {readers:>7} {read_rate:>12,.0f} {write_rate:>12,.0f} '
+                      f'{torn:>8,}')
+
+        # 실제 DummySensor: 같은 스냅샷을 두 번 읽어 그 사이에 바뀌지 않았는지 확인
+        sensor = DummySensor()
+        sensor.set_env()
+        stop = threading.Event()
+        changed = [0]
+
+        def write():
+            while not stop.is_set():
+                sensor.set_env()
+
+        def read():
+            while not stop.is_set():
+                snapshot = sensor.get_env()
+                first = [snapshot[key] for key in SENSOR_KEYS]
+                if first != [snapshot[key] for key in SENSOR_KEYS]:
+                    changed[0] += 1
+
+        threads = [threading.Thread(target=write)] + [threading.Thread(target=read)
+                                                      for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        time.sleep(seconds)
+        stop.set()
+        for thread in threads:
+            thread.join()
+        print(f'DummySensor snapshot changed while being read: {changed[0]} times')
+    finally:
+        sys.setswitchinterval(interval)
+
+
+if __name__ == '__main__':
+    main(float(sys.argv[1]) if len(sys.argv) > 1 else 1.0)
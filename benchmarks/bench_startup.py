@@ -0,0 +1,135 @@
+"""
+시작 비용 벤치마크
+
+(1) -X importtime: 진입점 모듈 import 시간과 import 직후 불러온 무거운 모듈
+(2) 첫 샘플까지의 시간: 인터프리터를 새로 띄워 실행 방식을 시작한 순간부터
+    모든 수집 프로세스(또는 스레드 실행)가 첫 레코드를 낼 때까지의 벽시계 시간
+    - 스레드 실행 (run_threads / run_multithread)
+    - 멀티프로세스 실행: 기본(fork), fast_start(fork 템플릿), spawn, fast_start(forkserver)
+레코드는 FirstSampleSink가 (시각, pid)를 표준 출력 fd에 바로 써서 묶음 출력 지연은 빠진다.
+
+실행: python -m benchmarks.bench_startup [반복 횟수]
+"""
+
+import os
+import sys
+import time
+
+# 벤치마크 자식 프로세스도 이 모듈을 import하므로 subprocess/statistics 등은 main()에서 불러온다
+PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HEAVY_MODULES = ('numpy', 'psutil', 'platform', 'json', 'multiprocessing', 'asyncio')
+
+
+class FirstSampleSink:
+    """ 레코드마다 '벽시계 시각 pid' 한 줄을 fd 1에 바로 쓴다 (피클링 가능 - spawn 대비) """
+
+    def write(self, text):
+        os.write(1, f'{time.time():.6f} {os.getpid()}\n'.encode('ascii'))
+        return True
+
+
+# (이름, 실행 코드, 첫 샘플을 기다릴 프로세스 수)
+_SINK = 'from benchmarks.bench_startup import FirstSampleSink as S; '
+SCENARIOS = (
+    ('mars threads', _SINK + 'import mars_mission_computer as m; m.run_threads(sink=S())', 1),
+    ('z34er0 threads',
+     _SINK + 'import mars_mission_computerz34er0 as m; m.run_multithread(sink=S())', 1),
+    ('mars processes fork',
+     _SINK + 'import mars_mission_computer as m; m.run_processes(sink=S())', 3),
+    ('mars processes fast fork',
+     _SINK + 'import mars_mission_computer as m; m.run_processes(sink=S(), fast_start=True)', 3),
+    ('mars processes spawn',
+     _SINK + "import mars_mission_computer as m; m.run_processes(sink=S(), start_method='spawn')",
+     3),
+    ('mars processes fast forkserver',
+     _SINK + 'import mars_mission_computer as m; '
+     "m.run_processes(sink=S(), fast_start=True, start_method='forkserver')", 3),
+    ('z34er0 processes fork',
+     _SINK + 'import mars_mission_computerz34er0 as m; m.run_multiprocess(sink=S())', 3),
+    ('z34er0 processes fast fork',
+     _SINK + 'import mars_mission_computerz34er0 as m; '
+     'm.run_multiprocess(sink=S(), fast_start=True)', 3),
+    ('z34er0 processes spawn',
+     _SINK + 'import mars_mission_computerz34er0 as m; '
+     "m.run_multiprocess(sink=S(), start_method='spawn')", 3),
+    ('z34er0 processes fast forkserver',
+     _SINK + 'import mars_mission_computerz34er0 as m; '
+     "m.run_multiprocess(sink=S(), fast_start=True, start_method='forkserver')", 3),
+)
+
+
+def import_time(module):
+    """ (누적 import 시간 ms, import 직후 sys.modules에 있는 무거운 모듈 목록) """
+    import subprocess
+    code = (f'import sys, {module}; '
+            f'print(",".join(m for m in {HEAVY_MODULES!r} if m in sys.modules))')
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], cwd=PACKAGE_DIR,
+                            capture_output=True, text=True, check=True)
+    total_us = 0
+    for line in result.stderr.splitlines():
+        parts = line.split('|')
+        if len(parts) == 3 and parts[2].strip() == module:
+            total_us = int(parts[1])
+    return total_us / 1000, result.stdout.strip() or '-'
+
+
+def time_to_first_sample(code, processes, timeout=15.0):
+    """ 실행 시작부터 (첫 프로세스, 모든 프로세스)의 첫 레코드까지 걸린 시간 (ms) """
+    import signal
+    import subprocess
+    import threading
+    launched = time.time()
+    proc = subprocess.Popen([sys.executable, '-c', code], cwd=PACKAGE_DIR,
+                            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                            start_new_session=True)
+
+    def kill():
+        try:
+            os.killpg(proc.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+
+    watchdog = threading.Timer(timeout, kill)
+    watchdog.start()
+    first = {}
+    try:
+        for line in proc.stdout:
+            fields = line.split()
+            if len(fields) != 2 or not fields[1].isdigit():
+                continue  # 실행 방식 안내 문구 등
+            first.setdefault(fields[1], float(fields[0]))
+            if len(first) >= processes:
+                break
+    finally:
+        watchdog.cancel()
+        kill()
+        proc.wait()
+    if len(first) < processes:
+        return None
+    stamps = sorted(first.values())
+    return (stamps[0] - launched) * 1000, (stamps[-1] - launched) * 1000
+
+
+def main(repeats=5):
+    import statistics
+    print('=== -X importtime ===')
+    for module in ('mars_mission_computer', 'mars_mission_computerz34er0', 'Detail'):
+        ms, heavy = import_time(module)
+        print(f'{module:<30} {ms:8.1f} ms  heavy modules: {heavy}')
+
+    print()
+    print(f'=== time to first sample (median of {repeats}) ===')
+    print(f'{"scenario":<34} {"first ms":>10} {"all ms":>10}')
+    for name, code, processes in SCENARIOS:
+        runs = [time_to_first_sample(code, processes) for _ in range(repeats)]
+        runs = [run for run in runs if run is not None]
+        if not runs:
+            print(f'{name:<34} {"timeout":>10}')
+            continue
+        first = statistics.median(run[0] for run in runs)
+        every = statistics.median(run[1] for run in runs)
+        print(f'{name:<34} {first:10.1f} {every:10.1f}')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
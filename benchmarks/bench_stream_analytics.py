@@ -0,0 +1,63 @@
+"""
+스트리밍 이상 감지 벤치마크
+
+DummySensor.generate()로 만든 센서 샘플을 StreamAnalytics에
+(1) 인스턴스 묶음 단위 (Fleet처럼 한 주기 위상의 인스턴스를 한 번에)
+(2) 샘플 1개씩 (MissionComputer._publish()처럼)
+넣어 초당 샘플 수를 재고, 인스턴스당 메모리가 윈도 크기로 고정되는지 확인한다.
+
+실행: python -m benchmarks.bench_stream_analytics [인스턴스 수] [인스턴스당 샘플 수]
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from mars_mission_computer import ANALYTICS_SPECS, SENSOR_KEYS, DummySensor
+from stream_analytics import StreamAnalytics
+
+
+def bench_batched(instances, samples, batch):
+    analytics = StreamAnalytics({'sensor': ANALYTICS_SPECS['sensor']})
+    data = DummySensor().generate(batch * 64, seed=0).T.copy()
+    ids = np.arange(1, instances + 1)
+    start = time.perf_counter()
+    offset = 0
+    for tick in range(samples):
+        for first in range(0, instances, batch):
+            rows = ids[first:first + batch]
+            values = data[offset:offset + len(rows)]
+            offset = (offset + len(rows)) % (len(data) - batch)
+            analytics.update('sensor', rows, values, tick * 5.0)
+    wall = time.perf_counter() - start
+    return analytics, instances * samples / wall
+
+
+def bench_single(count):
+    analytics = StreamAnalytics({'sensor': ANALYTICS_SPECS['sensor']})
+    sensor = DummySensor()
+    records = []
+    for _ in range(256):
+        sensor.set_env()
+        records.append(dict(sensor.get_env()))
+    start = time.perf_counter()
+    for i in range(count):
+        analytics.observe('sensor', 1, records[i % len(records)], i * 5.0)
+    return (time.perf_counter() - start) / count * 1e6
+
+
+def main(instances=10_000, samples=200):
+    analytics, rate = bench_batched(instances, samples, batch=instances // 5 or 1)
+    detector = analytics.detectors['sensor']
+    print(f'batched : {rate:14,.0f} samples/s ({instances:,} instances x {samples} ticks, '
+          f'{len(SENSOR_KEYS)} channels)')
+    print(f'alerts  : {len(analytics.alerts):,} (최근 {analytics.max_alerts}건 보관)')
+    print(f'memory  : {detector.nbytes / instances:,.0f} B/instance '
+          f'(window={detector.window}, buckets={detector.buckets}, 샘플 수와 무관)')
+    print(f'single  : {bench_single(20_000):10.2f} us/sample (observe 1회)')
+
+
+if __name__ == '__main__':
+    args = [int(arg) for arg in sys.argv[1:3]]
+    main(*args)
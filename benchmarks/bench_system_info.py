@@ -0,0 +1,34 @@
+"""
+시스템 정보 조회 캐시 벤치마크
+
+매번 platform/psutil을 조회하는 경우와 SystemInfoProvider 캐시를 쓰는 경우의
+1회 호출 비용을 비교한다.
+
+실행: python -m benchmarks.bench_system_info [반복 횟수]
+"""
+
+import sys
+import time
+
+from system_info import SystemInfoProvider, query_system_info
+
+
+def per_call_us(func, n):
+    start = time.perf_counter()
+    for _ in range(n):
+        func()
+    return (time.perf_counter() - start) / n * 1e6
+
+
+def main(n=2_000):
+    provider = SystemInfoProvider()
+    provider.get()  # 첫 조회는 캐시 채우기
+    uncached = per_call_us(query_system_info, n)
+    cached = per_call_us(provider.get, n * 100)
+    print(f'query_system_info()    : {uncached:10.2f} us/call')
+    print(f'SystemInfoProvider.get : {cached:10.3f} us/call')
+    print(f'speedup                : {uncached / cached:,.0f}x')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2_000)
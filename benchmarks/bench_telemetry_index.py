@@ -0,0 +1,85 @@
+"""
+텔레메트리 로그 시간 인덱스 벤치마크
+
+DummySensor.generate()로 만든 수백만 개 샘플을 TelemetryLog에 기록한 뒤,
+특정 인스턴스/채널/시간 구간 질의를 전체 스캔과 인덱스 질의로 비교한다.
+
+실행: python -m benchmarks.bench_telemetry_index [인스턴스 수] [인스턴스당 샘플 수]
+"""
+
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from mars_mission_computer import RECORD_SCHEMAS, SENSOR_KEYS, DummySensor
+from telemetry_index import TelemetryIndex
+from telemetry_log import TelemetryLog, TelemetryLogReader
+
+
+def write_dataset(directory, instances, samples, period=5.0):
+    """ 5초 주기로 instances개 인스턴스가 번갈아 기록한 로그를 만든다 """
+    sensor = DummySensor()
+    block = sensor.generate(instances * samples, seed=0).T
+    timestamps = 1_700_000_000.0 + np.repeat(np.arange(samples) * period, instances)
+    ids = np.tile(np.arange(1, instances + 1, dtype=np.uint32), samples)
+    with TelemetryLog(directory, {'sensor': RECORD_SCHEMAS['sensor']},
+                      fsync_batch=1 << 30) as log:
+        log.writers['sensor'].append_many(timestamps, ids, block)
+    return timestamps[0], timestamps[-1]
+
+
+def full_scan(directory, instance_id, column, start_time, end_time):
+    values = []
+    for _, records in TelemetryLogReader(directory).iter_blocks('sensor'):
+        mask = ((records['instance_id'] == instance_id)
+                & (records['timestamp'] >= start_time)
+                & (records['timestamp'] <= end_time))
+        values.append(records['values'][mask, column])
+    values = np.concatenate(values)
+    return {'count': len(values), 'mean': float(values.mean())}
+
+
+def main(instances=100, samples=30_000):
+    channel = 'mars_base_internal_co2'
+    column = SENSOR_KEYS.index(channel)
+    with tempfile.TemporaryDirectory() as directory:
+        start = time.perf_counter()
+        first, last = write_dataset(directory, instances, samples)
+        print(f'dataset : {instances * samples:,} samples, written in {time.perf_counter() - start:.2f}s')
+
+        # 전체 기간의 가운데 10% 구간, Process-3에 해당하는 인스턴스 3
+        span = last - first
+        t1 = first + span * 0.45
+        t2 = first + span * 0.55
+
+        start = time.perf_counter()
+        scan = full_scan(directory, 3, column, t1, t2)
+        scan_sec = time.perf_counter() - start
+
+        index = TelemetryIndex(directory)
+        start = time.perf_counter()
+        index.build('sensor')
+        build_sec = time.perf_counter() - start
+
+        start = time.perf_counter()
+        agg = index.aggregate('sensor', 3, channel, t1, t2)
+        agg_sec = time.perf_counter() - start
+
+        start = time.perf_counter()
+        _, values = index.select('sensor', 3, channel, t1, t2)
+        select_sec = time.perf_counter() - start
+
+        index.close()
+        assert agg['count'] == scan['count'] == len(values)
+        assert abs(agg['mean'] - scan['mean']) < 1e-9
+        print(f'full scan       : {scan_sec * 1000:9.2f} ms ({scan["count"]} samples)')
+        print(f'index build     : {build_sec * 1000:9.2f} ms (1회)')
+        print(f'index aggregate : {agg_sec * 1000:9.2f} ms')
+        print(f'index select    : {select_sec * 1000:9.2f} ms')
+
+
+if __name__ == '__main__':
+    args = [int(arg) for arg in sys.argv[1:3]]
+    main(*args)
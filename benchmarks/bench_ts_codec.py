@@ -0,0 +1,63 @@
+"""
+시계열 압축 코덱 벤치마크
+
+DummySensor.generate()로 만든 5초 주기 센서 샘플을 ts_codec 블록으로 압축하고
+원시 float64 열 저장 / SensorHistory(float32) / 바이너리 레코드(telemetry_record.py)
+대비 압축률과 부호화/복호화 처리량을 잰다.
+
+실행: python -m benchmarks.bench_ts_codec [샘플 수] [블록 크기]
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from mars_mission_computer import SENSOR_CHANNELS, SENSOR_RECORD, DummySensor
+from ts_codec import decode_block, encode_block
+
+
+def timed(func, repeat=5):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+
+def main(samples=1_000_000, block_size=4096):
+    values = DummySensor().generate(samples, seed=0)
+    # 실제 수집처럼 약간의 지터가 있는 5초 주기 (1ms 단위)
+    jitter = np.random.default_rng(1).integers(-2, 3, samples) / 1000
+    timestamps = 1_700_000_000.0 + np.arange(samples) * 5.0 + jitter
+    digits = [channel[3] for channel in SENSOR_CHANNELS]
+    starts = range(0, samples, block_size)
+
+    def encode_all(block_values):
+        return [encode_block(timestamps[i:i + block_size], block_values[:, i:i + block_size],
+                             digits=digits) for i in starts]
+
+    for label, block_values in (('float64', values), ('float32', values.astype(np.float32))):
+        blocks, encode_sec = timed(lambda: encode_all(block_values))
+        decoded, decode_sec = timed(lambda: [decode_block(block) for block in blocks])
+        restored = np.concatenate([v for _, v in decoded], axis=1)
+        restored_ts = np.concatenate([t for t, _ in decoded])
+        assert np.array_equal(restored, block_values)
+        assert np.allclose(restored_ts, timestamps, rtol=0, atol=5e-4)
+        size = sum(len(block) for block in blocks)
+        raw = block_values.nbytes + timestamps.nbytes
+        print(f'--- {label} 값, 블록 {block_size}개 샘플 ---')
+        print(f'compressed : {size / samples:8.2f} B/sample ({size:,} bytes)')
+        print(f'ratio      : {raw / size:8.2f}x vs 열 저장 ({raw / samples:.0f} B/sample), '
+              f'{SENSOR_RECORD.size * samples / size:.2f}x vs 바이너리 레코드 '
+              f'({SENSOR_RECORD.size} B/sample)')
+        print(f'encode     : {samples / encode_sec / 1e6:8.2f} M samples/s '
+              f'({raw / encode_sec / 2 ** 20:,.0f} MB/s 원본 기준)')
+        print(f'decode     : {samples / decode_sec / 1e6:8.2f} M samples/s '
+              f'({raw / decode_sec / 2 ** 20:,.0f} MB/s 원본 기준)')
+
+
+if __name__ == '__main__':
+    args = [int(arg) for arg in sys.argv[1:3]]
+    main(*args)
@@ -0,0 +1,209 @@
+"""
+MissionComputer 수집기/실행 방식 벤치마크 하니스
+
+- 수집기: get_mission_computer_info / get_mission_computer_load / get_sensor_data의
+  1회 실행(report_*)을 인스턴스 N개에 대해 반복 호출
+- 실행 방식: run_threads / run_processes (mars_mission_computer.py),
+  run_multithread / run_multiprocess (mars_mission_computerz34er0.py)를
+  VirtualSleep 시계로 대기 없이 cycles회만 돌리고 종료
+- 인스턴스 수를 1부터 N까지 늘려 가며 초당 샘플 수, 샘플당 지연 백분위수,
+  RSS, 인스턴스당 CPU 시간을 측정하고 결과를 JSON으로 저장
+
+실행: python -m benchmarks.harness --instances 1 2 4 --cycles 50 --output bench.json
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import queue
+import threading
+import time
+
+import numpy as np
+import psutil
+
+import mars_mission_computer
+import mars_mission_computerz34er0
+from output_sink import NullSink
+from sim_clock import RealClock
+
+
+# ----------------------------- VirtualSleep 클래스 -----------------------------
+class VirtualSleep(RealClock):
+    """
+    수집 루프에 주입하는 시계 - 시각은 실제 시간, sleep()만 가짜
+    - 실제로 잠들지 않고, 직전 sleep 반환부터 이번 호출까지(= 수집 1회) 시간을 기록
+    - 스레드마다 cycles회 호출되면 SystemExit를 일으켜 루프/스레드/프로세스를 끝낸다
+      (threading은 SystemExit를 조용히 무시하고, 프로세스는 정상 종료한다)
+    - results 큐가 있으면 종료 직전 이 프로세스의 측정값을 큐에 넣는다 (프로세스 모드)
+    """
+
+    def __init__(self, cycles, results=None):
+        self.cycles = cycles
+        self.results = results
+        self._state = {}
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_state'] = {}
+        return state
+
+    def sleep(self, seconds):
+        now = time.perf_counter()
+        state = self._state.setdefault(threading.get_ident(), {'last': None, 'latencies': []})
+        if state['last'] is not None:
+            state['latencies'].append(now - state['last'])
+        if len(state['latencies']) >= self.cycles:
+            if self.results is not None:
+                self.results.put({
+                    'latencies': state['latencies'],
+                    'cpu_s': time.process_time(),
+                    'rss': psutil.Process().memory_info().rss,
+                })
+            raise SystemExit
+        state['last'] = time.perf_counter()
+
+    def latencies(self):
+        return [value for state in self._state.values() for value in state['latencies']]
+
+
+# ----------------------------- 측정 도우미 -----------------------------
+def summarize(name, mode, instances, latencies, wall_s, cpu_s, rss):
+    latencies = np.asarray(latencies, dtype=np.float64)
+    samples = len(latencies)
+    return {
+        'name': name,
+        'mode': mode,
+        'instances': instances,
+        'samples': samples,
+        'wall_s': round(wall_s, 6),
+        'samples_per_s': round(samples / wall_s, 1) if wall_s > 0 else None,
+        'latency_us': {
+            f'p{q}': round(float(np.percentile(latencies, q)) * 1e6, 2) if samples else None
+            for q in (50, 90, 99)
+        } | {'max': round(float(latencies.max()) * 1e6, 2) if samples else None},
+        'rss_mb': round(rss / 2 ** 20, 2),
+        'cpu_s_per_instance': round(cpu_s / instances, 6),
+    }
+
+
+def _self_usage():
+    return time.process_time(), psutil.Process().memory_info().rss
+
+
+# ----------------------------- 수집기 벤치마크 -----------------------------
+def bench_collectors(instances, cycles):
+    results = []
+    computers = [mars_mission_computer.MissionComputer(f'Bench-{i}', instance_id=i, sink=NullSink())
+                 for i in range(1, instances + 1)]
+    for collector, method in (('get_mission_computer_info', 'report_info'),
+                              ('get_mission_computer_load', 'report_load'),
+                              ('get_sensor_data', 'report_sensor')):
+        latencies = []
+        cpu_before, _ = _self_usage()
+        start = time.perf_counter()
+        for _ in range(cycles):
+            for computer in computers:
+                t0 = time.perf_counter()
+                getattr(computer, method)()
+                latencies.append(time.perf_counter() - t0)
+        wall = time.perf_counter() - start
+        cpu_after, rss = _self_usage()
+        results.append(summarize(collector, 'collector', instances, latencies,
+                                 wall, cpu_after - cpu_before, rss))
+    return results
+
+
+# ----------------------------- 실행 방식 벤치마크 -----------------------------
+def bench_threaded_runner(name, runner, instances, cycles):
+    """ runner(clock=..., sink=...)를 스레드 instances개로 동시에 실행 """
+    clock = VirtualSleep(cycles)
+    cpu_before, _ = _self_usage()
+    start = time.perf_counter()
+    threads = [threading.Thread(target=runner, kwargs={'clock': clock, 'sink': NullSink()})
+               for _ in range(instances)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    wall = time.perf_counter() - start
+    cpu_after, rss = _self_usage()
+    return summarize(name, 'threads', instances, clock.latencies(), wall, cpu_after - cpu_before, rss)
+
+
+def bench_process_runner(name, runner, instances, cycles):
+    """ runner(clock=..., sink=...)를 instances번 동시에 실행 (각각 프로세스 3개) """
+    results = multiprocessing.Queue()
+    clock = VirtualSleep(cycles, results)
+    start = time.perf_counter()
+    threads = [threading.Thread(target=runner, kwargs={'clock': clock, 'sink': NullSink()})
+               for _ in range(instances)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    wall = time.perf_counter() - start
+    latencies = []
+    cpu = 0.0
+    rss = []
+    while True:
+        try:
+            item = results.get(timeout=1.0)
+        except queue.Empty:
+            break
+        latencies.extend(item['latencies'])
+        cpu += item['cpu_s']
+        rss.append(item['rss'])
+    # 프로세스 모드의 RSS는 자식 프로세스 평균
+    return summarize(name, 'processes', instances, latencies, wall, cpu,
+                     sum(rss) / len(rss) if rss else 0)
+
+
+def run_all(instance_counts, cycles):
+    results = []
+    for instances in instance_counts:
+        results.extend(bench_collectors(instances, cycles))
+        results.append(bench_threaded_runner(
+            'run_threads', mars_mission_computer.run_threads, instances, cycles))
+        results.append(bench_threaded_runner(
+            'run_multithread', mars_mission_computerz34er0.run_multithread, instances, cycles))
+        results.append(bench_process_runner(
+            'run_processes', mars_mission_computer.run_processes, instances, cycles))
+        results.append(bench_process_runner(
+            'run_multiprocess', mars_mission_computerz34er0.run_multiprocess, instances, cycles))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='MissionComputer 벤치마크 하니스')
+    parser.add_argument('--instances', type=int, nargs='+', default=[1, 2, 4, 8])
+    parser.add_argument('--cycles', type=int, default=50, help='수집기/루프당 반복 횟수')
+    parser.add_argument('--output', default='bench_results.json', help='결과 JSON 경로')
+    args = parser.parse_args()
+
+    results = run_all(args.instances, args.cycles)
+    report = {
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'cycles': args.cycles,
+        'results': results,
+    }
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+
+    print(f'{"name":<28} {"mode":<10} {"N":>3} {"samples/s":>12} {"p50 us":>9} {"p99 us":>9} '
+          f'{"rss MB":>8} {"cpu s/inst":>11}')
+    for row in results:
+        print(f'{row["name"]:<28} {row["mode"]:<10} {row["instances"]:>3} '
+              f'{row["samples_per_s"] or 0:>12,.0f} {row["latency_us"]["p50"] or 0:>9.1f} '
+              f'{row["latency_us"]["p99"] or 0:>9.1f} {row["rss_mb"]:>8.1f} '
+              f'{row["cpu_s_per_instance"]:>11.4f}')
+    print(f'결과 저장: {args.output}')
+
+
+if __name__ == '__main__':
+    main()
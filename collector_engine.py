@@ -0,0 +1,405 @@
+# ----------------------------- 모듈 임포트 -----------------------------
+import functools
+import os
+import random
+
+# psutil/json은 쓰는 플러그인/출력 형식에서 처음 쓸 때 import한다 (시작 비용 절감)
+from instrumentation import NULL_INSTRUMENTATION
+from load_sampler import CpuLoadSampler
+from output_sink import default_writer
+from sim_clock import REAL_CLOCK
+from system_info import shared_provider
+from telemetry_record import RecordSchema, RecordStreamWriter
+
+
+@functools.lru_cache(maxsize=None)
+def _record_schema(kind, channels):
+    """ 플러그인의 바이너리 레코드 형식 (프로세스 안에서 공유 - RecordSchema는 피클링할 수 없다) """
+    return RecordSchema(kind, channels)
+
+
+# ----------------------------- MetricSource 클래스 -----------------------------
+class MetricSource:
+    """
+    수집 플러그인 기반 클래스 - 수집 값 1건을 만드는 read()만 구현하면 된다
+    - name: 수집기 이름 (버스/로그/분석/요약/메트릭의 키)
+    - period: 수집 주기 (초), blocking: 실행기 스레드에서 돌려야 하는지 여부
+    - schema: 숫자 채널 이름 목록 (버스/바이너리 레코드 필드 순서)
+    - binary: output_format='binary'일 때 바이너리 레코드로 내보낼지 여부
+    - title/display/error_label: 텍스트 출력 제목, 채널별 서식, 에러 메시지 앞말
+    - modules/prepare(): 첫 샘플 전에 필요한 모듈과 준비 작업 (빠른 시작에서 fork 전에 실행)
+    """
+
+    name = None
+    period = None
+    blocking = False
+    binary = True
+    schema = ()
+    title = None
+    display = {}
+    error_label = '데이터 수집'
+    modules = ()
+
+    def read(self, now):
+        """ 수집 값 1건 (dict) 반환 - None이면 이번 회차는 출력하지 않는다 """
+        raise NotImplementedError
+
+    def prepare(self):
+        """ 첫 read() 전에 해 둘 수 있는 준비 (캐시 채우기 등) """
+
+    @property
+    def record_schema(self):
+        return _record_schema(self.name, tuple(self.schema))
+
+
+class SystemInfoSource(MetricSource):
+    """
+    platform/psutil 시스템 기본 정보 (system_info.py의 캐시에서 읽는다)
+    - changes_only=True면 이미 출력한 정보와 같을 때 None을 돌려 출력을 생략
+    """
+
+    name = 'info'
+    blocking = True  # 캐시가 비어 있으면 platform/psutil을 조회한다
+    binary = False
+    schema = ('CPU_코어_수', '메모리_크기_GB')
+    title = 'Mission Computer Info'
+    error_label = '시스템 정보 조회'
+    modules = ('platform', 'psutil')
+
+    def __init__(self, period, provider=shared_provider, changes_only=False):
+        self.period = period
+        self.provider = provider
+        self.changes_only = changes_only
+        self._version = None
+
+    def prepare(self):
+        self.provider.get()
+
+    def read(self, now):
+        static_info = self.provider.get()
+        if self.changes_only and self.provider.version == self._version:
+            return None
+        self._version = self.provider.version
+        return static_info
+
+
+class FixedInfoSource(MetricSource):
+    """ 고정된 하드웨어 정보 문자열 (숫자 채널 없음 - 버스에는 하트비트만 실린다) """
+
+    name = 'info'
+    binary = False
+    title = 'Mission Computer Info'
+    error_label = '시스템 정보 조회'
+
+    def __init__(self, fields, period):
+        self.fields = dict(fields)
+        self.period = period
+
+    def read(self, now):
+        return self.fields
+
+
+class PsutilLoadSource(MetricSource):
+    """ 실제 CPU/메모리 사용률 (CpuLoadSampler로 블로킹 없이 측정) """
+
+    name = 'load'
+    schema = ('CPU_실시간_사용량_%', '메모리_실시간_사용량_%')
+    title = 'System Load'
+    error_label = '시스템 부하 조회'
+    modules = ('psutil',)
+
+    def __init__(self, period, sampler=None):
+        self.period = period
+        self.sampler = sampler if sampler is not None else CpuLoadSampler()
+
+    def read(self, now):
+        import psutil
+        cpu = self.sampler.cpu_percent()
+        if cpu is None:
+            return None  # 측정 구간이 아직 없음 - 0%로 내보내지 않고 이번 회차를 건너뛴다
+        return {
+            'CPU_실시간_사용량_%': cpu,
+            '메모리_실시간_사용량_%': psutil.virtual_memory().percent
+        }
+
+
+class SimulatedSource(MetricSource):
+    """
+    채널마다 균등 분포 난수를 반올림한 시뮬레이션 값
+    - channels: (채널 이름, 최솟값, 최댓값, 반올림 자릿수) 목록
+    - simulator(sensor_sim.SimulatedSensor 등 read(now)가 있는 객체)를 주면
+      난수 대신 그 값을 읽는다 (상관된 랜덤 워크/일주기 시뮬레이션)
+    """
+
+    def __init__(self, name, channels, period, title=None, display=None, error_label=None,
+                 simulator=None):
+        self.name = name
+        self.simulator = simulator
+        self.channels = tuple(channels)
+        self.schema = tuple(channel[0] for channel in self.channels)
+        self.period = period
+        self.title = title
+        self.display = display or {}
+        if error_label is not None:
+            self.error_label = error_label
+
+    def read(self, now):
+        if self.simulator is not None:
+            return self.simulator.read(now)
+        uniform = random.uniform
+        return {key: round(uniform(low, high), ndigits)
+                for key, low, high, ndigits in self.channels}
+
+
+class DummySensorSource(MetricSource):
+    """
+    DummySensor 환경 값 (set_env() 후 get_env())
+    - history(SensorHistory)를 주면 읽은 값을 이력 링 버퍼에도 쌓는다
+    """
+
+    name = 'sensor'
+    title = 'Sensor Data'
+    error_label = '센서 데이터 조회'
+
+    def __init__(self, sensor, period, history=None):
+        self.sensor = sensor
+        self.period = period
+        self.history = history
+        self.schema = tuple(sensor.get_env())
+        if history is not None:
+            self.modules = ('sensor_history',)
+
+    def read(self, now):
+        self.sensor.set_env()
+        values = self.sensor.get_env()
+        if self.history is not None:
+            self.history.append(values, now)
+        return values
+
+
+# ----------------------------- 출력 형식 -----------------------------
+class JsonFormat:
+    """ {name_key: 인스턴스 이름, 수집 값...}을 들여쓰기 JSON으로 """
+
+    modules = ('json',)
+
+    def __init__(self, name_key='Instance', indent=4):
+        self.name_key = name_key
+        self.indent = indent
+
+    def format(self, engine, source, record, now):
+        import json
+        result = {self.name_key: engine.name}
+        result.update(record)
+        return json.dumps(result, indent=self.indent, ensure_ascii=False)
+
+
+class TextFormat:
+    """
+    사람이 읽는 여러 줄 텍스트
+    - '[이름] 제목:' 다음 ID, 채널별 값 (source.display 서식), 시각, 구분선
+    """
+
+    modules = ()
+
+    def __init__(self, id_key='Computer ID', time_format='%Y-%m-%d %H:%M:%S', rule='-' * 50):
+        self.id_key = id_key
+        self.time_format = time_format
+        self.rule = rule
+
+    def format(self, engine, source, record, now):
+        display = source.display
+        lines = [f'[{engine.name}] {source.title}:', f'  {self.id_key}: {engine.instance_id}']
+        for key, value in record.items():
+            spec = display.get(key)
+            lines.append(f'  {key}: {value if spec is None else spec.format(value)}')
+        lines.append(f'  Timestamp: {engine.clock.strftime(self.time_format, now)}')
+        lines.append(self.rule)
+        return '\n'.join(lines)
+
+
+# ----------------------------- CollectorEngine 클래스 -----------------------------
+class CollectorEngine:
+    """
+    수집 플러그인(MetricSource)을 등록해 실행하는 공용 수집 엔진
+    - collect(이름): 수집 1회 - 읽기 → 버스/로그/분석/요약/메트릭 기록 → 직렬화 → 출력
+    - run_collector(이름): 주기마다 collect()를 반복하는 스레드/프로세스용 루프
+    - collector_jobs(): async/감독자/시뮬레이션 실행기용 (이름, 함수, 주기, 블로킹 여부)
+    - 각 MissionComputer 변형은 플러그인과 출력 형식만 고르는 얇은 설정이다
+    """
+
+    def __init__(self, name, instance_id=0, sources=(), formatter=None, output_format='json',
+                 sink=None, clock=REAL_CLOCK):
+        self.name = name
+        self.instance_id = instance_id  # 텔레메트리 레코드에 싣는 숫자 ID
+        self.sources = {}
+        self.formatter = formatter if formatter is not None else JsonFormat()
+        self.bus = None  # TelemetryBus가 연결되면 수집 값을 공유 메모리에도 기록
+        self.log = None  # TelemetryLog가 연결되면 수집 값을 디스크 로그에도 기록
+        self._named_log = None  # 인스턴스 이름을 알린 로그
+        self.analytics = None  # StreamAnalytics가 연결되면 수집 값의 이상을 감지해 경보 출력
+        self.rollup = None  # RollupEngine이 연결되면 수집 값을 1분/1시간/1솔 요약에 누적
+        self.metrics = None  # MetricsRegistry가 연결되면 최신 값을 HTTP 메트릭 스냅샷에 반영
+        self.changes = None  # ChangeFilter가 연결되면 불감대를 넘은 채널만 델타 레코드로 출력
+        self.instrumentation = NULL_INSTRUMENTATION  # Instrumentation을 연결하면 단계별 지연 기록
+        self.output_format = output_format  # 'binary'면 binary 플러그인은 바이너리 레코드로 출력
+        self.binary_out = None  # binary 출력 RecordStreamWriter (None이면 프로세스 공용 표준 출력)
+        self.sink = sink  # 텍스트 출력 대상 BatchingWriter (None이면 표준 출력, binary면 표준 에러)
+        self.clock = clock  # 시각/대기 제공 (sim_clock.py - 실시간, 배속, 이산 사건)
+        for source in sources:
+            self.register(source)
+
+    def register(self, source):
+        """ 수집 플러그인 등록 (이름이 겹치면 ValueError) """
+        if source.name in self.sources:
+            raise ValueError(f'이미 등록된 수집기: {source.name}')
+        if not source.period or source.period <= 0:
+            raise ValueError(f'수집 주기는 0보다 커야 합니다: {source.name}')
+        self.sources[source.name] = source
+        return source
+
+    def schemas(self):
+        """ {수집기: 숫자 채널 목록} (TelemetryBus.create()에 그대로 넘길 수 있다) """
+        return {name: source.schema for name, source in self.sources.items()}
+
+    def preload_modules(self):
+        """ 첫 샘플 전에 필요한 모듈 이름 목록 (fast_start.py가 미리 불러온다) """
+        modules = {'collector_engine', 'output_sink'}
+        if type(self).__module__ != '__main__':
+            modules.add(type(self).__module__)
+        modules.update(self.formatter.modules)
+        for source in self.sources.values():
+            modules.update(source.modules)
+        return sorted(modules)
+
+    def warm_up(self):
+        """ 플러그인 준비 - fork 전에 부모에서 부르면 자식은 채워진 캐시를 그대로 물려받는다 """
+        for source in self.sources.values():
+            source.prepare()
+
+    def collect(self, name):
+        """ 수집기 1개를 1회 실행 """
+        source = self.sources[name]
+        try:
+            timer = self.instrumentation.timer(name)
+            now = self.clock.time()
+            record = source.read(now)
+            if record is None:
+                return
+            timer.mark('acquire')
+            self._publish(name, record, now)
+            timer.mark('publish')
+            if self.changes is not None:
+                change = self.changes.update(self.name, name, record, now)
+                if change is None:
+                    return  # 불감대 안의 변화뿐 - 직렬화/출력 생략
+                if self.output_format == 'binary' and source.binary:
+                    # 고정 길이 레코드는 일부 채널만 실을 수 없으므로 바뀐 경우에만 전체를 출력
+                    encoded = self._encode_binary(source.record_schema, now, record)
+                    timer.mark('serialize')
+                    self._write_binary(source.record_schema, encoded)
+                else:
+                    text = self.changes.format(self.name, name, change, now)
+                    timer.mark('serialize')
+                    self._emit(text)
+            elif self.output_format == 'binary' and source.binary:
+                encoded = self._encode_binary(source.record_schema, now, record)
+                timer.mark('serialize')
+                self._write_binary(source.record_schema, encoded)
+            else:
+                text = self.formatter.format(self, source, record, now)
+                timer.mark('serialize')
+                self._emit(text)
+            timer.mark('emit')
+        except Exception as e:
+            self._emit(f'[{self.name}] {source.error_label} 에러: {e}')
+
+    def run_collector(self, name):
+        """ 수집기 1개를 주기마다 실행 (무한 루프) """
+        period = self.sources[name].period
+        due = self.clock.time()  # 예정 시각 (스케줄링 지연 계측용)
+        while True:
+            self.instrumentation.record_lateness(name, self.clock.time() - due)
+            self.collect(name)
+            due += period
+            self.clock.sleep(period)
+
+    def collector_jobs(self):
+        """ 스케줄러용 작업 목록: (작업 이름, 1회 실행 함수, 주기(초), 블로킹 여부) """
+        return [(name, functools.partial(self.collect, name), source.period, source.blocking)
+                for name, source in self.sources.items()]
+
+    def _publish(self, collector, record, timestamp):
+        """
+        연결된 버스/디스크 로그/이상 감지기/요약 엔진/메트릭 저장소에 수집 값 기록
+        - 대상마다 따로 예외를 잡으므로 한 대상이 실패해도 다른 대상과 출력은 계속된다
+        """
+        if self.bus is not None:
+            try:
+                self.bus.publish(collector, timestamp, self.instance_id, record)
+            except Exception as e:
+                self._publish_failed('버스', collector, e)
+        if self.log is not None:
+            try:
+                if self._named_log is not self.log:  # 이름으로 질의할 수 있게 로그에 1회 알린다
+                    self.log.name_instance(self.name, self.instance_id)
+                    self._named_log = self.log
+                self.log.append(collector, timestamp, self.instance_id, record)
+            except Exception as e:
+                self._publish_failed('디스크 로그', collector, e)
+        if self.analytics is not None:
+            try:
+                anomalies = self.analytics.observe(collector, self.instance_id, record, timestamp)
+            except Exception as e:
+                self._publish_failed('이상 감지', collector, e)
+            else:
+                for anomaly in anomalies:
+                    self._emit(f'[{self.name}] {anomaly.describe()}')
+        if self.rollup is not None:
+            try:
+                self.rollup.observe(collector, self.instance_id, record, timestamp)
+            except Exception as e:
+                self._publish_failed('요약', collector, e)
+        if self.metrics is not None:
+            try:
+                self.metrics.publish(collector, self.name, self.instance_id, record, timestamp)
+            except Exception as e:
+                self._publish_failed('메트릭', collector, e)
+
+    def _publish_failed(self, target, collector, error):
+        self._emit(f'[{self.name}] {collector} {target} 기록 에러: {error}')
+
+    def _emit(self, text):
+        """ 텍스트 레코드 1개를 출력 계층(output_sink.py)으로 보낸다 """
+        if self.sink is not None:
+            self.sink.write(text)
+        elif self.output_format == 'binary' and self.binary_out is None:
+            default_writer('stderr').write(text)  # 표준 출력의 레코드 스트림에 섞지 않는다
+        else:
+            default_writer().write(text)
+
+    def _encode_binary(self, schema, timestamp, record):
+        """ 수집 값을 고정 길이 바이너리 레코드 1개로 직렬화 """
+        return schema.encode(timestamp, self.instance_id, record)
+
+    def _write_binary(self, schema, encoded):
+        """ 직렬화한 레코드를 레코드 스트림 프레임으로 출력 """
+        out = self.binary_out if self.binary_out is not None else default_record_stream()
+        out.write_encoded(schema, encoded)
+
+
+# ----------------------------- 프로세스 공용 레코드 스트림 -----------------------------
+_default_stream = None  # (pid, RecordStreamWriter)
+
+
+def default_record_stream():
+    """
+    표준 출력으로 내보내는 프로세스 공용 RecordStreamWriter
+    - 프레임은 바이너리 BatchingWriter(default_writer('binary'))로 모아 내보낸다
+      (텍스트와 같은 묶음/역압 정책, 텍스트는 표준 에러로 가므로 섞이지 않는다)
+    - fork된 자식 프로세스는 새로 만들어 자기 스키마 프레임을 다시 쓴다 (같은 스키마는 키가 같다)
+    """
+    global _default_stream
+    if _default_stream is None or _default_stream[0] != os.getpid():
+        _default_stream = (os.getpid(), RecordStreamWriter(default_writer('binary')))
+    return _default_stream[1]
@@ -0,0 +1,167 @@
+# json은 델타 레코드를 직렬화/해석할 때 import한다 (진입점 모듈의 import 비용을 늘리지 않게)
+
+
+FULL = 'full'
+DELTA = 'delta'
+
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+# ----------------------------- Deadband 클래스 -----------------------------
+class Deadband:
+    """
+    채널 1개의 불감대 - 마지막으로 내보낸 값과의 차이가
+    max(absolute, relative * |마지막 값|)을 넘을 때만 바뀐 것으로 본다
+    - 한쪽만 NaN이면(센서 고장/복구) 바뀐 것, 둘 다 NaN이면 그대로인 것으로 본다
+    """
+
+    __slots__ = ('absolute', 'relative')
+
+    def __init__(self, absolute=0.0, relative=0.0):
+        if absolute < 0 or relative < 0:
+            raise ValueError('불감대는 0 이상이어야 합니다.')
+        self.absolute = absolute
+        self.relative = relative
+
+    def exceeded(self, old, new):
+        if new != new or old != old:  # NaN과의 차이는 어떤 비교도 거짓이므로 따로 판단
+            return (new != new) != (old != old)
+        return abs(new - old) > max(self.absolute, self.relative * abs(old))
+
+    def __repr__(self):
+        return f'Deadband(absolute={self.absolute}, relative={self.relative})'
+
+
+EXACT = Deadband()  # 불감대를 정하지 않은 숫자 채널: 값이 조금이라도 바뀌면 내보냄
+
+
+class _ChannelState:
+    """ (인스턴스, 수집기)별로 소비자 쪽이 알고 있는 값 (마지막으로 내보낸 값) """
+
+    __slots__ = ('values', 'last_full', 'seq')
+
+    def __init__(self):
+        self.values = {}
+        self.last_full = None
+        self.seq = -1
+
+
+# ----------------------------- ChangeFilter 클래스 -----------------------------
+class ChangeFilter:
+    """
+    변화 감지 출력 - 바뀐 채널만 담은 압축 델타 레코드를 내보낸다
+    - MissionComputer.changes에 연결하면 collect()가 출력 직전에 update()를 부른다
+      (버스/로그/분석/요약/메트릭에는 지금처럼 모든 샘플이 기록된다)
+    - 마지막으로 내보낸 값 대비 불감대를 넘은 채널만 델타에 싣는다
+      → 느린 드리프트도 누적되면 결국 내보내며, 복원 오차는 채널 불감대 이내
+    - 문자열 등 숫자가 아닌 값은 값이 다를 때만 싣는다
+    - 첫 샘플과 heartbeat초마다 전체 레코드(full)를 내보낸다 (중간에 붙은 소비자/유실 복구용)
+    - deadbands: {채널: Deadband}, 정하지 않은 숫자 채널은 default (기본: 정확히 같을 때만 생략)
+    """
+
+    def __init__(self, deadbands=None, heartbeat=60.0, default=EXACT):
+        self.deadbands = dict(deadbands or {})
+        self.heartbeat = heartbeat
+        self.default = default
+        self._states = {}
+        self.samples = 0
+        self.emitted = 0   # 내보낸 레코드 수 (full + delta)
+        self.fulls = 0
+
+    def update(self, instance, collector, record, timestamp):
+        """
+        샘플 1건 반영 후 내보낼 변화 반환
+        - None: 불감대 안의 변화뿐이라 내보낼 것이 없음
+        - (FULL 또는 DELTA, 순번, {채널: 값}): 순번은 (인스턴스, 수집기)마다 0부터 1씩 증가
+        """
+        self.samples += 1
+        key = (instance, collector)
+        state = self._states.get(key)
+        if state is None:
+            state = self._states[key] = _ChannelState()
+        if (state.last_full is None or
+                (self.heartbeat is not None and timestamp - state.last_full >= self.heartbeat)):
+            state.values = dict(record)
+            state.last_full = timestamp
+            state.seq += 1
+            self.emitted += 1
+            self.fulls += 1
+            return FULL, state.seq, state.values
+        known = state.values
+        deadbands = self.deadbands
+        changed = {}
+        for channel, value in record.items():
+            old = known.get(channel)
+            if _is_number(value) and _is_number(old):
+                if not deadbands.get(channel, self.default).exceeded(old, value):
+                    continue
+            elif value == old and channel in known:
+                continue
+            changed[channel] = value
+        if not changed:
+            return None
+        known.update(changed)
+        state.seq += 1
+        self.emitted += 1
+        return DELTA, state.seq, changed
+
+    def format(self, instance, collector, change, timestamp):
+        """ 변화 1건을 한 줄짜리 압축 JSON 레코드로 (DeltaReconstructor.apply()가 읽는 형식) """
+        import json
+        kind, seq, values = change
+        return json.dumps({'instance': instance, 'collector': collector, 'type': kind,
+                           'seq': seq, 'ts': timestamp, 'values': values},
+                          ensure_ascii=False, separators=(',', ':'))
+
+    def reset(self, instance=None):
+        """ 다음 샘플을 전체 레코드로 내보내게 한다 (instance=None이면 모두) """
+        for key, state in self._states.items():
+            if instance is None or key[0] == instance:
+                state.last_full = None
+
+
+# ----------------------------- DeltaReconstructor 클래스 -----------------------------
+class DeltaReconstructor:
+    """
+    ChangeFilter가 내보낸 full/delta 레코드로 (인스턴스, 수집기)별 전체 상태를 복원
+    - 전체 레코드를 받기 전이거나 순번이 건너뛰어(유실) 상태를 믿을 수 없으면
+      다음 전체 레코드(heartbeat)까지 None을 돌려준다
+    """
+
+    def __init__(self):
+        self.state = {}    # (인스턴스, 수집기) -> {채널: 값}
+        self.timestamps = {}
+        self._seq = {}
+        self.gaps = 0      # 순번이 건너뛴 횟수
+
+    def apply(self, record):
+        """
+        레코드 1개 (JSON 문자열/바이트 또는 dict) 반영
+        - 반환: (인스턴스, 수집기, 시각, 복원된 전체 상태 dict) 또는 None
+        """
+        if not isinstance(record, dict):
+            import json
+            record = json.loads(record)
+        key = (record['instance'], record['collector'])
+        seq = record['seq']
+        if record['type'] == FULL:
+            values = dict(record['values'])
+            self.state[key] = values
+        else:
+            values = self.state.get(key)
+            if values is None:
+                return None
+            if seq != self._seq[key] + 1:
+                self.gaps += 1
+                del self.state[key]
+                return None
+            values.update(record['values'])
+        self._seq[key] = seq
+        self.timestamps[key] = record['ts']
+        return key[0], key[1], record['ts'], values
+
+    def current(self, instance, collector):
+        """ 마지막으로 복원된 전체 상태 (없으면 None) """
+        return self.state.get((instance, collector))
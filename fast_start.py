@@ -0,0 +1,47 @@
+# ----------------------------- 모듈 임포트 -----------------------------
+import importlib
+
+
+# ----------------------------- 미리 불러오기 -----------------------------
+def preload_modules(templates):
+    """ 템플릿 인스턴스(CollectorEngine)들이 첫 샘플 전에 필요로 하는 모듈 이름 (중복 제거) """
+    modules = set()
+    for template in templates:
+        modules.update(template.preload_modules())
+    return sorted(modules)
+
+
+def preload(templates):
+    """
+    템플릿이 쓰는 모듈을 미리 import하고 플러그인 캐시를 채운다 (warm_up())
+    - 시스템 정보 캐시(platform.processor()는 외부 명령을 실행한다) 등이 채워지므로,
+      이후 fork된 자식 프로세스는 이 상태를 그대로 물려받아 첫 샘플을 바로 낸다
+    - 플러그인이 선언한 모듈만 불러오므로 쓰지 않는 psutil/json 등은 건드리지 않는다
+    """
+    for name in preload_modules(templates):
+        importlib.import_module(name)
+    for template in templates:
+        template.warm_up()
+
+
+def worker_context(start_method=None, templates=()):
+    """
+    빠른 시작용 multiprocessing 컨텍스트
+    - templates: 자식이 실행할 MissionComputer (또는 같은 설정의 인스턴스 1개)
+    - 'fork' (가능하면 기본): 부모에서 preload()한 뒤 fork - 자식은 import된 모듈, 채워진 캐시,
+      부모가 만들어 둔 인스턴스를 복사 없이 물려받아 다시 초기화하지 않는다
+    - 'forkserver': 서버 프로세스가 템플릿의 모듈을 한 번만 import해 두고 자식마다 그 상태에서
+      fork (부모에 스레드가 많아 fork가 위험하거나, 자식을 자주 다시 띄우는 감독자용)
+    - 'spawn': 자식마다 인터프리터를 새로 띄우므로 미리 불러오기 효과가 없다 (비교용)
+    """
+    import multiprocessing
+    methods = multiprocessing.get_all_start_methods()
+    if start_method is None:
+        start_method = 'fork' if 'fork' in methods else 'forkserver' if 'forkserver' in methods \
+            else 'spawn'
+    context = multiprocessing.get_context(start_method)
+    if start_method == 'forkserver':
+        context.set_forkserver_preload(preload_modules(templates))
+    elif start_method == 'fork':
+        preload(templates)
+    return context
@@ -0,0 +1,249 @@
+# ----------------------------- 모듈 임포트 -----------------------------
+import heapq
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import psutil
+
+from load_sampler import CpuLoadSampler
+from mars_mission_computer import (MissionComputer, RECORD_SCHEMAS, SENSOR_CHANNELS, SENSOR_KEYS,
+                                   make_simulator)
+from sim_clock import REAL_CLOCK, VirtualClock
+from system_info import shared_provider
+
+
+# 센서 채널별 범위와 반올림 배율 (SENSOR_CHANNELS를 배열로 펼친 것)
+_SENSOR_LOW = np.array([channel[1] for channel in SENSOR_CHANNELS])
+_SENSOR_HIGH = np.array([channel[2] for channel in SENSOR_CHANNELS])
+_SENSOR_SCALE = np.array([10.0 ** channel[3] for channel in SENSOR_CHANNELS])
+
+# (수집기 이름, 주기) - 힙에서 같은 시각이면 이 순서로 실행
+FLEET_JOBS = (
+    ('info', MissionComputer.INFO_PERIOD),
+    ('load', MissionComputer.LOAD_PERIOD),
+    ('sensor', MissionComputer.SENSOR_PERIOD),
+)
+_JOB_COLUMNS = {name: column for column, (name, _) in enumerate(FLEET_JOBS)}
+
+
+# ----------------------------- FleetComputer 클래스 -----------------------------
+class FleetComputer:
+    """
+    함대(Fleet) 안의 MissionComputer 1대
+    - 값은 Fleet의 공유 배열에 있고, 객체는 (fleet, 행 번호)만 가진다
+    """
+
+    __slots__ = ('fleet', 'index')
+
+    def __init__(self, fleet, index):
+        self.fleet = fleet
+        self.index = index
+
+    @property
+    def instance_id(self):
+        return int(self.fleet.instance_ids[self.index])
+
+    @property
+    def name(self):
+        return f'Fleet-{self.instance_id}'
+
+    def get_env(self):
+        """ DummySensor.get_env()와 같은 형태의 최신 센서 값 (새 딕셔너리) """
+        return dict(zip(SENSOR_KEYS, self.fleet.sensor[self.index].tolist()))
+
+    def get_load(self):
+        load = self.fleet.load[self.index].tolist()
+        return {'CPU_실시간_사용량_%': load[0], '메모리_실시간_사용량_%': load[1]}
+
+
+# ----------------------------- Fleet 클래스 -----------------------------
+class Fleet:
+    """
+    MissionComputer 수천 대를 한 프로세스에서 실행하는 함대
+    - 인스턴스 상태는 (인스턴스 수, 채널 수) 배열에 행 단위로 저장
+    - 인스턴스 i는 i % 주기 번째 초에 수집하도록 위상을 나눠 부하를 고르게 편다
+    - 같은 (수집기, 위상) 인스턴스 묶음을 한 번에 갱신하며, 힙에는 묶음만 들어간다
+      (힙 크기 = 주기 합계, 인스턴스 수와 무관)
+    - log(TelemetryLog)를 주면 묶음마다 레코드를 append_many로 기록
+    - analytics(StreamAnalytics)를 주면 묶음마다 이상 감지를 갱신 (경보는 analytics.alerts)
+    - rollup(RollupEngine)을 주면 묶음마다 1분/1시간/1솔 요약에 누적
+    - sink를 주면 MissionComputer처럼 샘플마다 JSON 레코드를 출력 (대량 실행에서는 비쌈)
+    - simulate=True면 센서 값을 균등 분포 난수 대신 상관된 시뮬레이션(sensor_sim.py)으로 생성
+      (랜덤 워크/일주기/CO2-O2 결합 - 압축, 이상 감지, 요약 부하 시험용)
+    """
+
+    def __init__(self, instance_ids, seed=None, clock=REAL_CLOCK, log=None, sink=None,
+                 analytics=None, rollup=None, simulate=False):
+        self.instance_ids = np.asarray(instance_ids, dtype=np.uint32)
+        count = len(self.instance_ids)
+        self.clock = clock
+        self.log = log
+        self.sink = sink
+        self.analytics = analytics
+        self.rollup = rollup
+        self.rng = np.random.default_rng(seed)
+        self.simulator = make_simulator(count, seed, clock.time()) if simulate else None
+        self.info = np.zeros((count, len(RECORD_SCHEMAS['info'].channels)))
+        self.load = np.zeros((count, len(RECORD_SCHEMAS['load'].channels)))
+        self.sensor = np.zeros((count, len(SENSOR_KEYS)))
+        self.updated = np.zeros((count, len(FLEET_JOBS)))  # 수집기별 마지막 수집 시각
+        self.computers = [FleetComputer(self, i) for i in range(count)]
+        self.load_sampler = CpuLoadSampler()
+        self.samples = 0
+
+    def __len__(self):
+        return len(self.computers)
+
+    @property
+    def nbytes(self):
+        """ 함대 상태가 차지하는 바이트 수 (배열 + 인스턴스 객체) """
+        arrays = (self.instance_ids, self.info, self.load, self.sensor, self.updated)
+        if self.simulator is not None:
+            arrays += (self.simulator.state, self.simulator.time, self.simulator.longitude)
+        return (sum(array.nbytes for array in arrays)
+                + sum(object.__sizeof__(computer) for computer in self.computers)
+                + self.computers.__sizeof__())
+
+    # ----- 수집기 (인스턴스 묶음 단위) -----
+    def _collect_info(self, rows, now):
+        static_info = shared_provider.get()
+        self.info[rows] = [np.nan if static_info[key] is None else static_info[key]
+                           for key in RECORD_SCHEMAS['info'].channels]
+        return self.info
+
+    def _collect_load(self, rows, now):
+        # 같은 호스트의 부하이므로 묶음당 한 번만 조회한다
+        cpu = self.load_sampler.cpu_percent()
+        if cpu is None:
+            return None  # 측정 구간이 아직 없음
+        self.load[rows] = (cpu, psutil.virtual_memory().percent)
+        return self.load
+
+    def _collect_sensor(self, rows, now):
+        if self.simulator is not None:
+            self.sensor[rows] = self.simulator.rounded(self.simulator.advance(rows, now))
+            return self.sensor
+        values = self.rng.uniform(_SENSOR_LOW, _SENSOR_HIGH, (len(rows), len(SENSOR_KEYS)))
+        np.rint(values * _SENSOR_SCALE, out=values)
+        self.sensor[rows] = values / _SENSOR_SCALE
+        return self.sensor
+
+    def step(self, job, rows, now):
+        """ 수집기 job을 rows(인스턴스 행 번호 배열)에 대해 1회 실행 """
+        column = _JOB_COLUMNS[job]
+        table = getattr(self, f'_collect_{job}')(rows, now)
+        if table is None:
+            return  # 이번 회차는 값이 없음 (첫 CPU 측정 등)
+        self.updated[rows, column] = now
+        self.samples += len(rows)
+        if self.log is not None:
+            self.log.writers[job].append_many(
+                np.full(len(rows), now), self.instance_ids[rows], table[rows])
+        if self.analytics is not None:
+            self.analytics.update(job, self.instance_ids[rows], table[rows], now)
+        if self.rollup is not None:
+            self.rollup.update(job, self.instance_ids[rows], table[rows], now)
+        if self.sink is not None:
+            channels = RECORD_SCHEMAS[job].channels
+            for row in rows.tolist():
+                record = {'Instance': self.computers[row].name}
+                record.update(zip(channels, table[row].tolist()))
+                self.sink.write(json.dumps(record, indent=4, ensure_ascii=False))
+
+    def schedule(self):
+        """ 초기 힙: (예정 시각, 수집기 순서, 위상, 주기, 인스턴스 행 번호 배열) """
+        start = self.clock.time()
+        heap = []
+        for order, (_, period) in enumerate(FLEET_JOBS):
+            for phase in range(min(period, len(self))):
+                rows = np.arange(phase, len(self), period)
+                heap.append((start + phase, order, phase, period, rows))
+        heapq.heapify(heap)
+        return heap
+
+    def run(self, duration):
+        """
+        duration초 분량 실행하고 실행한 샘플 수를 반환
+        - VirtualClock이면 기다리지 않고 시간을 건너뛴다 (최대 속도)
+        - 그 밖의 시계에서는 다음 예정 시각까지 clock.sleep()으로 기다린다
+        """
+        heap = self.schedule()
+        end = self.clock.time() + duration
+        virtual = isinstance(self.clock, VirtualClock)
+        before = self.samples
+        while heap:
+            due, order, phase, period, rows = heap[0]
+            if due >= end:
+                break
+            if virtual:
+                self.clock.advance_to(due)
+            else:
+                delay = due - self.clock.time()
+                if delay > 0:
+                    self.clock.sleep(delay)
+            self.step(FLEET_JOBS[order][0], rows, due)
+            heapq.heapreplace(heap, (due + period, order, phase, period, rows))
+        if virtual:
+            self.clock.advance_to(max(self.clock.time(), end))
+        return self.samples - before
+
+
+# ----------------------------- 프로세스 풀 분할 실행 -----------------------------
+def _run_shard(first_id, count, duration, seed, virtual, start, simulate=False):
+    """ 작업 프로세스 1개: 인스턴스 ID [first_id, first_id + count) 구간의 함대를 실행 """
+    process = psutil.Process()
+    rss_before = process.memory_info().rss
+    clock = VirtualClock(start=start) if virtual else REAL_CLOCK
+    fleet = Fleet(np.arange(first_id, first_id + count), seed=seed, clock=clock,
+                  simulate=simulate)
+    rss_after = process.memory_info().rss
+    began = time.perf_counter()
+    samples = fleet.run(duration)
+    wall = time.perf_counter() - began
+    return {
+        'first_id': first_id,
+        'instances': count,
+        'samples': samples,
+        'wall_s': wall,
+        'state_bytes': fleet.nbytes,
+        'rss_delta_bytes': rss_after - rss_before,
+    }
+
+
+def run_fleet(instances, duration, workers=None, seed=None, virtual=True, start=None,
+              simulate=False):
+    """
+    instances대의 함대를 CPU 코어 수만큼의 작업 프로세스로 나눠 duration초 분량 실행
+    - virtual=True면 각 작업 프로세스가 VirtualClock으로 최대 속도로 실행
+    - seed를 주면 작업 프로세스마다 seed + 순번으로 재현 가능한 값을 만든다
+    - simulate=True면 센서 값을 상관된 시뮬레이션으로 생성 (Fleet 참고)
+    - 반환값: 요약 딕셔너리 (인스턴스당 메모리, 초당 샘플 수, 작업 프로세스별 결과)
+    """
+    workers = max(1, min(workers or os.cpu_count() or 1, instances))
+    start = time.time() if start is None else start
+    bounds = np.linspace(0, instances, workers + 1).astype(int)
+    began = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(_run_shard, int(lo) + 1, int(hi - lo), duration,
+                        None if seed is None else seed + shard, virtual, start, simulate)
+            for shard, (lo, hi) in enumerate(zip(bounds[:-1], bounds[1:]))
+        ]
+        shards = [future.result() for future in futures]
+    wall = time.perf_counter() - began
+    samples = sum(shard['samples'] for shard in shards)
+    busiest = max(shard['wall_s'] for shard in shards)
+    return {
+        'instances': instances,
+        'workers': workers,
+        'simulated_s': duration,
+        'samples': samples,
+        'wall_s': wall,
+        'samples_per_s': samples / busiest if busiest > 0 else None,
+        'state_bytes_per_instance': sum(s['state_bytes'] for s in shards) / instances,
+        'rss_bytes_per_instance': sum(s['rss_delta_bytes'] for s in shards) / instances,
+        'shards': shards,
+    }
@@ -0,0 +1,212 @@
+# ----------------------------- 모듈 임포트 -----------------------------
+import bisect
+import collections
+import signal
+import sys
+import threading
+import time
+
+
+# 지연 히스토그램 구간 경계 (초): 1us ~ 100s, 10배마다 8구간 (로그 간격)
+BUCKET_BOUNDS = [10 ** (exponent / 8) for exponent in range(-48, 17)]
+PHASES = ('acquire', 'publish', 'serialize', 'emit')
+
+
+# ----------------------------- LatencyHistogram 클래스 -----------------------------
+class LatencyHistogram:
+    """
+    로그 간격 구간의 지연 히스토그램 (메모리 고정, 기록 O(log 구간 수))
+    - 백분위수는 해당 구간의 상한으로 근사 (10배마다 8구간 → 오차 약 33% 이내)
+    """
+
+    __slots__ = ('counts', 'count', 'total', 'max')
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKET_BOUNDS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds):
+        self.counts[bisect.bisect_left(BUCKET_BOUNDS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, q):
+        if not self.count:
+            return None
+        target = q / 100 * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= target and count:
+                return BUCKET_BOUNDS[index] if index < len(BUCKET_BOUNDS) else self.max
+        return self.max
+
+    def summary(self):
+        """ {'count', 'mean_us', 'p50_us', 'p90_us', 'p99_us', 'max_us'} """
+        if not self.count:
+            return {'count': 0}
+        result = {'count': self.count, 'mean_us': round(self.total / self.count * 1e6, 2)}
+        for q in (50, 90, 99):
+            result[f'p{q}_us'] = round(min(self.percentile(q), self.max) * 1e6, 2)
+        result['max_us'] = round(self.max * 1e6, 2)
+        return result
+
+
+# ----------------------------- 단계 타이머 -----------------------------
+class PhaseTimer:
+    """ 수집 1회의 단계별 경과 시간 측정 - mark(단계)는 직전 mark 이후 시간을 기록 """
+
+    __slots__ = ('histograms', 'last')
+
+    def __init__(self, histograms):
+        self.histograms = histograms
+        self.last = time.perf_counter()
+
+    def mark(self, phase):
+        now = time.perf_counter()
+        self.histograms[phase].record(now - self.last)
+        self.last = now
+
+
+class _NullTimer:
+    """ 계측이 꺼져 있을 때 쓰는 아무것도 하지 않는 타이머 """
+
+    __slots__ = ()
+
+    def mark(self, phase):
+        pass
+
+
+NULL_TIMER = _NullTimer()
+
+
+# ----------------------------- Instrumentation 클래스 -----------------------------
+class Instrumentation:
+    """
+    수집기별 단계 지연(acquire/publish/serialize/emit)과 스케줄링 지연(lateness) 히스토그램
+    - MissionComputer.instrumentation에 연결하면 report_*가 timer()로 단계를 기록하고,
+      수집 루프가 예정 시각(시작 시각 + k * 주기) 대비 실제 시작 시각의 지연을 기록한다
+    - 연결하지 않으면 NULL_INSTRUMENTATION이 쓰이며, 단계마다 빈 메소드 호출 1번이 전부
+    """
+
+    enabled = True
+
+    def __init__(self):
+        self._collectors = {}
+
+    def _histograms(self, collector):
+        histograms = self._collectors.get(collector)
+        if histograms is None:
+            histograms = {phase: LatencyHistogram() for phase in PHASES + ('lateness',)}
+            histograms = self._collectors.setdefault(collector, histograms)
+        return histograms
+
+    def timer(self, collector):
+        return PhaseTimer(self._histograms(collector))
+
+    def record_lateness(self, collector, seconds):
+        self._histograms(collector)['lateness'].record(max(0.0, seconds))
+
+    def report(self):
+        """ {수집기: {단계: 요약}} (기록이 없는 단계는 생략) """
+        return {
+            collector: {phase: histogram.summary()
+                        for phase, histogram in histograms.items() if histogram.count}
+            for collector, histograms in sorted(self._collectors.items())
+        }
+
+    def format_report(self):
+        lines = [f'{"collector":<10} {"phase":<10} {"count":>8} {"mean us":>10} '
+                 f'{"p50 us":>10} {"p99 us":>10} {"max us":>10}']
+        for collector, phases in self.report().items():
+            for phase, stats in phases.items():
+                lines.append(f'{collector:<10} {phase:<10} {stats["count"]:>8} '
+                             f'{stats["mean_us"]:>10.1f} {stats["p50_us"]:>10.1f} '
+                             f'{stats["p99_us"]:>10.1f} {stats["max_us"]:>10.1f}')
+        return '\n'.join(lines)
+
+
+class _NullInstrumentation:
+    """ 계측 꺼짐 - timer()는 공용 NULL_TIMER, 나머지는 아무것도 하지 않음 """
+
+    enabled = False
+
+    def timer(self, collector):
+        return NULL_TIMER
+
+    def record_lateness(self, collector, seconds):
+        pass
+
+    def report(self):
+        return {}
+
+
+NULL_INSTRUMENTATION = _NullInstrumentation()
+
+
+# ----------------------------- StackSampler 클래스 -----------------------------
+class StackSampler:
+    """
+    샘플링 프로파일러 - 별도 스레드가 interval초마다 모든 스레드의 스택을 찍어 집계
+    - 계측 대상 코드는 바꾸지 않으며, 비용은 샘플링 스레드에만 든다
+    - dump()는 가장 자주 찍힌 스택 top개를 출력 (요청할 때마다)
+    - install_signal()을 부르면 신호(기본 SIGUSR1)를 받을 때 dump()를 표준 오류로 출력
+    """
+
+    def __init__(self, interval=0.005, depth=12):
+        self.interval = interval
+        self.depth = depth
+        self.stacks = collections.Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _sample(self):
+        import traceback  # 프로파일러를 쓸 때만 불러온다 (수집기 시작 비용 절감)
+        me = threading.get_ident()
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        for ident, frame in sys._current_frames().items():
+            if ident == me:
+                continue
+            stack = tuple(
+                f'{entry.name} ({entry.filename.rsplit("/", 1)[-1]}:{entry.lineno})'
+                for entry in traceback.extract_stack(frame, limit=self.depth)
+            )
+            self.stacks[(names.get(ident, str(ident)), stack)] += 1
+        self.samples += 1
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    def start(self):
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name='stack-sampler', daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def dump(self, top=10, file=None):
+        file = file if file is not None else sys.stderr
+        total = sum(self.stacks.values()) or 1
+        print(f'=== hot stacks: {self.samples} samples ===', file=file)
+        for (thread_name, stack), count in self.stacks.most_common(top):
+            print(f'{count / total:6.1%} [{thread_name}]', file=file)
+            for entry in stack[-4:]:
+                print(f'         {entry}', file=file)
+        file.flush()
+
+    def install_signal(self, signum=None):
+        """ 메인 스레드에서 호출 - 신호를 받으면 dump() """
+        signum = signal.SIGUSR1 if signum is None else signum
+        signal.signal(signum, lambda *_: self.dump())
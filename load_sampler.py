@@ -0,0 +1,66 @@
+# ----------------------------- 모듈 임포트 -----------------------------
+import threading
+
+# psutil은 측정기를 처음 만들 때 import한다 (모듈 import만으로는 비용이 들지 않게)
+
+
+def _busy_and_total(times):
+    """ cpu_times 항목 하나를 (사용 시간, 전체 시간)으로 변환 (psutil과 같은 방식) """
+    # 리눅스의 guest/guest_nice는 user/nice에 이미 포함되어 있으므로 두 번 세지 않는다
+    total = sum(times) - getattr(times, 'guest', 0.0) - getattr(times, 'guest_nice', 0.0)
+    idle = times.idle + getattr(times, 'iowait', 0.0)
+    return total - idle, total
+
+
+# ----------------------------- CpuLoadSampler 클래스 -----------------------------
+class CpuLoadSampler:
+    """
+    블로킹 없는 CPU 사용률 측정기
+    - psutil.cpu_percent(interval=1)처럼 1초 동안 기다리지 않고,
+      직전 cpu_times 스냅샷과 현재 스냅샷의 차이로 사용률을 계산한다
+    - 호출 간격이 곧 측정 구간이므로 1초 미만 주기로도 샘플링할 수 있다
+    - 측정 구간이 min_window초(코어당 CPU 시간)보다 짧으면 기준 스냅샷을 그대로 두고
+      직전 값을 반환한다 - 아직 측정한 적이 없으면 None (만든 직후의 첫 호출은 0%가 아니라 None)
+    """
+
+    def __init__(self, min_window=0.05):
+        import psutil
+        self.min_window = min_window
+        self._lock = threading.Lock()
+        self._last = [_busy_and_total(t) for t in psutil.cpu_times(percpu=True)]
+        self._last_total = None
+        self._last_percpu = [None] * len(self._last)
+
+    def __reduce__(self):
+        # 스냅샷은 프로세스마다 새로 잡아야 하므로 새 측정기로 복원한다
+        return (CpuLoadSampler, ())
+
+    def sample(self):
+        """ (전체 사용률 %, 코어별 사용률 % 목록)을 반환 (측정 전이면 None) """
+        import psutil
+        current = [_busy_and_total(t) for t in psutil.cpu_times(percpu=True)]
+        with self._lock:
+            previous = self._last
+            window = sum(total for _, total in current) - sum(total for _, total in previous)
+            if window < self.min_window * len(current):
+                return self._last_total, self._last_percpu  # 구간이 너무 짧아 기준점 유지
+            self._last = current
+            percpu = []
+            busy_sum = total_sum = 0.0
+            for cpu, ((busy, total), (old_busy, old_total)) in enumerate(zip(current, previous)):
+                busy_delta = busy - old_busy
+                total_delta = total - old_total
+                if total_delta <= 0:
+                    percpu.append(self._last_percpu[cpu])
+                    continue
+                busy_sum += busy_delta
+                total_sum += total_delta
+                percpu.append(round(min(100.0, max(0.0, busy_delta / total_delta * 100)), 1))
+            if total_sum > 0:
+                self._last_total = round(min(100.0, max(0.0, busy_sum / total_sum * 100)), 1)
+            self._last_percpu = percpu
+            return self._last_total, percpu
+
+    def cpu_percent(self):
+        """ psutil.cpu_percent()와 같은 형태의 전체 사용률 % (측정 전이면 None) """
+        return self.sample()[0]
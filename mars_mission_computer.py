@@ -1,17 +1,93 @@
 # ----------------------------- 모듈 임포트 -----------------------------
-import platform
-import psutil
-import json
-import time
 import threading
-import multiprocessing
 import random
 
+# 빠른 시작: numpy(센서 이력/배치 생성), multiprocessing/asyncio/텔레메트리 버스는
+# 처음 쓰는 곳에서 import한다 - DummySensor만 쓰는 모듈(Detail.py)은 numpy를 불러오지 않는다
+from collector_engine import (CollectorEngine, DummySensorSource, JsonFormat, PsutilLoadSource,
+                              SystemInfoSource)
+from deadband import Deadband
+from load_sampler import CpuLoadSampler
+from system_info import shared_provider
+from telemetry_record import RecordSchema
+from sim_clock import REAL_CLOCK
+
+
+# ----------------------------- 센서 채널 정의 -----------------------------
+# (채널 이름, 최솟값, 최댓값, 반올림 자릿수) - set_env()와 generate()가 함께 사용
+SENSOR_CHANNELS = (
+    ('mars_base_internal_temperature', 18.0, 30.0, 2),    # 내부 온도 (°C)
+    ('mars_base_external_temperature', 0.0, 21.0, 2),     # 외부 온도 (°C)
+    ('mars_base_internal_humidity', 50.0, 60.0, 2),       # 내부 습도 (%)
+    ('mars_base_external_illuminance', 500.0, 715.0, 2),  # 외부 조도 (lux)
+    ('mars_base_internal_co2', 0.02, 0.1, 3),             # 내부 CO2 농도 (%)
+    ('mars_base_internal_oxygen', 4.0, 7.0, 2),           # 내부 O2 농도 (%)
+)
+SENSOR_KEYS = tuple(channel[0] for channel in SENSOR_CHANNELS)
+
+# 바이너리 레코드 형식 (telemetry_record.py 참고) - 채널은 각 플러그인의 schema
+# - info는 숫자 필드만 기록하며, 출력은 JSON만 지원
+INFO_RECORD = RecordSchema('info', SystemInfoSource.schema)
+LOAD_RECORD = RecordSchema('load', PsutilLoadSource.schema)
+SENSOR_RECORD = RecordSchema('sensor', SENSOR_KEYS)
+RECORD_SCHEMAS = {'info': INFO_RECORD, 'load': LOAD_RECORD, 'sensor': SENSOR_RECORD}
+
+# 스트리밍 이상 감지 설정 (stream_analytics.py 참고)
+# - 수집기: (채널 목록, 히스토그램 범위, 임계값 (하한, 상한))
+# - CO2 농도 상승과 O2 농도 하강을 경보
+ANALYTICS_SPECS = {
+    'load': (LOAD_RECORD.channels, {key: (0.0, 100.0) for key in LOAD_RECORD.channels}, {}),
+    'sensor': (SENSOR_KEYS, {key: (low, high) for key, low, high, _ in SENSOR_CHANNELS}, {
+        'mars_base_internal_co2': (None, 0.09),
+        'mars_base_internal_oxygen': (4.3, None),
+    }),
+}
+
+
+# 변화 감지 출력 불감대 (deadband.py 참고) - MissionComputer.changes = ChangeFilter(DEADBANDS)
+# - 마지막으로 내보낸 값과 이만큼 넘게 달라진 채널만 델타 레코드에 싣는다
+DEADBANDS = {
+    'CPU_실시간_사용량_%': Deadband(2.0),                  # %p
+    '메모리_실시간_사용량_%': Deadband(0.5),               # %p
+    'mars_base_internal_temperature': Deadband(0.1),      # °C
+    'mars_base_external_temperature': Deadband(0.5),      # °C
+    'mars_base_internal_humidity': Deadband(0.5),         # %p
+    'mars_base_external_illuminance': Deadband(relative=0.02),  # 2%
+    'mars_base_internal_co2': Deadband(0.005),            # %p
+    'mars_base_internal_oxygen': Deadband(0.05),          # %p
+}
+
+
+# 상관된 센서 시뮬레이션 모델 (sensor_sim.py 참고) - make_simulator()가 사용
+# 채널: (평형값, 완화 시간(초), 정상 상태 표준편차, 일주기 진폭, 최고점 시각(솔 비율))
+# - 외부 온도는 오후(솔의 0.58), 외부 조도는 정오에 가장 높다
+SIM_MODEL = {
+    'mars_base_internal_temperature': (24.0, 7200.0, 1.0, 0.0, 0.0),
+    'mars_base_external_temperature': (10.5, 3600.0, 1.0, 7.0, 0.58),
+    'mars_base_internal_humidity': (55.0, 10800.0, 1.2, 0.0, 0.0),
+    'mars_base_external_illuminance': (607.5, 600.0, 6.0, 90.0, 0.5),
+    'mars_base_internal_co2': (0.05, 1800.0, 0.008, 0.0, 0.0),
+    'mars_base_internal_oxygen': (5.5, 1800.0, 0.3, 0.0, 0.0),
+}
+# (대상, 원인): 원인 채널이 평형값에서 1 벗어날 때 대상 채널 평형값의 변화
+SIM_COUPLING = {
+    ('mars_base_internal_temperature', 'mars_base_external_temperature'): 0.1,  # 단열 손실
+    ('mars_base_internal_humidity', 'mars_base_internal_temperature'): -0.5,   # 상대 습도
+    ('mars_base_internal_oxygen', 'mars_base_internal_co2'): -15.0,            # 호흡 (O2 → CO2)
+}
+# 잡음 상관: 승무원 활동량이 CO2 증가와 O2 감소를 함께 일으킨다
+SIM_CORRELATION = {
+    ('mars_base_internal_co2', 'mars_base_internal_oxygen'): -0.8,
+}
+
 
 # ----------------------------- DummySensor 클래스 -----------------------------
 class DummySensor:
     """
     화성 기지의 환경 데이터를 무작위로 생성하는 더미 센서
+    - set_env()는 새 측정값 딕셔너리를 다 채운 뒤 env_values를 통째로 바꿔 끼운다
+      (참조 대입 1번은 원자적) → get_env()는 잠금 없이 항상 한 회차의 완전한 측정값을 받는다
+    - 한 번 내보낸 딕셔너리는 다시 고치지 않는다 (get_env() 결과를 고쳐 쓰지 말 것)
     """
 
     def __init__(self):
@@ -26,83 +102,104 @@ class DummySensor:
         }
 
     def set_env(self):
-        # 무작위 값 생성 (범위는 임의로 설정)
-        self.env_values['mars_base_internal_temperature'] = round(random.uniform(18.0, 30.0), 2)
-        self.env_values['mars_base_external_temperature'] = round(random.uniform(0.0, 21.0), 2)
-        self.env_values['mars_base_internal_humidity'] = round(random.uniform(50.0, 60.0), 2)
-        self.env_values['mars_base_external_illuminance'] = round(random.uniform(500.0, 715.0), 2)
-        self.env_values['mars_base_internal_co2'] = round(random.uniform(0.02, 0.1), 3)
-        self.env_values['mars_base_internal_oxygen'] = round(random.uniform(4.0, 7.0), 2)
+        # 무작위 값 생성 (범위는 SENSOR_CHANNELS 참고) 후 한 번에 교체
+        uniform = random.uniform
+        self.env_values = {key: round(uniform(low, high), ndigits)
+                           for key, low, high, ndigits in SENSOR_CHANNELS}
 
     def get_env(self):
         return self.env_values
 
+    def generate(self, n, seed=None):
+        """
+        n개의 센서 측정값을 한 번에 생성 (set_env()의 배치 버전)
+        - 반환값: shape (채널 수, n)의 float64 배열, 행 순서는 SENSOR_KEYS
+        - seed를 주면 같은 값이 재현됨
+        """
+        import numpy as np
+        rng = np.random.default_rng(seed)
+        block = np.empty((len(SENSOR_CHANNELS), n), dtype=np.float64)
+        for row, (_, low, high, ndigits) in enumerate(SENSOR_CHANNELS):
+            block[row] = rng.uniform(low, high, n)
+            np.round(block[row], ndigits, out=block[row])
+        return block
+
+
+def make_simulator(count=1, seed=None, start=0.0):
+    """
+    기지 count개의 상관된 센서 시뮬레이터 (sensor_sim.SensorSimulator, SIM_MODEL 사용)
+    - MissionComputer(sensor=make_simulator(...).sensor(i, MissionComputer.SENSOR_PERIOD))
+    """
+    from sensor_sim import SensorSimulator
+    return SensorSimulator(SENSOR_CHANNELS, SIM_MODEL, SIM_COUPLING, SIM_CORRELATION, count,
+                           seed, start)
+
 
 # ----------------------------- MissionComputer 클래스 -----------------------------
-class MissionComputer:
+class MissionComputer(CollectorEngine):
     """
-    임무 컴퓨터 시뮬레이션 클래스
-    - 시스템 정보 출력
-    - 시스템 부하 출력
-    - 센서 데이터 출력
+    임무 컴퓨터 시뮬레이션 클래스 (collector_engine.py의 설정)
+    - 시스템 정보 출력 (platform/psutil, 프로세스 공용 캐시)
+    - 시스템 부하 출력 (psutil)
+    - 센서 데이터 출력 (DummySensor)
     """
 
-    def __init__(self, name='MissionComputer'):
-        self.name = name
-        self.ds = DummySensor()  # 더미 센서 연결
+    # 수집 주기 (초)
+    INFO_PERIOD = 20
+    LOAD_PERIOD = 20
+    SENSOR_PERIOD = 5
+
+    # 센서 이력 기본 용량: 5초 주기 24시간 분량 (약 0.5MB)
+    HISTORY_CAPACITY = 24 * 60 * 60 // 5
+
+    def __init__(self, name='MissionComputer', history_capacity=HISTORY_CAPACITY,
+                 info_changes_only=False, instance_id=0, output_format='json', sink=None,
+                 clock=REAL_CLOCK, sensor=None):
+        from sensor_history import SensorHistory
+        # 더미 센서 연결 (sensor: make_simulator().sensor(i) 등 같은 사용법의 센서)
+        self.ds = DummySensor() if sensor is None else sensor
+        self.history = SensorHistory(SENSOR_KEYS, history_capacity)  # 센서 이력 링 버퍼
+        self.load_sampler = CpuLoadSampler()  # 블로킹 없는 CPU 사용률 측정기
+        super().__init__(name, instance_id, (
+            # info_changes_only=True면 정보가 바뀔 때만 출력
+            SystemInfoSource(self.INFO_PERIOD, shared_provider, info_changes_only),
+            PsutilLoadSource(self.LOAD_PERIOD, self.load_sampler),
+            DummySensorSource(self.ds, self.SENSOR_PERIOD, self.history),
+        ), JsonFormat('Instance'), output_format, sink, clock)
+
+    def report_info(self):
+        """ 시스템 기본 정보를 1회 조회하여 출력 """
+        self.collect('info')
+
+    def report_load(self):
+        """ CPU/메모리 부하 상태를 1회 조회하여 출력 """
+        self.collect('load')
+
+    def report_sensor(self):
+        """ 센서 데이터를 1회 갱신하여 출력 """
+        self.collect('sensor')
 
     def get_mission_computer_info(self):
         """ 20초 마다 시스템 기본 정보 출력 """
-        while True:
-            try:
-                info = {
-                    'Instance': self.name,
-                    '운영체계': platform.system(),
-                    '운영체계_버전': platform.version(),
-                    'CPU_타입': platform.processor(),
-                    'CPU_코어_수': psutil.cpu_count(logical=False),
-                    '메모리_크기_GB': round(psutil.virtual_memory().total / (1024 ** 3), 2)
-                }
-                print(json.dumps(info, indent=4, ensure_ascii=False))
-            except Exception as e:
-                print(f"[{self.name}] 시스템 정보 조회 에러: {e}")
-            time.sleep(20)
+        self.run_collector('info')
 
     def get_mission_computer_load(self):
         """ 20초 마다 CPU/메모리 부하 상태 출력 """
-        while True:
-            try:
-                load = {
-                    'Instance': self.name,
-                    'CPU_실시간_사용량_%': psutil.cpu_percent(interval=1),
-                    '메모리_실시간_사용량_%': psutil.virtual_memory().percent
-                }
-                print(json.dumps(load, indent=4, ensure_ascii=False))
-            except Exception as e:
-                print(f"[{self.name}] 시스템 부하 조회 에러: {e}")
-            time.sleep(20)
+        self.run_collector('load')
 
     def get_sensor_data(self):
         """ 5초 마다 센서 데이터 출력 """
-        while True:
-            try:
-                self.ds.set_env()
-                sensor_data = self.ds.get_env()
-                result = {'Instance': self.name}
-                result.update(sensor_data)
-                print(json.dumps(result, indent=4, ensure_ascii=False))
-            except Exception as e:
-                print(f"[{self.name}] 센서 데이터 조회 에러: {e}")
-            time.sleep(5)
+        self.run_collector('sensor')
 
 
 # ----------------------------- 실행부 -----------------------------
-def run_threads():
+def run_threads(**options):
     """
     하나의 MissionComputer 인스턴스를 만들고
     3개의 메소드를 각각 스레드로 실행
+    - options는 MissionComputer 생성자로 전달 (clock, sink 등)
     """
-    runComputer = MissionComputer('Threaded-Computer')
+    runComputer = MissionComputer('Threaded-Computer', **options)
 
     t1 = threading.Thread(target=runComputer.get_mission_computer_info)
     t2 = threading.Thread(target=runComputer.get_mission_computer_load)
@@ -122,26 +219,66 @@ def run_threads():
     t3.join()
 
 
-def run_processes():
+def run_processes(bus_prefix=None, report_interval=5, fast_start=False, start_method=None,
+                  **options):
     """
     MissionComputer 인스턴스를 3개 만들고
     각기 다른 프로세스로 실행
+    - bus_prefix를 주면 공유 메모리 텔레메트리 버스를 만들어 자식 프로세스가
+      수집 값을 기록하고, 부모는 join 대신 버스를 읽어 주기적으로 요약 출력
+    - fast_start=True면 부모가 모듈/캐시를 미리 채운 뒤 fork(또는 forkserver)하여
+      자식이 부모가 만든 인스턴스를 그대로 물려받는다 (fast_start.py 참고)
+    - start_method: 'fork'/'forkserver'/'spawn' (None이면 기본 방식)
+    - options는 MissionComputer 생성자로 전달 (spawn 방식이면 피클링 가능해야 함)
     """
-    runComputer1 = MissionComputer('Process-1')
-    runComputer2 = MissionComputer('Process-2')
-    runComputer3 = MissionComputer('Process-3')
+    import multiprocessing
+    from fast_start import worker_context
+
+    runComputer1 = MissionComputer('Process-1', instance_id=1, **options)
+    runComputer2 = MissionComputer('Process-2', instance_id=2, **options)
+    runComputer3 = MissionComputer('Process-3', instance_id=3, **options)
+    computers = (runComputer1, runComputer2, runComputer3)
+    context = (worker_context(start_method, computers) if fast_start
+               else multiprocessing.get_context(start_method))
 
-    p1 = multiprocessing.Process(target=runComputer1.get_mission_computer_info)
-    p2 = multiprocessing.Process(target=runComputer2.get_mission_computer_load)
-    p3 = multiprocessing.Process(target=runComputer3.get_sensor_data)
+    bus = None
+    if bus_prefix is not None:
+        from telemetry_bus import TelemetryBus, consume_bus
+        bus = TelemetryBus.create(bus_prefix, runComputer1.schemas())
+        for computer in computers:
+            computer.bus = bus
+
+    p1 = context.Process(target=runComputer1.get_mission_computer_info)
+    p2 = context.Process(target=runComputer2.get_mission_computer_load)
+    p3 = context.Process(target=runComputer3.get_sensor_data)
 
     p1.start()
     p2.start()
     p3.start()
 
-    p1.join()
-    p2.join()
-    p3.join()
+    if bus is None:
+        p1.join()
+        p2.join()
+        p3.join()
+        return
+
+    try:
+        consume_bus(bus, report_interval)
+    finally:
+        for p in (p1, p2, p3):
+            p.terminate()
+            p.join()
+        bus.close()
+
+
+def run_asyncio(instances=3, duration=None):
+    """
+    MissionComputer 인스턴스 여러 개를 스레드/프로세스 없이
+    하나의 asyncio 이벤트 루프에서 실행
+    """
+    from async_runner import run_async
+    computers = [MissionComputer(f'Async-{i}') for i in range(1, instances + 1)]
+    return run_async(computers, duration=duration)
 
 
 if __name__ == '__main__':
@@ -8,31 +8,155 @@ Mars Mission Computer Monitoring System
 날짜: 2025-08-26
 """
 
-import time          # 시간 관련 함수 사용 (sleep, strftime)
 import threading     # 멀티스레딩 구현을 위한 모듈
-import multiprocessing  # 멀티프로세싱 구현을 위한 모듈
-import random        # 시뮬레이션용 랜덤 데이터 생성
 
+from collector_engine import (  # 플러그인 수집 엔진 (수집/기록/직렬화/출력 공용 경로)
+    CollectorEngine, FixedInfoSource, SimulatedSource, TextFormat)
+from sim_clock import REAL_CLOCK  # 시각/대기 제공 시계 (실시간, 배속, 이산 사건)
 
-class MissionComputer:
+# 빠른 시작: 아래 모듈은 해당 실행 방식을 고를 때 함수 안에서 import한다
+# - multiprocessing / fast_start : 멀티프로세스 실행
+# - telemetry_bus (numpy, 공유 메모리) : 버스 모드
+# - supervisor : 감독자 실행, async_runner (asyncio) : asyncio 실행
+
+
+# 고정 하드웨어 정보 (info 수집기가 매번 그대로 출력)
+INFO_FIELDS = {
+    'OS': 'Mars Mission OS v2.1',                      # 운영체제 정보
+    'CPU': 'Intel Mars-Core i7-9900K',                 # 프로세서 정보
+    'RAM': '32GB DDR4',                                 # 메모리 정보
+    'Storage': '1TB SSD',                               # 저장장치 정보
+}
+
+# 시뮬레이션 채널: (채널 이름, 최솟값, 최댓값, 반올림 자릿수)
+LOAD_CHANNELS = (
+    ('CPU Usage', 10, 90, 2),             # CPU 사용률 (10-90%)
+    ('Memory Usage', 30, 80, 2),          # 메모리 사용률 (30-80%)
+    ('Disk Usage', 20, 70, 2),            # 디스크 사용률 (20-70%)
+    ('Network I/O', 1, 100, 2),           # 네트워크 속도 (1-100 MB/s)
+    ('Temperature', 35, 75, 1),           # 시스템 온도 (35-75°C)
+)
+SENSOR_CHANNELS = (
+    ('Atmospheric Pressure', 0.6, 0.8, 3),   # 화성 대기압 (0.6-0.8 kPa)
+    ('External Temperature', -80, -20, 1),   # 화성 외부 온도 (-80 ~ -20°C)
+    ('Solar Panel Voltage', 22, 28, 2),      # 태양광 패널 전압 (22-28V)
+    ('Battery Level', 70, 100, 1),           # 배터리 잔량 (70-100%)
+    ('Communication Signal', 85, 100, 1),    # 통신 신호 강도 (85-100%)
+)
+
+# 텍스트 출력 서식 (단위 포함)
+LOAD_DISPLAY = {
+    'CPU Usage': '{:.2f}%',
+    'Memory Usage': '{:.2f}%',
+    'Disk Usage': '{:.2f}%',
+    'Network I/O': '{:.2f} MB/s',
+    'Temperature': '{:.1f}°C',
+}
+SENSOR_DISPLAY = {
+    'Atmospheric Pressure': '{:.3f} kPa',
+    'External Temperature': '{:.1f}°C',
+    'Solar Panel Voltage': '{:.2f}V',
+    'Battery Level': '{:.1f}%',
+    'Communication Signal': '{:.1f}%',
+}
+
+# 상관된 시뮬레이션 모델 (sensor_sim.py 참고, make_simulators()가 사용)
+# 채널: (평형값, 완화 시간(초), 정상 상태 표준편차, 일주기 진폭, 최고점 시각(솔 비율))
+SIM_MODELS = {
+    'load': {
+        'CPU Usage': (50.0, 120.0, 15.0, 0.0, 0.0),
+        'Memory Usage': (55.0, 1800.0, 8.0, 0.0, 0.0),
+        'Disk Usage': (45.0, 86400.0, 5.0, 0.0, 0.0),        # 아주 느리게 변함
+        'Network I/O': (50.0, 60.0, 20.0, 0.0, 0.0),
+        'Temperature': (55.0, 600.0, 6.0, 0.0, 0.0),
+    },
+    'sensor': {
+        'Atmospheric Pressure': (0.7, 10800.0, 0.03, 0.03, 0.2),   # 화성 대기압 일변화
+        'External Temperature': (-50.0, 3600.0, 3.0, 20.0, 0.58),  # 오후에 가장 따뜻함
+        'Solar Panel Voltage': (25.0, 600.0, 0.5, 2.0, 0.5),       # 정오에 가장 높음
+        'Battery Level': (85.0, 7200.0, 5.0, 0.0, 0.0),
+        'Communication Signal': (92.5, 300.0, 3.0, 0.0, 0.0),
+    },
+}
+# (대상, 원인): gain - 원인 채널이 평형값에서 1 벗어날 때 대상 채널 평형값의 변화
+SIM_COUPLINGS = {
+    'load': {('Temperature', 'CPU Usage'): 0.3},           # CPU 부하 → 발열
+    'sensor': {('Battery Level', 'Solar Panel Voltage'): 2.0},  # 발전량 → 충전
+}
+# 잡음 상관계수
+SIM_CORRELATIONS = {
+    'load': {('CPU Usage', 'Network I/O'): 0.5},
+    'sensor': {},
+}
+
+
+def make_simulators(count=1, seed=None, start=0.0):
+    """
+    컴퓨터 count대가 함께 쓰는 부하/센서 시뮬레이터 (sensor_sim.SensorSimulator)
+    
+    Args:
+        count (int): 컴퓨터 수 (시뮬레이터 배열의 행 수)
+        seed (int): 난수 시드 (같은 시드 → 같은 값)
+        start (float): 시뮬레이션 시작 시각 (초)
+    
+    Returns:
+        dict: {'load': SensorSimulator, 'sensor': SensorSimulator}
+        
+        i번째 컴퓨터에는 {name: simulator.sensor(i) for name, simulator in ...items()}를
+        MissionComputer(simulators=...)로 넘긴다
+    """
+    from sensor_sim import SensorSimulator
+    channels = {'load': LOAD_CHANNELS, 'sensor': SENSOR_CHANNELS}
+    return {
+        name: SensorSimulator(channels[name], SIM_MODELS[name], SIM_COUPLINGS[name],
+                              SIM_CORRELATIONS[name], count,
+                              None if seed is None else seed + offset, start)
+        for offset, name in enumerate(('load', 'sensor'))
+    }
+
+
+class MissionComputer(CollectorEngine):
     """
     미션 컴퓨터 클래스
     
     화성 미션에서 사용되는 컴퓨터의 시스템 정보, 부하 상태, 센서 데이터를
     모니터링하는 기능을 제공하는 클래스
     
+    수집/기록/직렬화/출력은 CollectorEngine(collector_engine.py)이 맡고,
+    이 클래스는 고정 하드웨어 정보와 시뮬레이션 부하/센서 플러그인,
+    텍스트 출력 형식을 고르는 설정만 가진다
+    
     Attributes:
         computer_id (int): 컴퓨터 식별 번호
     """
     
-    def __init__(self, computer_id=1):
+    # 수집 주기 (초) - 센서 데이터는 더 자주 체크
+    INFO_PERIOD = 20
+    LOAD_PERIOD = 20
+    SENSOR_PERIOD = 10
+    
+    def __init__(self, computer_id=1, output_format='text', sink=None, clock=REAL_CLOCK,
+                 simulators=None):
         """
         MissionComputer 인스턴스 초기화
         
         Args:
             computer_id (int): 컴퓨터 식별 번호 (기본값: 1)
+            output_format (str): 'text'(기본, 사람이 읽는 출력) 또는 'binary'
+            sink (BatchingWriter): 텍스트 출력 대상 (None이면 프로세스 공용 표준 출력)
+            clock (RealClock): 타임스탬프와 수집 루프 대기에 쓸 시계 (sim_clock.py)
+            simulators (dict): {'load'/'sensor': SimulatedSensor} - 주면 균등 분포 난수 대신
+                상관된 시뮬레이션 값을 출력 (make_simulators() 참고, None이면 난수)
         """
         self.computer_id = computer_id  # 각 컴퓨터를 구분하기 위한 고유 ID
+        simulators = simulators or {}
+        super().__init__(f'Computer {computer_id}', computer_id, (
+            FixedInfoSource(INFO_FIELDS, self.INFO_PERIOD),
+            SimulatedSource('load', LOAD_CHANNELS, self.LOAD_PERIOD, 'System Load',
+                            LOAD_DISPLAY, '시스템 부하 조회', simulators.get('load')),
+            SimulatedSource('sensor', SENSOR_CHANNELS, self.SENSOR_PERIOD, 'Sensor Data',
+                            SENSOR_DISPLAY, '센서 데이터 조회', simulators.get('sensor')),
+        ), TextFormat('Computer ID'), output_format, sink, clock)
     
     def get_mission_computer_info(self):
         """
@@ -45,25 +169,13 @@ class MissionComputer:
         - 저장장치 정보
         - 현재 시간
         """
-        while True:  # 무한 루프로 지속적인 모니터링
-            # 시스템 정보 딕셔너리 생성
-            info = {
-                'Computer ID': self.computer_id,                    # 컴퓨터 식별번호
-                'OS': 'Mars Mission OS v2.1',                      # 운영체제 정보
-                'CPU': 'Intel Mars-Core i7-9900K',                 # 프로세서 정보
-                'RAM': '32GB DDR4',                                 # 메모리 정보
-                'Storage': '1TB SSD',                               # 저장장치 정보
-                'Timestamp': time.strftime('%Y-%m-%d %H:%M:%S')     # 현재 시간
-            }
-            
-            # 시스템 정보 출력
-            print(f'[Computer {self.computer_id}] Mission Computer Info:')
-            for key, value in info.items():
-                print(f'  {key}: {value}')
-            print('-' * 50)  # 구분선 출력
-            
-            # 20초 대기 (요구사항: 20초마다 출력)
-            time.sleep(20)
+        self.run_collector('info')
+    
+    def report_info(self):
+        """
+        시스템 정보를 1회 생성하여 출력하는 메소드
+        """
+        self.collect('info')
     
     def get_mission_computer_load(self):
         """
@@ -76,26 +188,13 @@ class MissionComputer:
         - 네트워크 I/O
         - 시스템 온도
         """
-        while True:  # 무한 루프로 지속적인 모니터링
-            # 시뮬레이션을 위한 랜덤 부하 데이터 생성
-            load = {
-                'Computer ID': self.computer_id,                        # 컴퓨터 식별번호
-                'CPU Usage': f'{random.uniform(10, 90):.2f}%',          # CPU 사용률 (10-90%)
-                'Memory Usage': f'{random.uniform(30, 80):.2f}%',       # 메모리 사용률 (30-80%)
-                'Disk Usage': f'{random.uniform(20, 70):.2f}%',         # 디스크 사용률 (20-70%)
-                'Network I/O': f'{random.uniform(1, 100):.2f} MB/s',    # 네트워크 속도 (1-100 MB/s)
-                'Temperature': f'{random.uniform(35, 75):.1f}°C',       # 시스템 온도 (35-75°C)
-                'Timestamp': time.strftime('%Y-%m-%d %H:%M:%S')         # 현재 시간
-            }
-            
-            # 시스템 부하 정보 출력
-            print(f'[Computer {self.computer_id}] System Load:')
-            for key, value in load.items():
-                print(f'  {key}: {value}')
-            print('-' * 50)  # 구분선 출력
-            
-            # 20초 대기 (요구사항: 20초마다 출력)
-            time.sleep(20)
+        self.run_collector('load')
+    
+    def report_load(self):
+        """
+        시스템 부하를 1회 생성하여 출력하는 메소드
+        """
+        self.collect('load')
     
     def get_sensor_data(self):
         """
@@ -108,29 +207,16 @@ class MissionComputer:
         - 배터리 잔량
         - 통신 신호 강도
         """
-        while True:  # 무한 루프로 지속적인 모니터링
-            # 시뮬레이션을 위한 랜덤 센서 데이터 생성
-            sensor_data = {
-                'Computer ID': self.computer_id,                            # 컴퓨터 식별번호
-                'Atmospheric Pressure': f'{random.uniform(0.6, 0.8):.3f} kPa',  # 화성 대기압 (0.6-0.8 kPa)
-                'External Temperature': f'{random.uniform(-80, -20):.1f}°C',     # 화성 외부 온도 (-80 ~ -20°C)
-                'Solar Panel Voltage': f'{random.uniform(22, 28):.2f}V',         # 태양광 패널 전압 (22-28V)
-                'Battery Level': f'{random.uniform(70, 100):.1f}%',              # 배터리 잔량 (70-100%)
-                'Communication Signal': f'{random.uniform(85, 100):.1f}%',       # 통신 신호 강도 (85-100%)
-                'Timestamp': time.strftime('%Y-%m-%d %H:%M:%S')                  # 현재 시간
-            }
-            
-            # 센서 데이터 출력
-            print(f'[Computer {self.computer_id}] Sensor Data:')
-            for key, value in sensor_data.items():
-                print(f'  {key}: {value}')
-            print('-' * 50)  # 구분선 출력
-            
-            # 10초 대기 (센서 데이터는 더 자주 체크)
-            time.sleep(10)
+        self.run_collector('sensor')
+    
+    def report_sensor(self):
+        """
+        센서 데이터를 1회 생성하여 출력하는 메소드
+        """
+        self.collect('sensor')
 
 
-def run_multithread():
+def run_multithread(**options):
     """
     멀티스레드 실행 함수 (3번 과제)
     
@@ -146,7 +232,7 @@ def run_multithread():
     print('=== Multi-threading Mode ===')
     
     # runComputer 인스턴스 생성 (요구사항)
-    runComputer = MissionComputer(1)
+    runComputer = MissionComputer(1, **options)
     
     # 각 메소드를 위한 스레드 생성
     # Thread 객체를 생성할 때 target 매개변수에 실행할 함수 지정
@@ -173,7 +259,7 @@ def run_multithread():
     thread3.join()  # thread3이 종료될 때까지 대기
 
 
-def computer_process_info(computer_id):
+def computer_process_info(computer_id, bus=None, **options):
     """
     runComputer1용 프로세스 함수
     
@@ -181,15 +267,18 @@ def computer_process_info(computer_id):
     
     Args:
         computer_id (int): 컴퓨터 식별번호
+        bus (TelemetryBus): 수집 값을 기록할 공유 메모리 버스 (선택)
+        **options: MissionComputer 생성자로 전달할 추가 인수 (clock, sink 등)
     """
     # runComputer1에 해당하는 인스턴스 생성
-    computer = MissionComputer(computer_id)
+    computer = MissionComputer(computer_id, **options)
+    computer.bus = bus
     
     # 시스템 정보 모니터링만 실행
     computer.get_mission_computer_info()
 
 
-def computer_process_load(computer_id):
+def computer_process_load(computer_id, bus=None, **options):
     """
     runComputer2용 프로세스 함수
     
@@ -197,15 +286,18 @@ def computer_process_load(computer_id):
     
     Args:
         computer_id (int): 컴퓨터 식별번호
+        bus (TelemetryBus): 수집 값을 기록할 공유 메모리 버스 (선택)
+        **options: MissionComputer 생성자로 전달할 추가 인수 (clock, sink 등)
     """
     # runComputer2에 해당하는 인스턴스 생성
-    computer = MissionComputer(computer_id)
+    computer = MissionComputer(computer_id, **options)
+    computer.bus = bus
     
     # 시스템 부하 모니터링만 실행
     computer.get_mission_computer_load()
 
 
-def computer_process_sensor(computer_id):
+def computer_process_sensor(computer_id, bus=None, **options):
     """
     runComputer3용 프로세스 함수
     
@@ -213,15 +305,19 @@ def computer_process_sensor(computer_id):
     
     Args:
         computer_id (int): 컴퓨터 식별번호
+        bus (TelemetryBus): 수집 값을 기록할 공유 메모리 버스 (선택)
+        **options: MissionComputer 생성자로 전달할 추가 인수 (clock, sink 등)
     """
     # runComputer3에 해당하는 인스턴스 생성
-    computer = MissionComputer(computer_id)
+    computer = MissionComputer(computer_id, **options)
+    computer.bus = bus
     
     # 센서 데이터 모니터링만 실행
     computer.get_sensor_data()
 
 
-def run_multiprocess():
+def run_multiprocess(bus_prefix=None, report_interval=5, fast_start=False, start_method=None,
+                     **options):
     """
     멀티프로세스 실행 함수 (4-5번 과제)
     
@@ -235,29 +331,64 @@ def run_multiprocess():
     - 서로 다른 프로세스 간 데이터 공유 불가
     - 한 프로세스가 크래시되어도 다른 프로세스에 영향 없음
     - 멀티코어 CPU를 효율적으로 활용 가능
+    
+    Args:
+        bus_prefix (str): 주어지면 공유 메모리 텔레메트리 버스를 만들고,
+                          메인 프로세스는 join 대신 버스를 읽어 요약을 출력
+        report_interval (float): 버스 요약 출력 주기(초)
+        fast_start (bool): True면 부모가 모듈/캐시와 인스턴스(작업 템플릿)를 미리 만들고
+                           자식은 fork(또는 forkserver)로 그대로 물려받음 (fast_start.py)
+        start_method (str): 'fork'/'forkserver'/'spawn' (None이면 기본 방식)
+        **options: 각 MissionComputer 생성자로 전달할 추가 인수 (피클링 가능해야 함)
     """
-    print('=== Multi-processing Mode ===')
+    import multiprocessing
+    from fast_start import worker_context
     
-    # 3개의 독립적인 프로세스 생성
-    # Process 객체를 생성할 때 target에는 실행할 함수, args에는 함수의 인수 지정
+    print('=== Multi-processing Mode ===')
     
-    # runComputer1: 시스템 정보 담당 (Computer ID = 1)
-    process1 = multiprocessing.Process(
-        target=computer_process_info,  # 실행할 함수
-        args=(1,)                      # 함수에 전달할 인수 (computer_id=1)
-    )
+    # 빠른 시작: 인스턴스(작업 템플릿)를 부모에서 만들어 두고 자식은 다시 초기화하지 않는다
+    templates = ({computer_id: MissionComputer(computer_id, **options) for computer_id in (1, 2, 3)}
+                 if fast_start else {})
+    context = (worker_context(start_method, list(templates.values())) if fast_start
+               else multiprocessing.get_context(start_method))
     
-    # runComputer2: 시스템 부하 담당 (Computer ID = 2)
-    process2 = multiprocessing.Process(
-        target=computer_process_load,  # 실행할 함수
-        args=(2,)                      # 함수에 전달할 인수 (computer_id=2)
-    )
+    # 공유 메모리 버스 (선택) - 자식 프로세스가 수집 값을 기록
+    bus = None
+    if bus_prefix is not None:
+        from telemetry_bus import TelemetryBus
+        # 수집기별 숫자 채널은 플러그인 스키마에서 (info는 타임스탬프/ID만 있는 하트비트 레코드)
+        schemas = (templates[1] if fast_start else MissionComputer(1, **options)).schemas()
+        bus = TelemetryBus.create(bus_prefix, schemas)
     
-    # runComputer3: 센서 데이터 담당 (Computer ID = 3)
-    process3 = multiprocessing.Process(
-        target=computer_process_sensor, # 실행할 함수
-        args=(3,)                       # 함수에 전달할 인수 (computer_id=3)
-    )
+    # 3개의 독립적인 프로세스 생성
+    # Process 객체를 생성할 때 target에는 실행할 함수, args에는 함수의 인수 지정
+    if fast_start:
+        for computer in templates.values():
+            computer.bus = bus
+        process1 = context.Process(target=templates[1].get_mission_computer_info)
+        process2 = context.Process(target=templates[2].get_mission_computer_load)
+        process3 = context.Process(target=templates[3].get_sensor_data)
+    else:
+        # runComputer1: 시스템 정보 담당 (Computer ID = 1)
+        process1 = context.Process(
+            target=computer_process_info,  # 실행할 함수
+            kwargs=options,
+            args=(1, bus)                  # 함수에 전달할 인수 (computer_id=1)
+        )
+        
+        # runComputer2: 시스템 부하 담당 (Computer ID = 2)
+        process2 = context.Process(
+            target=computer_process_load,  # 실행할 함수
+            kwargs=options,
+            args=(2, bus)                  # 함수에 전달할 인수 (computer_id=2)
+        )
+        
+        # runComputer3: 센서 데이터 담당 (Computer ID = 3)
+        process3 = context.Process(
+            target=computer_process_sensor, # 실행할 함수
+            kwargs=options,
+            args=(3, bus)                   # 함수에 전달할 인수 (computer_id=3)
+        )
     
     # 모든 프로세스 시작
     # start() 메소드를 호출하면 새로운 프로세스가 생성되어 실행됨
@@ -265,6 +396,18 @@ def run_multiprocess():
     process2.start()  # runComputer2 프로세스 시작
     process3.start()  # runComputer3 프로세스 시작
     
+    if bus is not None:
+        # 버스 모드: 메인 프로세스가 공유 메모리에서 직접 값을 모아 출력
+        from telemetry_bus import consume_bus
+        try:
+            consume_bus(bus, report_interval)
+        finally:
+            for process in (process1, process2, process3):
+                process.terminate()
+                process.join()
+            bus.close()
+        return
+    
     # join() 메소드: 해당 프로세스가 종료될 때까지 메인 프로세스가 대기
     # 하지만 while True 때문에 실제로는 무한 실행됨
     process1.join()  # process1이 종료될 때까지 대기
@@ -272,6 +415,80 @@ def run_multiprocess():
     process3.join()  # process3이 종료될 때까지 대기
 
 
+def run_supervised(computer_ids=(1, 2, 3), workers=None, bus_prefix=None, report_interval=5,
+                   duration=None, fast_start=False, start_method=None, **options):
+    """
+    감독자 실행 함수
+    
+    run_multiprocess()처럼 프로세스를 띄우고 join만 하는 대신
+    CollectorSupervisor가 작업 프로세스 풀을 관리
+    - 각 작업 프로세스는 맡은 MissionComputer의 세 수집 작업을 모두 실행
+    - 죽은 작업 프로세스는 백오프 후 재시작
+    - Ctrl+C/SIGTERM 또는 duration 경과 시 작업 프로세스를 정상 종료
+    
+    Args:
+        computer_ids (iterable): 실행할 컴퓨터 식별번호 목록
+        workers (int): 작업 프로세스 수 (None이면 min(인스턴스 수, CPU 코어 수))
+        bus_prefix (str): 주어지면 작업 프로세스마다 공유 메모리 텔레메트리 버스
+                          ('<bus_prefix>_w<자리 번호>')를 따로 만들고 모두 읽어 요약을 출력
+                          (링은 단일 생산자 전용이라 작업 프로세스끼리 공유하지 않음)
+        report_interval (float): 버스 요약 출력 주기(초)
+        duration (float): 실행 시간(초), None이면 종료 요청까지 실행
+        fast_start (bool): True면 재시작되는 작업 프로세스도 부모가 미리 불러 둔
+                           모듈/캐시를 물려받음 (fast_start.py)
+        start_method (str): 'fork'/'forkserver'/'spawn' (None이면 기본 방식)
+        **options: 각 MissionComputer 생성자로 전달할 추가 인수 (피클링 가능해야 함)
+    
+    Returns:
+        CollectorSupervisor: 종료된 감독자 (events/status()로 재시작 기록 확인)
+    """
+    import multiprocessing
+    from fast_start import worker_context
+    from supervisor import CollectorSupervisor
+    from telemetry_bus import consume_buses
+    
+    print('=== Supervised Multi-processing Mode ===')
+    
+    computer_ids = list(computer_ids)
+    # 작업 프로세스는 맡은 인스턴스를 직접 만들므로, 같은 설정의 인스턴스 1개로 미리 불러오기
+    # 버스 스키마도 이 인스턴스의 플러그인에서 얻는다
+    template = MissionComputer(computer_ids[0] if computer_ids else 1, **options)
+    context = (worker_context(start_method, [template])
+               if fast_start and computer_ids else multiprocessing.get_context(start_method))
+    supervisor = CollectorSupervisor(MissionComputer, computer_ids, workers=workers,
+                                     options=options, bus_prefix=bus_prefix,
+                                     bus_schemas=template.schemas(), context=context)
+    try:
+        if bus_prefix is None:
+            supervisor.run(duration)
+        else:
+            # 버스 모드: 메인 스레드는 작업 프로세스별 버스 요약을 출력하고,
+            # 감시는 감독자 스레드가 맡는다
+            supervisor.start()
+            rounds = None if duration is None else max(1, int(duration // report_interval))
+            consume_buses(supervisor.buses, report_interval, rounds)
+    finally:
+        supervisor.stop()
+        supervisor.close_buses()
+    return supervisor
+
+
+def run_asyncio(instances=3, duration=None):
+    """
+    asyncio 실행 함수
+    
+    MissionComputer 인스턴스 여러 개의 세 가지 수집 작업을
+    스레드나 프로세스 없이 하나의 이벤트 루프에서 주기적으로 실행
+    
+    Args:
+        instances (int): 생성할 MissionComputer 인스턴스 수
+        duration (float): 실행 시간(초), None이면 Ctrl+C까지 실행
+    """
+    from async_runner import run_async
+    computers = [MissionComputer(computer_id) for computer_id in range(1, instances + 1)]
+    return run_async(computers, duration=duration)
+
+
 if __name__ == '__main__':
     """
     메인 실행 부분
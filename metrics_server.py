@@ -0,0 +1,176 @@
+# ----------------------------- 모듈 임포트 -----------------------------
+import itertools
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+PROMETHEUS_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+JSON_CONTENT_TYPE = 'application/json; charset=utf-8'
+
+
+def _label(value):
+    """ Prometheus 레이블 값 이스케이프 """
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+# ----------------------------- MetricsRegistry 클래스 -----------------------------
+class MetricsRegistry:
+    """
+    인스턴스별 최신 info/load/sensor 값을 미리 렌더링해 두는 저장소
+    - 수집기는 publish()에서 자기 (수집기, 인스턴스) 조각(Prometheus 줄 + JSON)을
+      직접 렌더링해 딕셔너리 항목 1개로 바꿔 끼운다 (잠금 없음)
+    - refresh()가 조각들을 이어 붙여 완성된 스냅샷 (Prometheus 바이트열, JSON 바이트열)을
+      속성 1개 대입으로 교체한다 - 갱신 스레드가 refresh_interval초마다, 바뀐 경우에만 실행
+    - 스크레이프는 snapshot 속성을 읽기만 하므로 수집기 활동과 무관하게 일정하고,
+      수집기 스레드를 막지 않는다
+    """
+
+    def __init__(self, refresh_interval=1.0, prefix='mars'):
+        self.refresh_interval = refresh_interval
+        self.prefix = prefix
+        self._fragments = {}  # (수집기, 인스턴스 이름) -> (채널 줄, 타임스탬프 줄, JSON 문자열)
+        # 여러 수집기 스레드가 publish()하므로 += 1 대신 원자적인 next()로 고유 번호를 받는다
+        self._versions = itertools.count(1)
+        self._version = 0
+        self._rendered_version = -1
+        self.snapshot = (b'', b'{}')
+        self._stop = threading.Event()
+        self._thread = None
+
+    def publish(self, collector, instance, instance_id, record, timestamp):
+        """ 수집 값 1건을 조각으로 렌더링해 교체 (수집기 스레드에서 호출) """
+        metric = f'{self.prefix}_{collector}'
+        labels = f'instance="{_label(instance)}",instance_id="{instance_id}"'
+        lines = [f'{metric}{{{labels},channel="{_label(key)}"}} {value!r}'
+                 for key, value in record.items() if _is_number(value)]
+        stamp = (f'{self.prefix}_sample_timestamp_seconds{{collector="{collector}",{labels}}} '
+                 f'{timestamp!r}')
+        body = {'instance_id': instance_id, 'timestamp': timestamp}
+        body.update(record)
+        self._fragments[(collector, instance)] = (
+            '\n'.join(lines), stamp, json.dumps(body, ensure_ascii=False))
+        self._version = next(self._versions)
+
+    def refresh(self):
+        """ 조각을 모아 새 스냅샷을 만들고 교체 (바뀐 것이 없으면 생략) """
+        version = self._version
+        if version == self._rendered_version:
+            return False
+        fragments = sorted(self._fragments.items())  # 복사본 위에서 작업
+        prometheus = []
+        stamps = []
+        collectors = {}
+        typed = set()
+        for (collector, instance), (lines, stamp, body) in fragments:
+            if lines:  # 숫자 채널이 없는 수집기(info)는 빈 계열을 만들지 않는다
+                if collector not in typed:
+                    typed.add(collector)
+                    prometheus.append(f'# TYPE {self.prefix}_{collector} gauge')
+                prometheus.append(lines)
+            stamps.append(stamp)
+            collectors.setdefault(collector, []).append(
+                f'{json.dumps(str(instance), ensure_ascii=False)}: {body}')
+        # 샘플 시각은 수집기 계열과 섞이지 않도록 자기 TYPE 줄을 가진 별도 계열로 맨 뒤에 둔다
+        if stamps:
+            prometheus.append(f'# TYPE {self.prefix}_sample_timestamp_seconds gauge')
+            prometheus.extend(stamps)
+        document = ', '.join(f'"{collector}": {{{", ".join(items)}}}'
+                             for collector, items in collectors.items())
+        self.snapshot = (('\n'.join(prometheus) + '\n').encode('utf-8'),
+                         ('{' + document + '}').encode('utf-8'))
+        self._rendered_version = version
+        return True
+
+    def _run(self):
+        while not self._stop.wait(self.refresh_interval):
+            self.refresh()
+
+    def start(self):
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name='metrics-refresh', daemon=True)
+            self._thread.start()
+
+    def close(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+
+# ----------------------------- MetricsServer 클래스 -----------------------------
+class _MetricsHandler(BaseHTTPRequestHandler):
+    registry = None  # MetricsServer가 하위 클래스에서 지정
+    protocol_version = 'HTTP/1.1'  # 연결 유지 - 스크레이프마다 스레드를 새로 만들지 않는다
+
+    def do_GET(self):
+        path = self.path.split('?', 1)[0]
+        prometheus, document = self.registry.snapshot
+        if path == '/metrics':
+            self._send(200, PROMETHEUS_CONTENT_TYPE, prometheus)
+        elif path == '/metrics.json':
+            self._send(200, JSON_CONTENT_TYPE, document)
+        else:
+            self._send(404, 'text/plain; charset=utf-8', b'not found\n')
+
+    def _send(self, status, content_type, body):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  # 스크레이프마다 표준 오류에 기록하지 않는다
+
+
+class MetricsServer:
+    """
+    localhost 전용 HTTP 메트릭 서버
+    - GET /metrics      : Prometheus 텍스트 형식
+    - GET /metrics.json : JSON {수집기: {인스턴스: 최신 값}}
+    - port=0이면 빈 포트를 골라 쓴다 (url 속성 참고)
+    """
+
+    def __init__(self, registry, host='127.0.0.1', port=0):
+        self.registry = registry
+        handler = type('MetricsHandler', (_MetricsHandler,), {'registry': registry})
+        self.httpd = ThreadingHTTPServer((host, port), handler)
+        self.httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def start(self):
+        self.registry.start()
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name='metrics-server',
+                                        daemon=True)
+        self._thread.start()
+        return self
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        self.registry.close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def serve_metrics(computers, host='127.0.0.1', port=0, refresh_interval=1.0):
+    """ computers의 metrics에 공용 MetricsRegistry를 연결하고 서버를 시작해 반환 """
+    registry = MetricsRegistry(refresh_interval)
+    for computer in computers:
+        computer.metrics = registry
+    return MetricsServer(registry, host, port).start()
@@ -0,0 +1,286 @@
+# ----------------------------- 모듈 임포트 -----------------------------
+import atexit
+import collections
+import os
+import queue
+import sys
+import threading
+import time
+
+
+# ----------------------------- 출력 대상(Sink) -----------------------------
+class OutputSink:
+    """
+    출력 대상 기본 클래스 - 레코드(문자열) 묶음을 한 번에 내보낸다
+    - write()가 있으므로 BatchingWriter 없이 수집기의 sink로 바로 쓸 수도 있다
+      (쓰기 스레드가 없어서 피클링 가능 - 자식 프로세스에 넘길 때 유용)
+    """
+
+    def write(self, record):
+        self.write_batch([record])
+        return True
+
+    def write_batch(self, records):
+        raise NotImplementedError
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.flush()
+
+
+class StdoutSink(OutputSink):
+    """ 표준 출력 - 묶음 하나를 write() 1회로 내보낸다 """
+
+    def __init__(self, stream=None):
+        self.stream = stream
+
+    def write_batch(self, records):
+        stream = self.stream if self.stream is not None else sys.stdout
+        stream.write(''.join(record + '\n' for record in records))
+        stream.flush()
+
+
+class BinaryStdoutSink(OutputSink):
+    """ 표준 출력(바이너리) - bytes 레코드 묶음을 write() 1회로 내보낸다 (레코드 스트림 프레임용) """
+
+    def __init__(self, stream=None):
+        self.stream = stream
+
+    def write_batch(self, records):
+        stream = self.stream if self.stream is not None else sys.stdout.buffer
+        stream.write(b''.join(records))
+        stream.flush()
+
+
+class FileSink(OutputSink):
+    """ 텍스트 파일 (이어 쓰기) """
+
+    def __init__(self, path, encoding='utf-8'):
+        self.path = path
+        self._file = open(path, 'a', encoding=encoding)
+
+    def write_batch(self, records):
+        self._file.write(''.join(record + '\n' for record in records))
+
+    def flush(self):
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+
+class NullSink(OutputSink):
+    """ 아무것도 출력하지 않음 (벤치마크/부하 시험용) """
+
+    def write_batch(self, records):
+        pass
+
+
+class MemorySink(OutputSink):
+    """ 메모리 목록에 보관 (시험/디버깅용) """
+
+    def __init__(self):
+        self.records = []
+
+    def write_batch(self, records):
+        self.records.extend(records)
+
+
+# ----------------------------- BatchingWriter 클래스 -----------------------------
+class BatchingWriter:
+    """
+    여러 수집기 스레드의 출력을 모아 전용 쓰기 스레드 1개가 묶음으로 내보낸다
+    - max_batch개가 모이거나 flush_interval초가 지나면 sink.write_batch() 호출
+    - 큐 크기는 queue_size로 제한되며, 가득 찼을 때의 정책(policy):
+        'block'       : 자리가 날 때까지 기다림 (block_timeout초 후에는 버림)
+        'drop_newest' : 새 레코드를 버림
+        'drop_oldest' : 가장 오래된 레코드를 버리고 새 레코드를 넣음
+    - 버린 레코드 수는 dropped에 누적된다
+    - 레코드는 sink가 받는 형식 그대로 전달된다 (텍스트 sink는 str, BinaryStdoutSink는 bytes)
+    - sink가 예외를 내면(파이프 끊김, 디스크 가득 참 ...) 그 묶음을 버린 것으로 세고
+      errors/last_error에 남긴 뒤 계속 큐를 비운다 (수집기가 가득 찬 큐에서 멈추지 않도록)
+    - 쓰기 스레드가 없으면(죽었거나 fork된 자식) write()는 기다리지 않고 바로 False
+    - flush/close 신호는 크기 제한 큐 밖(_controls)으로 보내므로 drop_oldest가 버리지 않고,
+      flush()/close()는 timeout초까지만 기다린다
+    """
+
+    POLICIES = ('block', 'drop_newest', 'drop_oldest')
+
+    def __init__(self, sink, max_batch=256, flush_interval=0.2, queue_size=10_000,
+                 policy='block', block_timeout=None, control_timeout=10.0):
+        if policy not in self.POLICIES:
+            raise ValueError(f'알 수 없는 정책: {policy}')
+        self.sink = sink
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval
+        self.policy = policy
+        self.block_timeout = block_timeout
+        self.control_timeout = control_timeout  # flush()/close()의 기본 대기 시간 (초)
+        self.dropped = 0
+        self.errors = 0  # sink 예외 횟수
+        self.last_error = None
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._controls = collections.deque()  # 대기 중인 _Control (큐 크기 제한과 무관)
+        self._drop_lock = threading.Lock()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name='output-writer', daemon=True)
+        self._thread.start()
+
+    def write(self, record):
+        """ 레코드 1개를 큐에 넣는다 - 넣었으면 True, 버렸으면 False """
+        if self._closed:
+            return False
+        if not self._thread.is_alive():
+            with self._drop_lock:
+                self.dropped += 1
+            return False
+        try:
+            if self.policy == 'block':
+                self._queue.put(record, timeout=self.block_timeout)
+            else:
+                self._queue.put_nowait(record)
+            return True
+        except queue.Full:
+            pass
+        if self.policy == 'drop_oldest':
+            with self._drop_lock:
+                try:
+                    evicted = self._queue.get_nowait()
+                except queue.Empty:
+                    evicted = _WAKE
+                try:
+                    self._queue.put_nowait(record)
+                    if evicted is not _WAKE:  # 깨우기 신호는 레코드가 아니다
+                        self.dropped += 1
+                    return True
+                except queue.Full:
+                    pass
+        with self._drop_lock:
+            self.dropped += 1
+        return False
+
+    def _run(self):
+        batch = []
+        deadline = None
+        while True:
+            if self._controls:
+                control = self._controls.popleft()
+                # 신호 전에 넣은 레코드는 모두 큐에 있다 - 지금 들어 있는 만큼만 꺼내 내보낸다
+                for _ in range(self._queue.qsize()):
+                    try:
+                        item = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if item is not _WAKE:
+                        batch.append(item)
+                        if len(batch) >= self.max_batch:
+                            self._deliver(batch)
+                            batch = []
+                if batch:
+                    self._deliver(batch)
+                    batch = []
+                deadline = None
+                try:
+                    self.sink.flush()
+                except Exception as e:
+                    self._failed(e, 0)
+                control.done.set()
+                if control.stop:
+                    return
+                continue
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+            if item is not None and item is not _WAKE:
+                batch.append(item)
+                if deadline is None:
+                    deadline = time.monotonic() + self.flush_interval
+            if batch and (len(batch) >= self.max_batch or time.monotonic() >= deadline):
+                self._deliver(batch)
+                batch = []
+                deadline = None
+
+    def _deliver(self, batch):
+        try:
+            self.sink.write_batch(batch)
+        except Exception as e:
+            self._failed(e, len(batch))
+
+    def _failed(self, error, lost):
+        """ sink 예외 기록 - 내보내지 못한 레코드는 버린 것으로 센다 """
+        with self._drop_lock:
+            self.errors += 1
+            self.last_error = error
+            self.dropped += lost
+
+    def _signal(self, stop, timeout):
+        """ 쓰기 스레드에 flush/close 신호를 보내고 처리될 때까지 기다린다 (처리됐으면 True) """
+        control = _Control(stop)
+        self._controls.append(control)
+        try:
+            self._queue.put_nowait(_WAKE)  # 큐가 비어 잠든 쓰기 스레드를 깨운다
+        except queue.Full:
+            pass  # 큐가 차 있으면 쓰기 스레드는 깨어 있고 다음 회차에 신호를 본다
+        return control.done.wait(self.control_timeout if timeout is None else timeout)
+
+    def flush(self, timeout=None):
+        """
+        지금까지 넣은 레코드를 모두 내보낼 때까지 기다린다
+        - timeout(기본 control_timeout)초 안에 끝나지 않으면 False
+        """
+        if self._closed or not self._thread.is_alive():
+            return False
+        return self._signal(False, timeout)
+
+    def close(self, timeout=None):
+        if self._closed:
+            return
+        self._closed = True
+        if self._thread.is_alive():
+            self._signal(True, timeout)
+        self.sink.close()
+
+
+class _Control:
+    """ 쓰기 스레드에 보내는 flush/close 신호 """
+
+    __slots__ = ('stop', 'done')
+
+    def __init__(self, stop):
+        self.stop = stop
+        self.done = threading.Event()
+
+
+_WAKE = object()  # 큐에 넣는 깨우기 신호 (레코드가 아니므로 내보내지 않는다)
+
+
+# ----------------------------- 프로세스 공용 기본 출력 -----------------------------
+_default_writers = {}  # 대상 이름 -> (pid, BatchingWriter)
+_default_lock = threading.Lock()
+_DEFAULT_SINKS = {'stdout': StdoutSink, 'stderr': lambda: StdoutSink(sys.stderr),
+                  'binary': BinaryStdoutSink}
+
+
+def default_writer(target='stdout'):
+    """
+    프로세스 공용 BatchingWriter - target: 'stdout'(텍스트), 'stderr'(텍스트),
+    'binary'(표준 출력에 bytes 레코드 - 레코드 스트림용)
+    - fork된 자식 프로세스에서는 쓰기 스레드가 없으므로 처음 호출 시 새로 만든다
+    - multiprocessing 자식은 atexit 없이 종료되므로 종료 처리기(Finalize)도 등록한다
+    """
+    entry = _default_writers.get(target)
+    if entry is not None and entry[0] == os.getpid():
+        return entry[1]
+    from multiprocessing import util  # 스레드 실행만 하는 경우 multiprocessing을 불러오지 않는다
+    with _default_lock:
+        entry = _default_writers.get(target)
+        if entry is None or entry[0] != os.getpid():
+            writer = BatchingWriter(_DEFAULT_SINKS[target]())
+            entry = _default_writers[target] = (os.getpid(), writer)
+            atexit.register(writer.close)
+            util.Finalize(None, writer.close, exitpriority=10)
+        return entry[1]
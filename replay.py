@@ -0,0 +1,269 @@
+# ----------------------------- 모듈 임포트 -----------------------------
+import heapq
+import operator
+import os
+import time
+
+from collector_engine import MetricSource
+from sim_clock import REAL_CLOCK, RealClock
+from telemetry_log import TelemetryLogReader, list_segments
+from telemetry_record import RECORD_MAGIC, RecordSchema, iter_frames
+
+
+CHUNK_RECORDS = 4096  # 한 번에 읽는 레코드 수 (메모리 사용량 = 레코드 크기 x 이 값)
+_HEADER_PROBE = 64 * 1024  # 헤더를 찾으려고 처음에 읽는 바이트 수 (채널 이름 포함 헤더가 이 안에 들어감)
+
+
+# ----------------------------- 청크 단위 읽기 -----------------------------
+def iter_chunks(path, chunk_records=CHUNK_RECORDS, kind=None):
+    """
+    레코드 파일 1개를 chunk_records개씩 읽어 (스키마, numpy 구조 배열)을 생성
+    - 세그먼트: RecordSchema 헤더 + 고정 길이 레코드
+    - 바이너리 출력 캡처: 여러 종류가 섞인 레코드 스트림 (RecordStreamWriter 프레임)
+    - kind를 주면 레코드 스트림에서 다른 종류의 레코드는 모으지 않고 건너뛴다
+    - 파일 전체를 메모리에 올리지 않는다 (종류마다 청크 1개)
+    - 쓰다 만 마지막 레코드는 건너뛴다
+    """
+    with open(path, 'rb') as f:
+        probe = f.read(_HEADER_PROBE)
+        if not probe.startswith(RECORD_MAGIC):
+            f.seek(0)
+            yield from _stream_chunks(f, chunk_records, kind)
+            return
+        schema, offset = RecordSchema.from_header(probe)
+        f.seek(offset)
+        while True:
+            data = f.read(schema.size * chunk_records)
+            count = len(data) // schema.size
+            if not count:
+                return
+            yield schema, schema.unpack_many(data, count=count)
+
+
+def _stream_chunks(f, chunk_records, kind=None):
+    """ 레코드 스트림의 레코드를 종류별로 chunk_records개씩 모아 생성 (종류 안의 순서는 유지) """
+    pending = {}  # 종류 -> (스키마, 레코드 바이트열 목록)
+    for schema, record in iter_frames(f, kind):
+        entry = pending.get(schema.kind)
+        if entry is None or entry[0] != schema:
+            if entry is not None and entry[1]:
+                yield entry[0], entry[0].unpack_many(b''.join(entry[1]))
+            entry = pending[schema.kind] = (schema, [])
+        entry[1].append(record)
+        if len(entry[1]) >= chunk_records:
+            yield schema, schema.unpack_many(b''.join(entry[1]))
+            entry[1].clear()
+    for schema, records in pending.values():
+        if records:
+            yield schema, schema.unpack_many(b''.join(records))
+
+
+def recording_kinds(path):
+    """ 녹화에 들어 있는 수집기 이름 목록 (TelemetryLog 디렉터리 또는 레코드 파일 1개) """
+    if not os.path.isdir(path):
+        with open(path, 'rb') as f:
+            probe = f.read(_HEADER_PROBE)
+            if probe.startswith(RECORD_MAGIC):
+                return [RecordSchema.from_header(probe)[0].kind]
+            f.seek(0)
+            return list(dict.fromkeys(schema.kind for schema, _ in iter_frames(f)))
+    return TelemetryLogReader(path).kinds()
+
+
+def iter_recording(path, kind, chunk_records=CHUNK_RECORDS):
+    """ 녹화에서 수집기 kind의 청크를 세그먼트 순서대로 생성 (디렉터리면 kind-NNNNNN.seg) """
+    paths = list_segments(path, kind) if os.path.isdir(path) else [path]
+    for segment in paths:
+        for schema, records in iter_chunks(segment, chunk_records, kind):
+            if schema.kind == kind:
+                yield schema, records
+
+
+# ----------------------------- 재생 속도 조절 -----------------------------
+class Pacer:
+    """
+    원래 타임스탬프 간격을 speed배로 줄여 기다린다
+    - speed=1.0: 실시간, speed=N: N배속, speed=None: 기다리지 않음 (최대 속도)
+    - start: 첫 레코드를 재생할 벽시계 시각 (여러 프로세스가 같은 값을 쓰면 박자가 맞는다)
+    - clock: 시각/대기를 제공하는 시계 (sim_clock.py - 기본은 실제 시간)
+    """
+
+    def __init__(self, speed=1.0, start=None, clock=REAL_CLOCK):
+        if speed is not None and speed <= 0:
+            raise ValueError('speed는 0보다 커야 합니다 (최대 속도는 None).')
+        self.speed = speed
+        self.start = start
+        self.clock = clock
+        self.origin = None  # 첫 레코드의 원래 타임스탬프
+        self.waited = 0.0
+
+    def wait(self, timestamp):
+        if self.speed is None:
+            return
+        if self.origin is None:
+            self.origin = timestamp
+            if self.start is None:
+                self.start = self.clock.time()
+        delay = self.start + (timestamp - self.origin) / self.speed - self.clock.time()
+        if delay > 0:
+            self.clock.sleep(delay)
+            self.waited += delay
+
+
+# ----------------------------- 재생 시계/수집 플러그인 -----------------------------
+class ReplayClock(RealClock):
+    """ 재생 중인 레코드의 원래 타임스탬프를 돌려주는 시계 (Replayer가 now를 옮긴다) """
+
+    def __init__(self, now=0.0):
+        self.now = now
+
+    def time(self):
+        return self.now
+
+
+class ReplaySource(MetricSource):
+    """
+    녹화된 값을 내보내는 수집 플러그인 - 원래 플러그인(live)의 이름/주기/스키마/출력 서식을 물려받는다
+    - Replayer가 pending에 레코드를 넣고 collect()를 부르면 read()가 그 값을 한 번 돌려준다
+      (넣어 둔 값이 없으면 None - 그 회차는 출력하지 않음)
+    - live에 이력 링 버퍼(history)가 있으면 재생 값도 그대로 쌓는다
+    """
+
+    def __init__(self, live, channels):
+        self.live = live
+        self.name = live.name
+        self.period = live.period
+        self.binary = live.binary
+        self.title = live.title
+        self.display = live.display
+        self.error_label = live.error_label
+        self.schema = tuple(channels)
+        self.history = getattr(live, 'history', None)
+        self.pending = None
+
+    def read(self, now):
+        values, self.pending = self.pending, None
+        if values is not None and self.history is not None:
+            self.history.append(values, now)
+        return values
+
+
+# ----------------------------- Replayer 클래스 -----------------------------
+class Replayer:
+    """
+    녹화(TelemetryLog 디렉터리 또는 레코드 파일)를 MissionComputer들에 다시 흘려 넣는다
+    - computers: CollectorEngine 목록 - 레코드의 instance_id가 같은 인스턴스가 받는다
+      (목록에 없는 instance_id의 레코드는 건너뜀 → 프로세스마다 일부 인스턴스만 맡을 수 있다)
+    - kinds: 재생할 수집기 (기본: 녹화와 인스턴스에 모두 있는 수집기)
+      해당 수집기의 플러그인은 ReplaySource로 바뀌고, 시계는 ReplayClock으로 바뀐다
+      → 버스/로그/분석/출력의 타임스탬프는 녹화의 원래 타임스탬프 그대로
+    - 수집기별 청크 스트림을 타임스탬프 순서로 병합하며, speed로 재생 속도를 정한다 (Pacer)
+      pacer_clock: Pacer가 기다릴 때 쓰는 시계 (VirtualClock이면 실제로 잠들지 않는다)
+    - 재생 중에는 인스턴스의 수집 루프(run_collector)를 돌리지 않는다 (Replayer가 collect()를 부름)
+    """
+
+    def __init__(self, path, computers, kinds=None, speed=1.0, start=None,
+                 chunk_records=CHUNK_RECORDS, pacer_clock=REAL_CLOCK):
+        self.path = path
+        self.computers = {computer.instance_id: computer for computer in computers}
+        available = recording_kinds(path)
+        if kinds is None:
+            kinds = [kind for kind in available
+                     if all(kind in computer.sources for computer in self.computers.values())]
+        self.kinds = tuple(kinds)
+        self.pacer = Pacer(speed, start, pacer_clock)
+        self.chunk_records = chunk_records
+        self.clock = ReplayClock()
+        self.replayed = 0
+        self.skipped = 0
+        self._sources = {}
+        self._attached = set()
+
+    def _attach(self, kind, schema):
+        """ 각 인스턴스의 kind 플러그인을 ReplaySource로 교체 (스키마는 녹화 기준) """
+        self._attached.add(kind)
+        for instance_id, computer in self.computers.items():
+            source = computer.sources[kind]
+            if not isinstance(source, ReplaySource):
+                source = computer.sources[kind] = ReplaySource(source, schema.channels)
+            computer.clock = self.clock
+            self._sources[kind, instance_id] = source
+
+    def _records(self, order, kind):
+        """ (타임스탬프, 수집기 순서, instance_id, 값 dict)를 청크 단위로 풀어서 생성 """
+        wanted = self.computers
+        for schema, records in iter_recording(self.path, kind, self.chunk_records):
+            if kind not in self._attached:
+                self._attach(kind, schema)
+            channels = schema.channels
+            for timestamp, instance_id, values in zip(records['timestamp'].tolist(),
+                                                      records['instance_id'].tolist(),
+                                                      records['values'].tolist()):
+                if instance_id in wanted:
+                    yield timestamp, order, instance_id, dict(zip(channels, values))
+                else:
+                    self.skipped += 1
+
+    def run(self):
+        """ 녹화를 끝까지 재생하고 재생한 레코드 수를 반환 """
+        streams = [self._records(order, kind) for order, kind in enumerate(self.kinds)]
+        pacer, clock, sources, computers = self.pacer, self.clock, self._sources, self.computers
+        before = self.replayed
+        # 타임스탬프만 비교 - 같은 시각이면 수집기 순서(스트림 순서)대로 (heapq.merge는 안정적)
+        for timestamp, order, instance_id, values in heapq.merge(*streams,
+                                                                 key=operator.itemgetter(0)):
+            pacer.wait(timestamp)
+            kind = self.kinds[order]
+            sources[kind, instance_id].pending = values
+            clock.now = timestamp
+            computers[instance_id].collect(kind)
+            self.replayed += 1
+        return self.replayed - before
+
+
+# ----------------------------- 프로세스 분할 재생 -----------------------------
+def _replay_shard(path, factory, instance_ids, kinds, speed, start, chunk_records, clock):
+    """ 작업 프로세스 1개: instance_ids의 인스턴스를 만들어 자기 몫의 레코드만 재생 """
+    replayer = Replayer(path, [factory(instance_id) for instance_id in instance_ids], kinds,
+                        speed, start, chunk_records, clock)
+    began = time.perf_counter()
+    replayed = replayer.run()
+    return {
+        'instances': len(instance_ids),
+        'replayed': replayed,
+        'wall_s': time.perf_counter() - began,
+        'waited_s': replayer.pacer.waited,
+    }
+
+
+def run_replay(path, factory, instance_ids, workers=None, kinds=None, speed=1.0, lead=0.5,
+               chunk_records=CHUNK_RECORDS, clock=REAL_CLOCK):
+    """
+    녹화를 여러 작업 프로세스에서 병렬로 재생 (운영 규모 부하를 그대로 재현)
+    - factory(instance_id): 인스턴스 1개를 만드는 피클링 가능한 함수
+      (예: mars_mission_computerz34er0.MissionComputer, functools.partial(...))
+    - instance_ids를 작업 프로세스 수만큼 나누고, 각 프로세스는 녹화 전체를 읽되 자기 몫만 재생
+    - 모든 프로세스가 같은 벽시계 시작 시각(지금 + lead초)을 써서 녹화의 박자를 함께 맞춘다
+      (clock: 시작 시각과 Pacer 대기에 쓰는 시계 - 작업 프로세스로 피클링된다)
+    - 반환값: 요약 딕셔너리 (재생한 레코드 수, 초당 레코드 수, 작업 프로세스별 결과)
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    instance_ids = list(instance_ids)
+    workers = max(1, min(workers or os.cpu_count() or 1, len(instance_ids)))
+    start = clock.time() + lead if speed is not None else None
+    began = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_replay_shard, path, factory, instance_ids[shard::workers], kinds,
+                               speed, start, chunk_records, clock)
+                   for shard in range(workers)]
+        shards = [future.result() for future in futures]
+    wall = time.perf_counter() - began
+    replayed = sum(shard['replayed'] for shard in shards)
+    return {
+        'instances': len(instance_ids),
+        'workers': workers,
+        'replayed': replayed,
+        'wall_s': wall,
+        'records_per_s': replayed / wall if wall > 0 else None,
+        'shards': shards,
+    }
@@ -0,0 +1,252 @@
+# ----------------------------- 모듈 임포트 -----------------------------
+import numpy as np
+
+from telemetry_index import resolve_instance_id
+
+
+SOL_SECONDS = 88_775.244  # 화성 태양일 1솔 (초)
+
+# (단계 이름, 구간 길이(초), 보존 기간(초))
+# - 원시 샘플은 SensorHistory 용량이나 TelemetryLog max_bytes만큼만 남고,
+#   그보다 오래된 구간은 아래 단계의 요약으로만 조회한다
+# - 슬롯은 인스턴스마다 미리 잡으므로 메모리 = 인스턴스 수 x 슬롯 합계(378) x (채널 수 x 20 + 12)바이트
+#   (채널 6개면 인스턴스당 약 50KB) - 더 길게 보존하려면 tiers를 직접 넘긴다
+DEFAULT_TIERS = (
+    ('1min', 60.0, 2 * 3600.0),               # 2시간
+    ('1h', 3600.0, 7 * 86400.0),              # 7일
+    ('1sol', SOL_SECONDS, 90 * SOL_SECONDS),   # 90솔
+)
+
+
+# ----------------------------- RollupTier 클래스 -----------------------------
+class RollupTier:
+    """
+    해상도 1단계의 요약 저장소 (인스턴스 행 x 구간 슬롯 x 채널)
+    - 구간 번호 = floor(타임스탬프 / period), 슬롯 = 구간 번호 % slots
+      → 보존 기간이 지난 구간은 새 구간이 같은 슬롯을 덮어써서 자동으로 사라진다
+    - 열린(진행 중인) 구간은 float64로 누적하고, 닫힐 때 슬롯에 기록한다
+    - 슬롯 값: count, min/max/last (float32), sum (float64)
+    """
+
+    def __init__(self, name, period, retention, nchannels, capacity):
+        self.name = name
+        self.period = float(period)
+        self.retention = float(retention)
+        self.slots = max(1, int(np.ceil(retention / period)))
+        self.nchannels = nchannels
+        self.late = 0  # 이미 닫힌 구간에 늦게 도착해 버린 샘플 수
+        self._allocate(capacity)
+
+    def _allocate(self, capacity):
+        nch = self.nchannels
+        old = getattr(self, 'open_bucket', None)
+        arrays = {
+            'open_bucket': np.full(capacity, -1, dtype=np.int64),
+            'open_count': np.zeros(capacity, dtype=np.int64),
+            'open_min': np.full((capacity, nch), np.inf),
+            'open_max': np.full((capacity, nch), -np.inf),
+            'open_sum': np.zeros((capacity, nch)),
+            'open_last': np.zeros((capacity, nch)),
+            'bucket': np.full((capacity, self.slots), -1, dtype=np.int64),
+            'count': np.zeros((capacity, self.slots), dtype=np.int32),
+            'min': np.zeros((capacity, self.slots, nch), dtype=np.float32),
+            'max': np.zeros((capacity, self.slots, nch), dtype=np.float32),
+            'sum': np.zeros((capacity, self.slots, nch)),
+            'last': np.zeros((capacity, self.slots, nch), dtype=np.float32),
+        }
+        for name, array in arrays.items():
+            if old is not None:
+                previous = getattr(self, name)
+                array[:len(previous)] = previous
+            setattr(self, name, array)
+
+    @property
+    def capacity(self):
+        return len(self.open_bucket)
+
+    @property
+    def nbytes(self):
+        return sum(getattr(self, name).nbytes for name in (
+            'open_bucket', 'open_count', 'open_min', 'open_max', 'open_sum', 'open_last',
+            'bucket', 'count', 'min', 'max', 'sum', 'last'))
+
+    def _close(self, rows):
+        buckets = self.open_bucket[rows]
+        slots = buckets % self.slots
+        self.bucket[rows, slots] = buckets
+        self.count[rows, slots] = self.open_count[rows]
+        self.min[rows, slots] = self.open_min[rows]
+        self.max[rows, slots] = self.open_max[rows]
+        self.sum[rows, slots] = self.open_sum[rows]
+        self.last[rows, slots] = self.open_last[rows]
+
+    def update(self, rows, x, timestamp):
+        """ 같은 시각의 샘플 묶음 반영 (rows: 행 번호 배열, x: shape (n, 채널 수)) """
+        bucket = int(timestamp // self.period)
+        current = self.open_bucket[rows]
+        late = bucket < current
+        if late.any():
+            self.late += int(late.sum())
+            rows, x, current = rows[~late], x[~late], current[~late]
+        roll = current != bucket
+        if roll.any():
+            closing = rows[roll & (current >= 0)]
+            if len(closing):
+                self._close(closing)
+            starting = rows[roll]
+            self.open_bucket[starting] = bucket
+            self.open_count[starting] = 0
+            self.open_min[starting] = np.inf
+            self.open_max[starting] = -np.inf
+            self.open_sum[starting] = 0.0
+        self.open_count[rows] += 1
+        self.open_min[rows] = np.minimum(self.open_min[rows], x)
+        self.open_max[rows] = np.maximum(self.open_max[rows], x)
+        self.open_sum[rows] += x
+        self.open_last[rows] = x
+
+    def oldest_time(self, row):
+        """ 이 단계에 아직 남아 있는 가장 오래된 구간의 시작 시각 """
+        current = self.open_bucket[row]
+        if current < 0:
+            return None
+        numbers = self.bucket[row]
+        kept = numbers[(numbers > current - self.slots) & (numbers >= 0)]  # 빈 슬롯(-1) 제외
+        return float((kept.min() if len(kept) else current) * self.period)
+
+    def buckets(self, row, column, start_time, end_time):
+        """ 구간 [start_time, end_time]과 겹치는 구간 요약 (시간 순, 열린 구간 포함) """
+        lo = int(start_time // self.period)
+        hi = int(end_time // self.period)
+        current = int(self.open_bucket[row])
+        numbers = self.bucket[row]
+        mask = (numbers >= lo) & (numbers <= hi) & (numbers > current - self.slots) & (numbers >= 0)
+        order = np.argsort(numbers[mask])
+        picked = np.flatnonzero(mask)[order]
+        result = {
+            'start': numbers[picked] * self.period,
+            'count': self.count[row, picked].astype(np.int64),
+            'min': self.min[row, picked, column].astype(np.float64),
+            'max': self.max[row, picked, column].astype(np.float64),
+            'sum': self.sum[row, picked, column],
+            'last': self.last[row, picked, column].astype(np.float64),
+        }
+        if current >= 0 and lo <= current <= hi:
+            open_values = {
+                'start': current * self.period,
+                'count': self.open_count[row],
+                'min': self.open_min[row, column],
+                'max': self.open_max[row, column],
+                'sum': self.open_sum[row, column],
+                'last': self.open_last[row, column],
+            }
+            result = {key: np.append(value, open_values[key]) for key, value in result.items()}
+        with np.errstate(divide='ignore', invalid='ignore'):
+            result['mean'] = result['sum'] / result['count']
+        return result
+
+
+# ----------------------------- RollupStore 클래스 -----------------------------
+class RollupStore:
+    """ 수집기 한 종류의 단계별 요약 (인스턴스 ID -> 행 번호는 모든 단계가 공유) """
+
+    def __init__(self, channels, tiers=DEFAULT_TIERS, capacity=16):
+        self.channels = tuple(channels)
+        self.tiers = [RollupTier(name, period, retention, len(self.channels), capacity)
+                      for name, period, retention in tiers]
+        self._rows = {}
+
+    def rows(self, instance_ids):
+        rows = self._rows
+        missing = [i for i in instance_ids if i not in rows]
+        if missing:
+            for instance_id in missing:
+                rows.setdefault(instance_id, len(rows))
+            capacity = self.tiers[0].capacity
+            if len(rows) > capacity:
+                for tier in self.tiers:
+                    tier._allocate(max(len(rows), capacity * 2))
+        return np.fromiter(map(rows.__getitem__, instance_ids), dtype=np.int64,
+                           count=len(instance_ids))
+
+    def update(self, instance_ids, values, timestamp):
+        instance_ids = (instance_ids.tolist() if isinstance(instance_ids, np.ndarray)
+                        else [int(i) for i in instance_ids])
+        rows = self.rows(instance_ids)
+        x = np.asarray(values, dtype=np.float64).reshape(len(rows), len(self.channels))
+        for tier in self.tiers:
+            tier.update(rows, x, timestamp)
+
+
+# ----------------------------- RollupEngine 클래스 -----------------------------
+class RollupEngine:
+    """
+    load/sensor 샘플을 받는 즉시 1분/1시간/1솔 요약(min/max/mean/count/last)으로 누적
+    - MissionComputer.rollup에 연결하면 _publish()에서 샘플마다 observe()가 불린다
+    - Fleet(rollup=...)이면 인스턴스 묶음 단위로 update()가 불린다
+    - query()/aggregate()는 원시 샘플 대신 요약 구간만 읽는다
+    - specs: {수집기: 채널 목록}, tiers: (이름, 구간 길이, 보존 기간) 목록
+    """
+
+    def __init__(self, specs, tiers=DEFAULT_TIERS):
+        self.stores = {collector: RollupStore(channels, tiers)
+                       for collector, channels in specs.items()}
+
+    @property
+    def nbytes(self):
+        return sum(tier.nbytes for store in self.stores.values() for tier in store.tiers)
+
+    def update(self, collector, instance_ids, values, timestamp):
+        store = self.stores.get(collector)
+        if store is not None:
+            store.update(instance_ids, values, timestamp)
+
+    def observe(self, collector, instance_id, record, timestamp):
+        """ 레코드(dict) 1개 반영 - 채널 이름으로 값을 고른다 """
+        store = self.stores.get(collector)
+        if store is not None:
+            store.update([instance_id], [[record[channel] for channel in store.channels]],
+                         timestamp)
+
+    def _tier(self, store, row, start_time, tier):
+        if tier is not None:
+            for candidate in store.tiers:
+                if candidate.name == tier:
+                    return candidate
+            raise KeyError(f'알 수 없는 단계: {tier}')
+        # start_time까지 남아 있는 가장 고운 단계 (없으면 가장 거친 단계)
+        for candidate in store.tiers:
+            oldest = candidate.oldest_time(row)
+            if oldest is not None and oldest <= start_time:
+                return candidate
+        return store.tiers[-1]
+
+    def query(self, collector, instance, channel, start_time, end_time, tier=None):
+        """
+        구간의 요약 구간 목록 {'tier', 'start', 'count', 'min', 'max', 'mean', 'sum', 'last'}
+        - instance: 숫자 ID 또는 MissionComputer 객체
+        - tier를 주지 않으면 start_time까지 보존된 가장 고운 해상도를 고른다
+        """
+        store = self.stores[collector]
+        row = store._rows[resolve_instance_id(instance)]
+        chosen = self._tier(store, row, start_time, tier)
+        result = chosen.buckets(row, store.channels.index(channel), start_time, end_time)
+        result['tier'] = chosen.name
+        return result
+
+    def aggregate(self, collector, instance, channel, start_time, end_time, tier=None):
+        """ 구간 전체 집계 {'tier', 'count', 'min', 'max', 'mean', 'last'} (구간 단위로 포함) """
+        result = self.query(collector, instance, channel, start_time, end_time, tier)
+        counts = result['count']
+        total = int(counts.sum())
+        if total == 0:
+            return {'tier': result['tier'], 'count': 0, 'min': None, 'max': None,
+                    'mean': None, 'last': None}
+        return {
+            'tier': result['tier'],
+            'count': total,
+            'min': float(result['min'].min()),
+            'max': float(result['max'].max()),
+            'mean': float(result['sum'].sum() / total),
+            'last': float(result['last'][-1]),
+        }
@@ -0,0 +1,124 @@
+# ----------------------------- 모듈 임포트 -----------------------------
+import time
+
+import numpy as np
+
+from ts_codec import encode_block
+
+
+# ----------------------------- SensorHistory 클래스 -----------------------------
+class SensorHistory:
+    """
+    고정 용량 링 버퍼 형태의 센서 이력 저장소
+    - 채널마다 미리 할당한 타입 배열 1개 + 타임스탬프 배열 1개 (열 단위 저장)
+    - append()는 O(1)이며 샘플마다 딕셔너리를 새로 만들지 않는다
+    - 용량을 넘으면 가장 오래된 샘플부터 덮어쓴다
+    """
+
+    def __init__(self, channels, capacity, dtype=np.float32):
+        if capacity <= 0:
+            raise ValueError('capacity는 1 이상이어야 합니다.')
+        self.channels = tuple(channels)
+        self.capacity = capacity
+        self._index = {channel: row for row, channel in enumerate(self.channels)}
+        self._values = np.zeros((len(self.channels), capacity), dtype=dtype)
+        self._timestamps = np.zeros(capacity, dtype=np.float64)
+        self._head = 0    # 다음에 쓸 위치
+        self._size = 0    # 현재 저장된 샘플 수
+
+    def __len__(self):
+        return self._size
+
+    @property
+    def nbytes(self):
+        """ 버퍼가 차지하는 메모리 (바이트) """
+        return self._values.nbytes + self._timestamps.nbytes
+
+    def append(self, values, timestamp=None):
+        """ 샘플 1개 추가 (values: 채널 이름 -> 값 매핑) """
+        head = self._head
+        self._timestamps[head] = time.time() if timestamp is None else timestamp
+        for channel, row in self._index.items():
+            self._values[row, head] = values[channel]
+        self._head = (head + 1) % self.capacity
+        if self._size < self.capacity:
+            self._size += 1
+
+    def extend(self, block, timestamps):
+        """
+        여러 샘플을 한 번에 추가
+        - block: shape (채널 수, n) 배열 (DummySensor.generate() 결과와 같은 형태)
+        - timestamps: 길이 n 배열
+        """
+        timestamps = np.asarray(timestamps, dtype=np.float64)
+        n = len(timestamps)
+        if n > self.capacity:
+            # 용량보다 많으면 마지막 capacity개만 의미가 있다
+            block = block[:, n - self.capacity:]
+            timestamps = timestamps[n - self.capacity:]
+            n = self.capacity
+        first = min(n, self.capacity - self._head)
+        self._values[:, self._head:self._head + first] = block[:, :first]
+        self._timestamps[self._head:self._head + first] = timestamps[:first]
+        if first < n:
+            self._values[:, :n - first] = block[:, first:]
+            self._timestamps[:n - first] = timestamps[first:]
+        self._head = (self._head + n) % self.capacity
+        self._size = min(self._size + n, self.capacity)
+
+    def _ordered(self, start, stop):
+        """ 오래된 순서 기준 [start, stop) 구간을 (timestamps, values)로 반환 """
+        oldest = (self._head - self._size) % self.capacity
+        idx = (oldest + np.arange(start, stop)) % self.capacity
+        return self._timestamps[idx], self._values[:, idx]
+
+    def last(self, n):
+        """ 가장 최근 n개 샘플을 (timestamps, values) 형태로 반환 (오래된 순) """
+        n = min(n, self._size)
+        return self._ordered(self._size - n, self._size)
+
+    def between(self, start_time, end_time):
+        """ start_time <= t <= end_time 인 샘플을 (timestamps, values)로 반환 """
+        timestamps, _ = self._ordered(0, self._size)
+        lo = int(np.searchsorted(timestamps, start_time, side='left'))
+        hi = int(np.searchsorted(timestamps, end_time, side='right'))
+        return self._ordered(lo, hi)
+
+    def stats(self, channel, last=None, start_time=None, end_time=None):
+        """
+        채널 하나의 min/max/mean 요약
+        - last를 주면 최근 last개, start_time/end_time을 주면 해당 시간 구간
+        - 둘 다 없으면 버퍼 전체
+        """
+        if last is not None:
+            _, values = self.last(last)
+        elif start_time is not None or end_time is not None:
+            _, values = self.between(
+                -np.inf if start_time is None else start_time,
+                np.inf if end_time is None else end_time,
+            )
+        else:
+            _, values = self.last(self._size)
+        column = values[self._index[channel]]
+        if column.size == 0:
+            return {'count': 0, 'min': None, 'max': None, 'mean': None}
+        return {
+            'count': int(column.size),
+            'min': float(column.min()),
+            'max': float(column.max()),
+            'mean': float(column.mean(dtype=np.float64)),
+        }
+
+    def encode(self, start_time=None, end_time=None, digits=None):
+        """
+        저장된 샘플(또는 시간 구간)을 ts_codec 블록으로 압축
+        - 복원: timestamps, block = decode_block(data); history.extend(block, timestamps)
+        """
+        if start_time is None and end_time is None:
+            timestamps, values = self.last(self._size)
+        else:
+            timestamps, values = self.between(
+                -np.inf if start_time is None else start_time,
+                np.inf if end_time is None else end_time,
+            )
+        return encode_block(timestamps, values, digits=digits)
@@ -0,0 +1,157 @@
+# ----------------------------- 모듈 임포트 -----------------------------
+import numpy as np
+
+
+SOL_SECONDS = 88775.0  # 화성 1솔 (초)
+
+
+# ----------------------------- SensorSimulator 클래스 -----------------------------
+class SensorSimulator:
+    """
+    여러 기지의 상관된 센서 값을 한 번에 진행시키는 시뮬레이터
+    - 상태는 (인스턴스 수, 채널 수) 배열이고, advance()는 지정한 행 전체를 NumPy 연산으로 진행
+    - 채널마다 평형값으로 되돌아가는 랜덤 워크 (Ornstein-Uhlenbeck 과정, 정확한 이산화라
+      주기와 무관하게 같은 통계를 낸다)
+    - 일주기: 평형값 + 진폭 * cos(2π(현지 시각 - 최고점 시각)), 기지마다 경도(현지 시각)가 다름
+    - 결합: 대상 채널의 평형값이 gain * (원인 채널 값 - 원인 채널 평형값)만큼 움직임
+    - 상관: 채널 사이 잡음의 상관계수 (예: 승무원 호흡으로 CO2 증가와 O2 감소가 함께 일어남)
+    - 값은 채널 범위로 자르며, seed가 같고 advance() 호출 순서가 같으면 같은 값이 재현됨
+
+    channels: (채널 이름, 최솟값, 최댓값, 반올림 자릿수) 목록 (SENSOR_CHANNELS 형식)
+    model: {채널: (평형값, 완화 시간(초), 정상 상태 표준편차, 일주기 진폭, 최고점 시각(솔 비율))}
+    coupling: {(대상 채널, 원인 채널): gain}
+    correlation: {(채널, 채널): 잡음 상관계수}
+    """
+
+    def __init__(self, channels, model, coupling=None, correlation=None, count=1, seed=None,
+                 start=0.0, sol=SOL_SECONDS):
+        self.channels = tuple(channels)
+        self.keys = tuple(channel[0] for channel in self.channels)
+        index = {key: column for column, key in enumerate(self.keys)}
+        params = np.array([model[key] for key in self.keys], dtype=np.float64)
+        self.mean, self.tau, self.noise, amplitude, peak = params.T
+        self.low = np.array([channel[1] for channel in self.channels], dtype=np.float64)
+        self.high = np.array([channel[2] for channel in self.channels], dtype=np.float64)
+        self.scale = np.array([10.0 ** channel[3] for channel in self.channels])
+        self.sol = sol
+
+        # 일주기가 있는 채널만 cos를 계산한다
+        self._diurnal = np.flatnonzero(amplitude)
+        self._amplitude = amplitude[self._diurnal]
+        self._peak = peak[self._diurnal]
+
+        self._gain = np.zeros((len(self.keys), len(self.keys)))
+        for (target, source), gain in (coupling or {}).items():
+            self._gain[index[target], index[source]] = gain
+        self._coupled = bool(self._gain.any())
+
+        # 상관이 있는 채널끼리만 섞는다 (독립 잡음[:, _mixed] @ _mix → 상관 잡음)
+        self._mixed = np.array(sorted({index[key] for pair in (correlation or {})
+                                       for key in pair}), dtype=np.intp)
+        position = {column: i for i, column in enumerate(self._mixed.tolist())}
+        correlation_matrix = np.eye(len(self._mixed))
+        for (first, second), rho in (correlation or {}).items():
+            i, j = position[index[first]], position[index[second]]
+            correlation_matrix[i, j] = correlation_matrix[j, i] = rho
+        try:
+            self._mix = np.linalg.cholesky(correlation_matrix).T
+        except np.linalg.LinAlgError:
+            raise ValueError('잡음 상관계수 행렬이 양의 정부호가 아닙니다.') from None
+
+        self.rng = np.random.default_rng(seed)
+        self.longitude = self.rng.random(count)  # 현지 시각 차이 (솔 비율)
+        self.time = np.full(count, float(start))
+        self.state = np.empty((count, len(self.keys)))
+        equilibrium = self._equilibrium(slice(None), float(start))
+        self.state[:] = equilibrium + self._innovations(count) * self.noise
+        np.clip(self.state, self.low, self.high, out=self.state)
+
+    def __len__(self):
+        return len(self.state)
+
+    def _innovations(self, rows):
+        noise = self.rng.standard_normal((rows, len(self.keys)))
+        if len(self._mixed):
+            noise[:, self._mixed] = noise[:, self._mixed] @ self._mix
+        return noise
+
+    def _equilibrium(self, rows, now):
+        """ 행별 평형값: 기본 평형값 + 일주기 (결합 항 제외) """
+        count = len(self.longitude[rows])
+        equilibrium = np.empty((count, len(self.keys)))
+        equilibrium[:] = self.mean
+        if len(self._diurnal):
+            local = now / self.sol + self.longitude[rows]
+            equilibrium[:, self._diurnal] += self._amplitude * np.cos(
+                2 * np.pi * (local[:, None] - self._peak))
+        return equilibrium
+
+    def advance(self, rows, now):
+        """
+        rows(행 번호 배열, None이면 전체)를 각자의 마지막 시각에서 now까지 진행
+        - 반환: 진행한 행의 상태 (rows=None이면 상태 배열 자체, 그 밖에는 복사본)
+        """
+        selected = slice(None) if rows is None else rows
+        state = self.state[selected]
+        dt = now - self.time[selected]
+        target = self._equilibrium(selected, now)
+        if self._coupled:
+            target += (state - self.mean) @ self._gain.T
+        if len(dt) and (dt == dt[0]).all():  # 보통은 같은 묶음의 행이 같은 시각에 수집됨
+            decay = np.exp(-max(float(dt[0]), 0.0) / self.tau)
+        else:
+            decay = np.exp(-np.maximum(dt, 0.0)[:, None] / self.tau)
+        spread = self.noise * np.sqrt(1.0 - decay * decay)
+        state -= target
+        state *= decay
+        state += target
+        state += self._innovations(len(state)) * spread
+        np.clip(state, self.low, self.high, out=state)
+        if rows is not None:
+            self.state[rows] = state
+        self.time[selected] = now
+        return state
+
+    def step(self, dt):
+        """ 모든 인스턴스를 dt초 진행 (벤치마크/일괄 생성용) """
+        return self.advance(None, float(self.time.max()) + dt)
+
+    def rounded(self, values):
+        """ 채널별 반올림 자릿수로 반올림한 복사본 """
+        return np.rint(values * self.scale) / self.scale
+
+    def sensor(self, index, dt=None):
+        """ 인스턴스 1개를 DummySensor/MetricSource처럼 읽는 SimulatedSensor """
+        return SimulatedSensor(self, index, dt)
+
+
+# ----------------------------- SimulatedSensor 클래스 -----------------------------
+class SimulatedSensor:
+    """
+    SensorSimulator의 인스턴스 1개
+    - set_env()/get_env(): DummySensor와 같은 사용법 (DummySensorSource에 그대로 연결)
+      set_env(now)에 시각을 주지 않으면 dt초씩 진행, 새 딕셔너리로 통째로 교체 (DummySensor 참고)
+    - read(now): SimulatedSource(simulator=...)용 - now까지 진행 후 값 반환
+    """
+
+    def __init__(self, simulator, index, dt=None):
+        self.simulator = simulator
+        self.index = index
+        self.dt = dt
+        self._rows = np.array([index])
+        self.env_values = dict(zip(simulator.keys, simulator.rounded(simulator.state[index])
+                                   .tolist()))
+
+    def set_env(self, now=None):
+        simulator = self.simulator
+        if now is None:
+            now = float(simulator.time[self.index]) + (self.dt or 1.0)
+        values = simulator.rounded(simulator.advance(self._rows, now)[0]).tolist()
+        self.env_values = dict(zip(simulator.keys, values))
+
+    def get_env(self):
+        return self.env_values
+
+    def read(self, now):
+        self.set_env(now)
+        return self.env_values
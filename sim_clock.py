@@ -0,0 +1,139 @@
+# ----------------------------- 모듈 임포트 -----------------------------
+import heapq
+import threading
+import time
+
+
+# ----------------------------- 시계(Clock) -----------------------------
+class RealClock:
+    """ 실제 시간 - time.time()/time.sleep() 그대로 """
+
+    def time(self):
+        return time.time()
+
+    def sleep(self, seconds):
+        time.sleep(seconds)
+
+    def strftime(self, fmt='%Y-%m-%d %H:%M:%S', timestamp=None):
+        """ time.strftime()과 같지만 이 시계의 시각(또는 주어진 timestamp)을 쓴다 """
+        return time.strftime(fmt, time.localtime(self.time() if timestamp is None else timestamp))
+
+
+class ScaledClock(RealClock):
+    """
+    배속 시간 - 실제 1초가 시뮬레이션 scale초
+    - sleep(5)는 실제로 5 / scale초만 잔다
+    - start를 주면 그 시각부터 시뮬레이션 시간이 흐른다 (기본: 현재 시각)
+    """
+
+    def __init__(self, scale, start=None):
+        if scale <= 0:
+            raise ValueError('scale은 0보다 커야 합니다.')
+        self.scale = scale
+        self.start = time.time() if start is None else start
+        self._origin = time.perf_counter()
+
+    def time(self):
+        return self.start + (time.perf_counter() - self._origin) * self.scale
+
+    def sleep(self, seconds):
+        time.sleep(seconds / self.scale)
+
+
+class VirtualClock(RealClock):
+    """
+    이산 사건(discrete-event) 시간 - 실제로 잠들지 않고 최대한 빨리 진행
+    - 여러 스레드가 sleep()을 부르면 한 번에 한 스레드만 실행되도록 하고,
+      모든 참여 스레드가 잠든 순간 가장 이른 깨어날 시각으로 시간을 건너뛴다
+    - 같은 시각에 깨어날 스레드는 스레드 이름 순서대로 하나씩 깨운다 (실행마다 같은 순서)
+    - until 시각을 넘어서 자려는 스레드는 SystemExit로 조용히 종료된다
+      (threading은 SystemExit를 무시하고, 프로세스는 정상 종료한다)
+    - participants(참여 스레드 수)를 주면 그 수만큼 모두 잠들 때까지 시간을 멈춰 두므로
+      시작 직후 늦게 뜬 스레드도 같은 시각에서 출발한다
+    - 스레드 없이 쓰려면 run_simulation()을 사용 (완전히 결정적)
+    """
+
+    def __init__(self, start=0.0, until=None, participants=None):
+        self.now = float(start)
+        self.until = until
+        self.participants = participants
+        self._cond = threading.Condition()
+        self._waiting = []   # (깨어날 시각, 스레드 이름, 순번, 스레드 ID)
+        self._seq = 0
+        self._running = set()
+        self._released = set()
+
+    def __getstate__(self):
+        # 잠금/대기 상태는 프로세스마다 새로 만든다
+        return {'now': self.now, 'until': self.until, 'participants': self.participants}
+
+    def __setstate__(self, state):
+        self.__init__(state['now'], state['until'], state['participants'])
+
+    def time(self):
+        return self.now
+
+    def advance_to(self, when):
+        """ 단일 스레드 시뮬레이션에서 시간을 직접 옮긴다 """
+        if when < self.now:
+            raise ValueError('시간을 거꾸로 돌릴 수 없습니다.')
+        self.now = when
+
+    def _release_next(self):
+        """ 실행 중인 스레드가 없으면 가장 이른 대기 스레드를 깨운다 (잠금 보유 상태) """
+        if self._running or not self._waiting:
+            return
+        if self.participants is not None and len(self._waiting) < self.participants:
+            return  # 아직 첫 sleep()에 도달하지 않은 참여 스레드가 있다
+        wake, _, _, ident = heapq.heappop(self._waiting)
+        self.now = max(self.now, wake)
+        self._running.add(ident)
+        self._released.add(ident)
+        self._cond.notify_all()
+
+    def sleep(self, seconds):
+        me = threading.get_ident()
+        with self._cond:
+            self._running.discard(me)
+            wake = self.now + seconds
+            if self.until is not None and wake > self.until:
+                if self.participants is not None:
+                    self.participants -= 1
+                self._release_next()
+                raise SystemExit
+            heapq.heappush(self._waiting, (wake, threading.current_thread().name, self._seq, me))
+            self._seq += 1
+            self._release_next()
+            while me not in self._released:
+                self._cond.wait()
+            self._released.discard(me)
+
+
+def run_simulation(computers, clock, duration):
+    """
+    스레드 없이 computers의 수집 작업을 VirtualClock 위에서 duration초 분량 실행
+    - 각 인스턴스의 collector_jobs()를 힙으로 스케줄 (시각, 인스턴스 순서, 작업 순서)
+    - 실제 대기가 없으므로 24시간 분량도 수집 작업 실행 시간만큼만 걸린다
+    - 반환값: 실행한 작업 수
+    """
+    start = clock.time()
+    end = start + duration
+    heap = []
+    for index, computer in enumerate(computers):
+        for job_index, (_, step, period, _) in enumerate(computer.collector_jobs()):
+            heapq.heappush(heap, (start, index, job_index, period, step))
+    executed = 0
+    while heap:
+        due, index, job_index, period, step = heapq.heappop(heap)
+        if due >= end:
+            break
+        clock.advance_to(due)
+        step()
+        executed += 1
+        heapq.heappush(heap, (due + period, index, job_index, period, step))
+    clock.advance_to(max(clock.time(), end))
+    return executed
+
+
+# 기본 시계 (프로세스 공용)
+REAL_CLOCK = RealClock()
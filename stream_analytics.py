@@ -0,0 +1,263 @@
+# ----------------------------- 모듈 임포트 -----------------------------
+import numpy as np
+
+
+WINDOW = 720      # 슬라이딩 윈도 샘플 수 (5초 주기 1시간)
+BUCKETS = 64      # 윈도 히스토그램 구간 수 (채널 범위를 균등 분할)
+EWMA_ALPHA = 0.05
+Z_THRESHOLD = 4.0
+MIN_COUNT = 30    # z-점수 판정 전 최소 샘플 수
+
+
+# ----------------------------- Anomaly 클래스 -----------------------------
+class Anomaly:
+    """
+    감지된 이상 1건
+    - kind: 'high'/'low'(임계값 진입) 또는 'zscore'
+    - limit: 넘은 임계값 또는 z-점수
+    """
+
+    __slots__ = ('timestamp', 'instance_id', 'collector', 'channel', 'kind', 'value', 'limit')
+
+    def __init__(self, timestamp, instance_id, collector, channel, kind, value, limit):
+        self.timestamp = timestamp
+        self.instance_id = instance_id
+        self.collector = collector
+        self.channel = channel
+        self.kind = kind
+        self.value = value
+        self.limit = limit
+
+    def describe(self):
+        if self.kind == 'zscore':
+            return (f'[경보] instance={self.instance_id} {self.channel}={self.value} '
+                    f'(z={self.limit:+.1f})')
+        sign = '>' if self.kind == 'high' else '<'
+        return f'[경보] instance={self.instance_id} {self.channel}={self.value} {sign} {self.limit}'
+
+    def __repr__(self):
+        return (f'Anomaly({self.collector}/{self.channel}, instance={self.instance_id}, '
+                f'{self.kind}, value={self.value})')
+
+
+# ----------------------------- ChannelDetector 클래스 -----------------------------
+class ChannelDetector:
+    """
+    수집기 한 종류의 채널별 스트리밍 통계와 이상 감지
+    - 인스턴스마다 채널별 Welford 평균/분산, EWMA 평균/분산,
+      최근 window개 샘플의 히스토그램(구간 buckets개)을 배열 행 1개로 유지
+    - 샘플 1개당 비용은 채널 수에 비례하는 상수, 메모리는 인스턴스당
+      window * 채널 수 바이트 + buckets * 채널 수 * 4바이트로 고정
+    - 임계값은 범위를 벗어나는 순간에만 1번 알리고(복귀 후 다시 벗어나면 또 알림),
+      z-점수는 그 샘플을 반영하기 전의 평균/표준편차로 판정한다
+    - ranges: {채널: (하한, 상한)} 히스토그램 범위 (벗어난 값은 양 끝 구간에 넣음)
+    - thresholds: {채널: (하한 또는 None, 상한 또는 None)}
+    """
+
+    def __init__(self, collector, channels, ranges, thresholds=None, window=WINDOW,
+                 buckets=BUCKETS, alpha=EWMA_ALPHA, z_threshold=Z_THRESHOLD,
+                 min_count=MIN_COUNT, capacity=16):
+        if buckets > 256:
+            raise ValueError('buckets는 256 이하여야 합니다.')
+        thresholds = thresholds or {}
+        self.collector = collector
+        self.channels = tuple(channels)
+        self.window = window
+        self.buckets = buckets
+        self.alpha = alpha
+        self.z_threshold = z_threshold
+        self.min_count = min_count
+        self.low = np.array([ranges[c][0] for c in self.channels], dtype=np.float64)
+        self.high = np.array([ranges[c][1] for c in self.channels], dtype=np.float64)
+        self.limit_low = np.array([(thresholds.get(c) or (None, None))[0] for c in self.channels],
+                                  dtype=np.float64)  # None -> nan (비교하면 항상 False)
+        self.limit_high = np.array([(thresholds.get(c) or (None, None))[1] for c in self.channels],
+                                   dtype=np.float64)
+        self._rows = {}  # instance_id -> 행 번호
+        self._allocate(capacity)
+
+    def _allocate(self, capacity):
+        nch = len(self.channels)
+        old = getattr(self, 'count', None)
+        arrays = {
+            'count': np.zeros(capacity, dtype=np.int64),
+            'mean': np.zeros((capacity, nch)),
+            'm2': np.zeros((capacity, nch)),
+            'ewma': np.zeros((capacity, nch)),
+            'ewvar': np.zeros((capacity, nch)),
+            'active_low': np.zeros((capacity, nch), dtype=bool),
+            'active_high': np.zeros((capacity, nch), dtype=bool),
+            'position': np.zeros(capacity, dtype=np.int64),
+            'recent': np.zeros((capacity, self.window, nch), dtype=np.uint8),
+            'histogram': np.zeros((capacity, nch, self.buckets), dtype=np.int32),
+        }
+        for name, array in arrays.items():
+            if old is not None:
+                previous = getattr(self, name)
+                array[:len(previous)] = previous
+            setattr(self, name, array)
+
+    @property
+    def nbytes(self):
+        return sum(getattr(self, name).nbytes for name in (
+            'count', 'mean', 'm2', 'ewma', 'ewvar', 'active_low', 'active_high',
+            'position', 'recent', 'histogram'))
+
+    def rows(self, instance_ids):
+        """ instance_id 배열을 행 번호 배열로 변환 (처음 보는 ID는 행을 새로 배정) """
+        rows = self._rows
+        missing = [i for i in instance_ids if i not in rows]
+        if missing:
+            for instance_id in missing:
+                rows.setdefault(instance_id, len(rows))
+            if len(rows) > len(self.count):
+                self._allocate(max(len(rows), len(self.count) * 2))
+        return np.fromiter(map(rows.__getitem__, instance_ids), dtype=np.int64,
+                           count=len(instance_ids))
+
+    def update(self, instance_ids, values, timestamp):
+        """
+        샘플 묶음 반영 후 감지된 Anomaly 목록 반환
+        - instance_ids: 길이 n (한 묶음 안에서 서로 달라야 함)
+        - values: shape (n, 채널 수)
+        """
+        instance_ids = (instance_ids.tolist() if isinstance(instance_ids, np.ndarray)
+                        else [int(i) for i in instance_ids])
+        rows = self.rows(instance_ids)
+        x = np.asarray(values, dtype=np.float64).reshape(len(rows), len(self.channels))
+        count = self.count[rows][:, None]
+        mean = self.mean[rows]
+        m2 = self.m2[rows]
+
+        # z-점수: 이번 샘플을 반영하기 전의 분포 기준
+        with np.errstate(divide='ignore', invalid='ignore'):
+            std = np.sqrt(m2 / np.maximum(count - 1, 1))
+            z = np.where((count >= self.min_count) & (std > 0), (x - mean) / std, 0.0)
+
+        # Welford 평균/분산
+        delta = x - mean
+        mean = mean + delta / (count + 1)
+        self.mean[rows] = mean
+        self.m2[rows] = m2 + delta * (x - mean)
+        self.count[rows] += 1
+
+        # EWMA 평균/분산 (첫 샘플은 그 값으로 시작)
+        ewma = self.ewma[rows]
+        diff = np.where(count == 0, 0.0, x - ewma)
+        self.ewma[rows] = np.where(count == 0, x, ewma + self.alpha * diff)
+        self.ewvar[rows] = (1 - self.alpha) * (self.ewvar[rows] + self.alpha * diff * diff)
+
+        # 슬라이딩 윈도 히스토그램: 나가는 샘플의 구간을 빼고 새 샘플의 구간을 더한다
+        bucket = ((x - self.low) / (self.high - self.low) * self.buckets).astype(np.int64)
+        np.clip(bucket, 0, self.buckets - 1, out=bucket)
+        position = self.position[rows]
+        channel = np.arange(len(self.channels))
+        full = (count[:, 0] >= self.window)
+        if full.any():
+            old = self.recent[rows[full], position[full]]
+            self.histogram[rows[full][:, None], channel, old] -= 1
+        self.recent[rows, position] = bucket
+        self.histogram[rows[:, None], channel, bucket] += 1
+        self.position[rows] = (position + 1) % self.window
+
+        # 임계값 (진입할 때만)
+        above = x > self.limit_high
+        below = x < self.limit_low
+        new_high = above & ~self.active_high[rows]
+        new_low = below & ~self.active_low[rows]
+        self.active_high[rows] = above
+        self.active_low[rows] = below
+        spike = np.abs(z) >= self.z_threshold
+
+        if not (new_high.any() or new_low.any() or spike.any()):
+            return []
+        anomalies = []
+        for kind, mask, limits in (('high', new_high, self.limit_high),
+                                   ('low', new_low, self.limit_low),
+                                   ('zscore', spike, None)):
+            for r, c in zip(*np.nonzero(mask)):
+                limit = float(z[r, c]) if limits is None else float(limits[c])
+                anomalies.append(Anomaly(timestamp, instance_ids[r], self.collector,
+                                         self.channels[c], kind, float(x[r, c]), limit))
+        return anomalies
+
+    def snapshot(self, instance_id):
+        """ 인스턴스 1개의 채널별 통계 {채널: {count, mean, std, ewma, ewstd}} """
+        row = self._rows[int(instance_id)]
+        count = int(self.count[row])
+        std = np.sqrt(self.m2[row] / max(count - 1, 1))
+        return {
+            channel: {
+                'count': count,
+                'mean': float(self.mean[row, c]),
+                'std': float(std[c]),
+                'ewma': float(self.ewma[row, c]),
+                'ewstd': float(np.sqrt(self.ewvar[row, c])),
+            }
+            for c, channel in enumerate(self.channels)
+        }
+
+    def percentiles(self, instance_id, channel, qs=(50, 90, 99)):
+        """ 최근 window개 샘플의 백분위수 근사값 (히스토그램 구간 안에서 선형 보간) """
+        row = self._rows[int(instance_id)]
+        c = self.channels.index(channel)
+        counts = self.histogram[row, c]
+        total = int(counts.sum())
+        if total == 0:
+            return {q: None for q in qs}
+        cumulative = np.cumsum(counts)
+        width = (self.high[c] - self.low[c]) / self.buckets
+        result = {}
+        for q in qs:
+            target = q / 100 * total
+            b = int(np.searchsorted(cumulative, target))
+            b = min(b, self.buckets - 1)
+            before = cumulative[b - 1] if b else 0
+            inside = (target - before) / counts[b] if counts[b] else 0.0
+            result[q] = float(self.low[c] + (b + inside) * width)
+        return result
+
+
+# ----------------------------- StreamAnalytics 클래스 -----------------------------
+class StreamAnalytics:
+    """
+    수집기별 ChannelDetector 묶음
+    - MissionComputer.analytics에 연결하면 _publish()에서 load/sensor 샘플마다 observe()가 불린다
+    - Fleet.analytics에 연결하면 인스턴스 묶음 단위로 update()가 불린다
+    - specs: {수집기: (채널 목록, {채널: (하한, 상한)}, {채널: 임계값})}
+    - 감지된 이상은 alerts에 최근 max_alerts건까지 보관 (0이면 보관하지 않고 update() 반환값으로만)
+    """
+
+    def __init__(self, specs, max_alerts=1000, **detector_options):
+        if max_alerts < 0:
+            raise ValueError('max_alerts는 0 이상이어야 합니다.')
+        self.detectors = {
+            collector: ChannelDetector(collector, channels, ranges, thresholds, **detector_options)
+            for collector, (channels, ranges, thresholds) in specs.items()
+        }
+        self.max_alerts = max_alerts
+        self.alerts = []
+        self.samples = 0
+
+    @property
+    def nbytes(self):
+        return sum(detector.nbytes for detector in self.detectors.values())
+
+    def update(self, collector, instance_ids, values, timestamp):
+        detector = self.detectors.get(collector)
+        if detector is None:
+            return []
+        anomalies = detector.update(instance_ids, values, timestamp)
+        self.samples += len(instance_ids)
+        if anomalies and self.max_alerts:
+            self.alerts.extend(anomalies)
+            del self.alerts[:-self.max_alerts]
+        return anomalies
+
+    def observe(self, collector, instance_id, record, timestamp):
+        """ 레코드(dict) 1개 반영 - 채널 이름으로 값을 고른다 """
+        detector = self.detectors.get(collector)
+        if detector is None:
+            return []
+        values = [[record[channel] for channel in detector.channels]]
+        return self.update(collector, [instance_id], values, timestamp)
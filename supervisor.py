@@ -0,0 +1,286 @@
+# ----------------------------- 모듈 임포트 -----------------------------
+import heapq
+import multiprocessing
+import os
+import signal
+import threading
+import time
+
+
+# ----------------------------- 작업 프로세스 -----------------------------
+def collector_worker(computer_ids, factory, options, bus, stop_event):
+    """
+    작업 프로세스 본체: 맡은 MissionComputer들의 collector_jobs()를 힙으로 스케줄
+    - stop_event가 설정되면 다음 작업을 기다리는 중에 바로 깨어나 정상 종료한다
+    - Ctrl+C는 감독자가 받아 stop_event로 알리므로 여기서는 무시한다
+    """
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    computers = [factory(computer_id, **options) for computer_id in computer_ids]
+    heap = []
+    start = time.monotonic()
+    for index, computer in enumerate(computers):
+        if bus is not None:
+            computer.bus = bus
+        for job_index, (_, step, period, _) in enumerate(computer.collector_jobs()):
+            heap.append((start, index, job_index, period, step))
+    heapq.heapify(heap)
+    while heap and not stop_event.is_set():
+        due, index, job_index, period, step = heap[0]
+        delay = due - time.monotonic()
+        if delay > 0 and stop_event.wait(delay):
+            break
+        step()
+        heapq.heapreplace(heap, (due + period, index, job_index, period, step))
+
+
+# ----------------------------- WorkerSlot 클래스 -----------------------------
+class WorkerSlot:
+    """ 감독자가 관리하는 작업 프로세스 자리 1개 (프로세스가 재시작되어도 유지) """
+
+    __slots__ = ('slot', 'assignment', 'process', 'stop_event', 'started_at',
+                 'restart_at', 'failures', 'restarts')
+
+    def __init__(self, slot):
+        self.slot = slot
+        self.assignment = []   # 맡은 computer_id 목록
+        self.process = None
+        self.stop_event = None
+        self.started_at = 0.0
+        self.restart_at = None  # 재시작 예정 시각 (monotonic), None이면 예정 없음
+        self.failures = 0       # 연속 비정상 종료 횟수 (백오프 계산용)
+        self.restarts = 0
+
+
+# ----------------------------- CollectorSupervisor 클래스 -----------------------------
+class CollectorSupervisor:
+    """
+    수집기 작업 프로세스 풀 감독자
+    - computer_ids를 작업 프로세스에 나눠 맡기고, 각 작업 프로세스는
+      맡은 인스턴스의 세 수집 작업을 모두 실행한다 (collector_worker)
+    - 죽은 작업 프로세스는 지수 백오프(backoff_initial, 2배씩, 최대 backoff_max초)로
+      재시작하며, healthy_after초 이상 살아 있으면 백오프를 초기화한다
+    - resize()/add_worker()/remove_worker()로 작업 프로세스 수를 바꾸면
+      인스턴스를 최소한만 옮겨 다시 나누고, 맡은 목록이 바뀐 작업 프로세스만 재시작한다
+    - stop()은 stop_event로 정상 종료를 요청하고 timeout 후에만 강제 종료한다
+    - factory(computer_id, **options)는 MissionComputer를 만드는 피클링 가능한 함수
+    - bus_prefix와 bus_schemas를 주면 자리마다 TelemetryBus('<bus_prefix>_w<자리 번호>')를
+      따로 만들어 넘긴다 - 링은 단일 생산자 전용이므로 작업 프로세스끼리 링을 공유하지 않는다
+      (재시작된 작업 프로세스는 같은 자리의 버스를 이어 쓴다, 부모는 buses를 모두 읽는다)
+    """
+
+    def __init__(self, factory, computer_ids, workers=None, options=None, bus_prefix=None,
+                 bus_schemas=None, bus_capacity=4096, backoff_initial=1.0, backoff_max=30.0,
+                 healthy_after=10.0, check_interval=0.5, context=None):
+        self.factory = factory
+        self.computer_ids = list(computer_ids)
+        self.workers = max(1, workers or min(len(self.computer_ids), os.cpu_count() or 1))
+        self.options = dict(options or {})
+        if bus_prefix is not None and not bus_schemas:
+            raise ValueError('bus_prefix를 주려면 bus_schemas도 필요합니다.')
+        self.bus_prefix = bus_prefix
+        self.bus_schemas = bus_schemas
+        self.bus_capacity = bus_capacity
+        self.buses = {}  # 자리 번호 -> TelemetryBus (자리가 처음 시작될 때 생성)
+        self.backoff_initial = backoff_initial
+        self.backoff_max = backoff_max
+        self.healthy_after = healthy_after
+        self.check_interval = check_interval
+        self.context = context or multiprocessing.get_context()
+        self.slots = []
+        self.events = []  # (monotonic 시각, 슬롯 번호, 사건, 내용)
+        self._lock = threading.RLock()
+        self._stop_requested = threading.Event()
+        self._monitor = None
+
+    def _log(self, slot, event, detail=None):
+        self.events.append((time.monotonic(), slot.slot, event, detail))
+
+    # ----- 작업 프로세스 시작/종료 -----
+    def _bus(self, slot):
+        """ 자리 전용 버스 (없으면 만든다) - 한 자리에는 작업 프로세스가 한 번에 1개뿐 """
+        if self.bus_prefix is None:
+            return None
+        bus = self.buses.get(slot.slot)
+        if bus is None:
+            from telemetry_bus import TelemetryBus
+            bus = self.buses[slot.slot] = TelemetryBus.create(
+                f'{self.bus_prefix}_w{slot.slot}', self.bus_schemas, self.bus_capacity)
+        return bus
+
+    def _spawn(self, slot):
+        slot.stop_event = self.context.Event()
+        slot.process = self.context.Process(
+            target=collector_worker,
+            args=(list(slot.assignment), self.factory, self.options, self._bus(slot),
+                  slot.stop_event),
+            name=f'collector-worker-{slot.slot}',
+            daemon=True,
+        )
+        slot.process.start()
+        slot.started_at = time.monotonic()
+        slot.restart_at = None
+        self._log(slot, 'start', {'pid': slot.process.pid, 'assignment': list(slot.assignment)})
+
+    def _halt(self, slot, timeout):
+        """ 정상 종료 요청 후 timeout초 안에 끝나지 않으면 강제 종료 """
+        process = slot.process
+        slot.process = None
+        slot.restart_at = None
+        if process is None:
+            return
+        slot.stop_event.set()
+        process.join(timeout)
+        if process.is_alive():
+            process.terminate()
+            process.join()
+            self._log(slot, 'terminate', {'pid': process.pid})
+        else:
+            self._log(slot, 'stop', {'pid': process.pid, 'exitcode': process.exitcode})
+
+    # ----- 인스턴스 배분 -----
+    def _rebalance(self, removed=()):
+        """
+        인스턴스를 작업 프로세스 수에 맞게 다시 나눈다
+        - 없어진 자리의 인스턴스와 목표보다 많이 맡은 자리의 초과분만 옮긴다
+        - 반환값: 맡은 목록이 바뀐 자리 목록
+        """
+        count = len(self.slots)
+        base, extra = divmod(len(self.computer_ids), count)
+        targets = [base + (1 if i < extra else 0) for i in range(count)]
+        known = set(self.computer_ids)
+        pool = [cid for slot in removed for cid in slot.assignment]
+        assigned = {cid for slot in self.slots for cid in slot.assignment if cid in known}
+        pool.extend(cid for cid in self.computer_ids if cid not in assigned and cid not in pool)
+        changed = []
+        for slot, target in zip(self.slots, targets):
+            kept = [cid for cid in slot.assignment if cid in known]
+            if len(kept) > target:
+                pool.extend(kept[target:])
+                kept = kept[:target]
+            if kept != slot.assignment:
+                slot.assignment = kept
+                changed.append(slot)
+        for slot, target in zip(self.slots, targets):
+            if len(slot.assignment) < target:
+                need = target - len(slot.assignment)
+                slot.assignment = slot.assignment + pool[:need]
+                del pool[:need]
+                if slot not in changed:
+                    changed.append(slot)
+        return changed
+
+    def resize(self, workers, timeout=5.0):
+        """ 작업 프로세스 수를 workers로 바꾸고 인스턴스를 다시 나눈다 """
+        workers = max(1, min(workers, len(self.computer_ids)))
+        with self._lock:
+            removed = self.slots[workers:]
+            del self.slots[workers:]
+            for slot in removed:
+                self._halt(slot, timeout)
+            next_slot = max((slot.slot for slot in self.slots), default=-1) + 1
+            while len(self.slots) < workers:
+                self.slots.append(WorkerSlot(next_slot))
+                next_slot += 1
+            self.workers = workers
+            for slot in self._rebalance(removed):
+                if slot.process is not None:
+                    self._halt(slot, timeout)
+                if slot.assignment:
+                    self._spawn(slot)
+
+    def add_worker(self):
+        self.resize(self.workers + 1)
+
+    def remove_worker(self):
+        self.resize(self.workers - 1)
+
+    # ----- 감시 -----
+    def poll(self):
+        """ 죽은 작업 프로세스를 찾아 백오프 후 재시작 (감시 스레드가 주기적으로 호출) """
+        now = time.monotonic()
+        with self._lock:
+            for slot in self.slots:
+                if slot.restart_at is not None:
+                    if now >= slot.restart_at and not self._stop_requested.is_set():
+                        slot.restarts += 1
+                        self._spawn(slot)
+                    continue
+                process = slot.process
+                if process is None:
+                    continue
+                if process.is_alive():
+                    if slot.failures and now - slot.started_at >= self.healthy_after:
+                        slot.failures = 0
+                    continue
+                process.join()
+                slot.failures += 1
+                delay = min(self.backoff_max, self.backoff_initial * 2 ** (slot.failures - 1))
+                slot.restart_at = now + delay
+                self._log(slot, 'exit', {'pid': process.pid, 'exitcode': process.exitcode,
+                                         'restart_in': delay})
+
+    def _watch(self):
+        while not self._stop_requested.wait(self.check_interval):
+            self.poll()
+
+    def status(self):
+        """ 자리별 상태 목록 """
+        with self._lock:
+            return [{
+                'slot': slot.slot,
+                'pid': slot.process.pid if slot.process is not None else None,
+                'alive': slot.process is not None and slot.process.is_alive(),
+                'assignment': list(slot.assignment),
+                'restarts': slot.restarts,
+                'restart_pending': slot.restart_at is not None,
+            } for slot in self.slots]
+
+    # ----- 시작/종료 -----
+    def start(self):
+        """ 작업 프로세스를 띄우고 감시 스레드를 시작 """
+        self._stop_requested.clear()
+        self.resize(self.workers)
+        self._monitor = threading.Thread(target=self._watch, name='collector-supervisor',
+                                         daemon=True)
+        self._monitor.start()
+
+    def request_stop(self):
+        """ 종료 요청 (신호 처리기에서 불러도 안전) """
+        self._stop_requested.set()
+
+    def stop(self, timeout=5.0):
+        """ 모든 작업 프로세스를 정상 종료 (timeout초 후 강제 종료) """
+        self._stop_requested.set()
+        if self._monitor is not None and self._monitor is not threading.current_thread():
+            self._monitor.join()
+        with self._lock:
+            # 모두에게 먼저 알리고 기다려야 종료가 병렬로 진행된다
+            for slot in self.slots:
+                if slot.process is not None:
+                    slot.stop_event.set()
+            for slot in self.slots:
+                self._halt(slot, timeout)
+
+    def close_buses(self):
+        """ stop() 후 자리별 버스를 닫고 지운다 (버스를 읽던 소비자가 끝난 뒤 호출) """
+        with self._lock:
+            for bus in self.buses.values():
+                bus.close()
+            self.buses.clear()
+
+    def run(self, duration=None, timeout=5.0):
+        """
+        start() 후 duration초 동안(또는 종료 요청까지) 감독하고 정상 종료
+        - 메인 스레드에서 부르면 SIGINT/SIGTERM을 종료 요청으로 바꾼다
+        """
+        handlers = {}
+        if threading.current_thread() is threading.main_thread():
+            for signum in (signal.SIGINT, signal.SIGTERM):
+                handlers[signum] = signal.signal(signum, lambda *_: self.request_stop())
+        try:
+            self.start()
+            self._stop_requested.wait(duration)
+        finally:
+            self.stop(timeout)
+            for signum, handler in handlers.items():
+                signal.signal(signum, handler)
@@ -0,0 +1,80 @@
+# ----------------------------- 모듈 임포트 -----------------------------
+import threading
+import time
+
+
+def query_system_info():
+    """ platform/psutil로 시스템 기본 정보를 직접 조회 (캐시 없음, 두 모듈은 여기서 처음 import) """
+    import platform
+    import psutil
+    return {
+        '운영체계': platform.system(),
+        '운영체계_버전': platform.version(),
+        'CPU_타입': platform.processor(),
+        'CPU_코어_수': psutil.cpu_count(logical=False),
+        '메모리_크기_GB': round(psutil.virtual_memory().total / (1024 ** 3), 2)
+    }
+
+
+# ----------------------------- SystemInfoProvider 클래스 -----------------------------
+class SystemInfoProvider:
+    """
+    시스템 기본 정보를 한 번만 조회해 두고 재사용하는 캐시
+    - 프로세스 실행 중에는 값이 바뀌지 않으므로 첫 호출 이후에는 조회 비용이 없다
+    - invalidate()로 명시적으로 비우거나, ttl(초)을 주면 만료 후 다시 조회한다
+    - version은 값이 실제로 바뀔 때만 증가한다
+    """
+
+    def __init__(self, ttl=None, query=query_system_info):
+        self.ttl = ttl
+        self._query = query
+        self._lock = threading.Lock()
+        self._info = None
+        self._fetched_at = 0.0
+        self._stale = True
+        self.version = 0
+
+    def _expired(self):
+        if self._stale:
+            return True
+        return self.ttl is not None and time.monotonic() - self._fetched_at >= self.ttl
+
+    def get(self):
+        """ 캐시된 시스템 정보 반환 (반환된 딕셔너리는 수정하지 말 것) """
+        if not self._expired():
+            return self._info
+        with self._lock:
+            # 다른 스레드가 먼저 갱신했을 수 있으므로 다시 확인
+            if self._expired():
+                fresh = self._query()
+                if fresh != self._info:
+                    self.version += 1
+                self._info = fresh
+                self._fetched_at = time.monotonic()
+                self._stale = False
+            return self._info
+
+    def __getstate__(self):
+        # Lock은 피클링할 수 없으므로 제외 (spawn 방식 자식 프로세스 대비)
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def __reduce__(self):
+        # 공용 캐시는 자식 프로세스에서도 그 프로세스의 공용 캐시를 가리키게 한다
+        if self is shared_provider:
+            return 'shared_provider'
+        return super().__reduce__()
+
+    def invalidate(self):
+        """ 캐시를 비워 다음 get() 호출에서 다시 조회하게 한다 """
+        with self._lock:
+            self._stale = True
+
+
+# 프로세스 내 모든 MissionComputer 인스턴스가 함께 쓰는 캐시
+shared_provider = SystemInfoProvider()
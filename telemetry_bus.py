@@ -0,0 +1,257 @@
+# ----------------------------- 모듈 임포트 -----------------------------
+import time
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+
+
+# ----------------------------- 공유 메모리 레이아웃 -----------------------------
+# 헤더: int64 8칸 [매직, 버전, 용량, 필드 수, 다음 쓰기 순번, 예약...]
+RING_MAGIC = 0x4D415253  # 'MARS'
+RING_VERSION = 1
+HEADER_SLOTS = 8
+HEADER_BYTES = HEADER_SLOTS * 8
+_H_MAGIC, _H_VERSION, _H_CAPACITY, _H_NFIELDS, _H_WRITE_SEQ = range(5)
+
+
+def record_dtype(nfields):
+    """ 고정 레이아웃 레코드: 순번, 타임스탬프, 인스턴스 ID, 숫자 필드 nfields개 """
+    return np.dtype([
+        ('seq', '<i8'),
+        ('timestamp', '<f8'),
+        ('instance_id', '<i8'),
+        ('values', '<f8', (nfields,)),
+    ])
+
+
+# ----------------------------- TelemetryRing 클래스 -----------------------------
+class TelemetryRing:
+    """
+    multiprocessing.shared_memory 위의 단일 생산자 / 다중 소비자 링 버퍼
+    - 생산자는 publish()로 레코드를 쓰고, 헤더의 쓰기 순번을 마지막에 올린다
+    - 슬롯의 seq 값은 쓰는 도중에는 -1이므로, 소비자는 seq가 기대값과 같은
+      레코드만 유효하다고 판단한다 (덮어쓰기/쓰는 중인 슬롯 걸러내기)
+    - 피클링하면 이름으로 다시 연결되므로 자식 프로세스에 그대로 넘길 수 있다
+    """
+
+    def __init__(self, shm, owner):
+        self._shm = shm
+        self._owner = owner
+        self.name = shm.name
+        self._header = np.ndarray((HEADER_SLOTS,), dtype='<i8', buffer=shm.buf)
+        if self._header[_H_MAGIC] != RING_MAGIC or self._header[_H_VERSION] != RING_VERSION:
+            raise ValueError(f'{shm.name}: 텔레메트리 링 형식이 아닙니다.')
+        self.capacity = int(self._header[_H_CAPACITY])
+        self.nfields = int(self._header[_H_NFIELDS])
+        self.dtype = record_dtype(self.nfields)
+        self.records = np.ndarray((self.capacity,), dtype=self.dtype,
+                                  buffer=shm.buf, offset=HEADER_BYTES)
+
+    @classmethod
+    def create(cls, name, nfields, capacity=4096):
+        """ 새 링을 만든다 (부모 프로세스에서 1회) """
+        size = HEADER_BYTES + record_dtype(nfields).itemsize * capacity
+        shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        header = np.ndarray((HEADER_SLOTS,), dtype='<i8', buffer=shm.buf)
+        header[:] = 0
+        header[_H_MAGIC] = RING_MAGIC
+        header[_H_VERSION] = RING_VERSION
+        header[_H_CAPACITY] = capacity
+        header[_H_NFIELDS] = nfields
+        del header
+        return cls(shm, owner=True)
+
+    @classmethod
+    def attach(cls, name, untrack=False):
+        """
+        이미 만들어진 링에 연결한다 (자식 프로세스/다른 소비자)
+        - 자식 프로세스는 부모의 자원 추적기를 함께 쓰므로 그대로 두면 된다
+        - 관계없는 프로세스에서 연결할 때는 untrack=True로 해야
+          그 프로세스가 종료될 때 자원 추적기가 링을 지우지 않는다
+        """
+        shm = shared_memory.SharedMemory(name=name)
+        if untrack:
+            resource_tracker.unregister(shm._name, 'shared_memory')
+        return cls(shm, owner=False)
+
+    def __reduce__(self):
+        return (TelemetryRing.attach, (self.name,))
+
+    @property
+    def write_seq(self):
+        return int(self._header[_H_WRITE_SEQ])
+
+    def publish(self, timestamp, instance_id, values):
+        """ 레코드 1개 기록 (생산자 전용) """
+        seq = int(self._header[_H_WRITE_SEQ])
+        slot = self.records[seq % self.capacity]
+        slot['seq'] = -1
+        slot['timestamp'] = timestamp
+        slot['instance_id'] = instance_id
+        slot['values'] = values
+        slot['seq'] = seq
+        self._header[_H_WRITE_SEQ] = seq + 1
+
+    def reader(self, from_start=False):
+        return TelemetryReader(self, from_start=from_start)
+
+    def close(self):
+        # numpy 뷰가 버퍼를 잡고 있으면 close()가 실패하므로 먼저 놓는다
+        self.records = None
+        self._header = None
+        self._shm.close()
+        if self._owner:
+            self._shm.unlink()
+
+
+# ----------------------------- TelemetryReader 클래스 -----------------------------
+class TelemetryReader:
+    """
+    링 하나를 따라가며 새 레코드를 읽는 소비자
+    - poll()은 복사 없이 공유 메모리 위의 레코드 뷰를 돌려준다
+    - 뷰는 살아 있는 공유 메모리라서 poll()이 검사한 뒤에도 생산자가 링을 한 바퀴 돌면
+      바뀔 수 있다 → 뷰의 값을 복사하거나 다 쓴 뒤에는 반드시 revalidate(뷰)로 다시 확인하고
+      False인 행의 값은 버려야 한다 (복사본이 필요하면 copy(뷰)가 복사와 재검사를 함께 한다)
+    - 생산자보다 capacity 이상 뒤처지면 놓친 레코드 수를 dropped에 더한다
+      (읽는 도중 덮어쓰여 버린 레코드도 포함)
+    """
+
+    def __init__(self, ring, from_start=False):
+        self.ring = ring
+        self.next_seq = 0 if from_start else ring.write_seq
+        self.dropped = 0
+        self._window = (self.next_seq, self.next_seq)  # 마지막 poll()의 [시작 순번, 끝 순번)
+
+    def poll(self):
+        """ 새 레코드들의 뷰 목록(최대 2개, 링 경계에서 나뉨)을 반환 - 다음 poll() 전에 revalidate() """
+        ring = self.ring
+        end = ring.write_seq
+        start = self.next_seq
+        if end - start > ring.capacity:
+            self.dropped += end - ring.capacity - start
+            start = end - ring.capacity
+        self.next_seq = end
+        self._window = (start, end)
+        if start >= end:
+            return []
+        views = []
+        while start < end:
+            slot = start % ring.capacity
+            count = min(end - start, ring.capacity - slot)
+            view = ring.records[slot:slot + count]
+            expected = np.arange(start, start + count)
+            valid = view['seq'] == expected
+            if valid.all():
+                views.append(view)
+            else:
+                # 읽는 사이 덮어쓰인 슬롯은 제외 (이 경우에만 복사 발생) - 복사 뒤에 다시 검사해
+                # 복사하는 동안 덮어쓰인 행도 뺀다
+                copied = view.copy()
+                valid &= (copied['seq'] == expected) & (view['seq'] == expected)
+                self.dropped += int((~valid).sum())
+                views.append(copied[valid])
+            start += count
+        return views
+
+    def revalidate(self, view):
+        """
+        poll()이 준 뷰를 복사하거나 필드를 읽은 뒤 호출 - 아직 원래 레코드인 행의 bool 마스크
+        - 그 사이 생산자가 덮어썼거나 덮어쓰는 중인 행은 False (seq가 -1이거나 새 순번)
+          → 그 행에서 읽은 값은 찢어졌을 수 있으므로 버린다, 버린 행 수는 dropped에 더한다
+        - 마지막 poll()의 뷰에만 쓰고, 뷰 하나에 한 번만 호출한다 (복사본은 항상 True)
+        """
+        start, end = self._window
+        seq = view['seq']
+        valid = (seq >= start) & (seq < end)
+        self.dropped += int(len(valid) - valid.sum())
+        return valid
+
+    def copy(self, view):
+        """ 뷰를 복사하고 revalidate()로 복사하는 동안 덮어쓰인 행을 뺀 안정된 복사본 """
+        copied = view.copy()
+        return copied[self.revalidate(view)]
+
+
+# ----------------------------- TelemetryBus 클래스 -----------------------------
+class TelemetryBus:
+    """
+    수집기(info/load/sensor)마다 TelemetryRing 하나씩을 묶은 버스
+    - schemas: {수집기 이름: 숫자 필드 이름 튜플}
+    - 각 링의 이름은 '<prefix>_<수집기 이름>'
+    """
+
+    def __init__(self, prefix, schemas, rings):
+        self.prefix = prefix
+        self.schemas = dict(schemas)
+        self.rings = rings
+
+    @classmethod
+    def create(cls, prefix, schemas, capacity=4096):
+        rings = {
+            collector: TelemetryRing.create(f'{prefix}_{collector}', len(fields), capacity)
+            for collector, fields in schemas.items()
+        }
+        return cls(prefix, schemas, rings)
+
+    @classmethod
+    def attach(cls, prefix, schemas, untrack=False):
+        rings = {
+            collector: TelemetryRing.attach(f'{prefix}_{collector}', untrack)
+            for collector in schemas
+        }
+        return cls(prefix, schemas, rings)
+
+    def publish(self, collector, timestamp, instance_id, record):
+        """ record(딕셔너리)에서 스키마 필드만 골라 해당 링에 기록 """
+        fields = self.schemas[collector]
+        self.rings[collector].publish(timestamp, instance_id, [record[field] for field in fields])
+
+    def readers(self, from_start=False):
+        return {collector: ring.reader(from_start) for collector, ring in self.rings.items()}
+
+    def close(self):
+        for ring in self.rings.values():
+            ring.close()
+
+
+def consume_bus(bus, interval=5, rounds=None):
+    """
+    부모 프로세스에서 버스의 모든 링을 읽어 수집기별 최신 값을 요약 출력
+    - 레코드는 공유 메모리 뷰로 읽으므로 피클링/파이프가 필요 없다
+    """
+    consume_buses({None: bus}, interval, rounds)
+
+
+def consume_buses(buses, interval=5, rounds=None):
+    """
+    여러 버스(생산자 프로세스마다 1개)를 함께 읽어 요약 출력
+    - buses: {이름: TelemetryBus} - 매 회차 다시 훑으므로 실행 중에 버스가 늘어나도 된다
+      (CollectorSupervisor.buses를 그대로 넘긴다)
+    """
+    readers = {}
+    done = 0
+    while rounds is None or done < rounds:
+        time.sleep(interval)
+        for label, bus in list(buses.items()):
+            if label not in readers:
+                readers[label] = bus.readers(from_start=True)
+            _report(bus, readers[label], '' if label is None else f'{label}:')
+        done += 1
+
+
+def _report(bus, readers, label):
+    """ 버스 1개의 수집기별 수신 건수와 최신 값 한 줄씩 """
+    for collector, reader in readers.items():
+        received = 0
+        latest = None
+        for view in reader.poll():
+            received += len(view)
+            if len(view):
+                tail = reader.copy(view[-1:])
+                if len(tail):
+                    latest = tail[0]
+        if latest is None:
+            continue
+        fields = dict(zip(bus.schemas[collector], latest['values'].tolist()))
+        print(f"[bus:{label}{collector}] 수신 {received}건 (누락 {reader.dropped}) "
+              f"instance={int(latest['instance_id'])} {fields}")
@@ -0,0 +1,260 @@
+# ----------------------------- 모듈 임포트 -----------------------------
+import os
+
+import numpy as np
+
+from telemetry_log import INDEX_SUFFIX, TelemetryLogReader, read_instance_names
+
+
+BLOCK_RECORDS = 4096  # 블록 1개에 포함되는 레코드 수
+
+
+def index_dtype(nchannels):
+    """ (블록, 인스턴스) 1개의 요약 행 """
+    return np.dtype([
+        ('start', '<i8'),          # 블록 첫 레코드 위치
+        ('stop', '<i8'),           # 블록 끝 레코드 위치 (미포함)
+        ('instance_id', '<u4'),
+        ('count', '<i8'),
+        ('ts_min', '<f8'),
+        ('ts_max', '<f8'),
+        ('min', '<f8', (nchannels,)),
+        ('max', '<f8', (nchannels,)),
+        ('sum', '<f8', (nchannels,)),
+    ])
+
+
+def build_index(records, nchannels, block_records=BLOCK_RECORDS, first=0):
+    """
+    세그먼트 레코드 뷰로 희소 시간 인덱스를 만든다
+    - 블록마다 인스턴스별로 시각 범위와 채널별 min/max/sum을 요약
+    - first: 이 위치(블록 경계)부터만 만든다 (자란 세그먼트의 인덱스를 이어 붙일 때)
+    """
+    rows = []
+    dtype = index_dtype(nchannels)
+    for start in range(first, len(records), block_records):
+        block = records[start:start + block_records]
+        ids = block['instance_id']
+        order = np.argsort(ids, kind='stable')
+        sorted_ids = ids[order]
+        bounds = np.flatnonzero(np.diff(sorted_ids)) + 1
+        starts = np.concatenate(([0], bounds))
+        group = np.empty(len(starts), dtype=dtype)
+        group['start'] = start
+        group['stop'] = start + len(block)
+        group['instance_id'] = sorted_ids[starts]
+        group['count'] = np.diff(np.append(starts, len(block)))
+        timestamps = block['timestamp'][order]
+        group['ts_min'] = np.minimum.reduceat(timestamps, starts)
+        group['ts_max'] = np.maximum.reduceat(timestamps, starts)
+        if nchannels:
+            values = block['values'][order].astype(np.float64)
+            group['min'] = np.minimum.reduceat(values, starts, axis=0)
+            group['max'] = np.maximum.reduceat(values, starts, axis=0)
+            group['sum'] = np.add.reduceat(values, starts, axis=0)
+        rows.append(group)
+    if not rows:
+        return np.empty(0, dtype=dtype)
+    return np.concatenate(rows)
+
+
+def resolve_instance_id(instance, names=None):
+    """
+    숫자 ID, MissionComputer(instance_id / computer_id 속성) 또는 인스턴스 이름을 숫자 ID로 변환
+    - 이름(예: 'Process-3')은 names({이름: 숫자 ID})로 찾는다
+    """
+    if isinstance(instance, (int, np.integer)):
+        return int(instance)
+    if isinstance(instance, str):
+        if names is None or instance not in names:
+            raise KeyError(f'알 수 없는 인스턴스 이름: {instance!r}')
+        return int(names[instance])
+    for attr in ('instance_id', 'computer_id'):
+        if hasattr(instance, attr):
+            return int(getattr(instance, attr))
+    raise TypeError(f'인스턴스 ID를 알 수 없습니다: {instance!r}')
+
+
+# ----------------------------- TelemetryIndex 클래스 -----------------------------
+class TelemetryIndex:
+    """
+    TelemetryLog 세그먼트마다 희소 시간 인덱스(<세그먼트>.idx.npy)를 두고
+    인스턴스/채널/시간 범위 질의에서 관계없는 블록을 건너뛴다
+    - 세그먼트가 자라면 마지막으로 다 찬 블록 다음부터만 인덱스를 이어 붙이고,
+      인덱스 파일(다 찬 블록만)은 새 블록이 찼을 때만 다시 쓴다
+    - 세그먼트 mmap은 열어 둔 채 재사용하고, 세그먼트가 자라거나 지워졌을 때와 close()에서 닫는다
+    - 구간에 완전히 포함된 블록은 요약값만으로 집계하고,
+      경계에 걸친 블록만 mmap 레코드를 직접 훑는다
+    - 인스턴스는 숫자 ID, MissionComputer 또는 이름으로 지정한다 - 이름은 로그에 기록된
+      대응(TelemetryLog.name_instance())과 names({이름: 숫자 ID})로 찾는다
+    """
+
+    def __init__(self, directory, block_records=BLOCK_RECORDS, names=None):
+        self.reader = TelemetryLogReader(directory)
+        self.block_records = block_records
+        self.names = dict(names or {})
+        self._cache = {}  # 세그먼트 경로 -> _IndexedSegment
+
+    def instance_id(self, instance):
+        """ 질의의 instance를 숫자 ID로 (처음 보는 이름이면 로그의 이름 기록을 다시 읽는다) """
+        if isinstance(instance, str) and instance not in self.names:
+            self.names = {**read_instance_names(self.reader.directory), **self.names}
+        return resolve_instance_id(instance, self.names)
+
+    def _load_index(self, path, count, nchannels):
+        """ 인덱스 파일의 다 찬 블록 행 (없거나 세그먼트와 맞지 않으면 빈 배열) """
+        empty = np.empty(0, dtype=index_dtype(nchannels))
+        index_path = path + INDEX_SUFFIX
+        if not os.path.exists(index_path):
+            return empty
+        index = np.load(index_path)
+        if index.dtype != empty.dtype or (len(index) and int(index['stop'].max()) > count):
+            return empty  # 다른 세그먼트의 인덱스 - 처음부터 다시 만든다
+        return index
+
+    def _segment_index(self, path):
+        size = os.path.getsize(path)
+        cached = self._cache.get(path)
+        if cached is not None and cached.size == size:
+            return cached.schema, cached.records, cached.index
+        schema, records, mapped = self.reader.open_segment(path)
+        nchannels = len(schema.channels)
+        if cached is None:
+            index = self._load_index(path, len(records), nchannels)
+            saved = len(index)
+        else:
+            index, saved = cached.index, cached.saved
+            cached.release()
+        # 덜 찬 마지막 블록의 행은 버리고 그 블록부터 이어서 요약
+        complete = index['stop'] - index['start'] == self.block_records
+        index = index[complete]
+        first = int(index['stop'].max()) if len(index) else 0
+        index = np.concatenate((index, build_index(records, nchannels, self.block_records,
+                                                   first)))
+        complete_rows = int((index['stop'] - index['start'] == self.block_records).sum())
+        if complete_rows > saved or not os.path.exists(path + INDEX_SUFFIX):
+            with open(path + INDEX_SUFFIX, 'wb') as f:
+                np.save(f, index[:complete_rows])
+            saved = complete_rows
+        self._cache[path] = _IndexedSegment(size, schema, records, mapped, index, saved)
+        return schema, records, index
+
+    def _segments(self, kind):
+        """ kind의 세그먼트 목록 - 지워진 세그먼트의 mmap은 닫는다 """
+        paths = self.reader.segments(kind)
+        alive = set(paths)
+        # 막 만들어져 헤더도 아직 디스크에 없는 세그먼트는 건너뛴다
+        paths = [path for path in paths if os.path.getsize(path) > 0]
+        prefix = os.path.join(self.reader.directory, f'{kind}-')
+        for path in [path for path in self._cache if path.startswith(prefix)
+                     and path not in alive]:
+            self._cache.pop(path).release()
+        return paths
+
+    def close(self):
+        """ 열어 둔 세그먼트 mmap을 모두 닫는다 """
+        for cached in self._cache.values():
+            cached.release()
+        self._cache.clear()
+
+    def build(self, kind):
+        """ kind의 모든 세그먼트 인덱스를 미리 만든다 """
+        for path in self._segments(kind):
+            self._segment_index(path)
+
+    def _scan(self, kind, instance, channel, start_time, end_time):
+        """ (완전 포함 요약 행 목록, 경계 블록의 (timestamps, values) 목록) """
+        instance_id = self.instance_id(instance)
+        summaries = []
+        partial = []
+        for path in self._segments(kind):
+            schema, records, index = self._segment_index(path)
+            if len(index) == 0:
+                continue
+            column = schema.channels.index(channel)
+            rows = index[(index['instance_id'] == instance_id)
+                         & (index['ts_max'] >= start_time)
+                         & (index['ts_min'] <= end_time)]
+            if len(rows) == 0:
+                continue
+            inside = (rows['ts_min'] >= start_time) & (rows['ts_max'] <= end_time)
+            full = rows[inside]
+            if len(full):
+                summaries.append((full['count'], full['min'][:, column],
+                                  full['max'][:, column], full['sum'][:, column]))
+            for row in rows[~inside]:
+                block = records[row['start']:row['stop']]
+                mask = ((block['instance_id'] == instance_id)
+                        & (block['timestamp'] >= start_time)
+                        & (block['timestamp'] <= end_time))
+                partial.append((block['timestamp'][mask], block['values'][mask, column]))
+        return summaries, partial
+
+    def aggregate(self, kind, instance, channel, start_time, end_time):
+        """
+        구간 집계 {'count', 'min', 'max', 'sum', 'mean'} 반환
+        - instance: 숫자 ID, MissionComputer 객체 또는 인스턴스 이름
+        """
+        summaries, partial = self._scan(kind, instance, channel, start_time, end_time)
+        count = 0
+        total = 0.0
+        lo = np.inf
+        hi = -np.inf
+        for counts, mins, maxs, sums in summaries:
+            count += int(counts.sum())
+            total += float(sums.sum())
+            lo = min(lo, float(mins.min()))
+            hi = max(hi, float(maxs.max()))
+        for _, values in partial:
+            if len(values) == 0:
+                continue
+            count += len(values)
+            total += float(values.sum(dtype=np.float64))
+            lo = min(lo, float(values.min()))
+            hi = max(hi, float(values.max()))
+        if count == 0:
+            return {'count': 0, 'min': None, 'max': None, 'sum': 0.0, 'mean': None}
+        return {'count': count, 'min': lo, 'max': hi, 'sum': total, 'mean': total / count}
+
+    def select(self, kind, instance, channel, start_time, end_time):
+        """ 구간의 원시 샘플을 (timestamps, values) 배열로 반환 (해당 블록만 읽음) """
+        instance_id = self.instance_id(instance)
+        timestamps = []
+        values = []
+        for path in self._segments(kind):
+            schema, records, index = self._segment_index(path)
+            column = schema.channels.index(channel)
+            rows = index[(index['instance_id'] == instance_id)
+                         & (index['ts_max'] >= start_time)
+                         & (index['ts_min'] <= end_time)]
+            for start, stop in sorted(set(zip(rows['start'].tolist(), rows['stop'].tolist()))):
+                block = records[start:stop]
+                mask = ((block['instance_id'] == instance_id)
+                        & (block['timestamp'] >= start_time)
+                        & (block['timestamp'] <= end_time))
+                timestamps.append(block['timestamp'][mask])
+                values.append(block['values'][mask, column])
+        if not timestamps:
+            return np.empty(0), np.empty(0)
+        return np.concatenate(timestamps), np.concatenate(values)
+
+
+class _IndexedSegment:
+    """ TelemetryIndex가 열어 둔 세그먼트 1개 (파일 크기, mmap 레코드 뷰, 인덱스) """
+
+    __slots__ = ('size', 'schema', 'records', 'mapped', 'index', 'saved')
+
+    def __init__(self, size, schema, records, mapped, index, saved):
+        self.size = size
+        self.schema = schema
+        self.records = records
+        self.mapped = mapped
+        self.index = index
+        self.saved = saved  # 인덱스 파일에 저장된 (다 찬 블록) 행 수
+
+    def release(self):
+        self.records = None
+        try:
+            self.mapped.close()
+        except BufferError:
+            pass  # 호출자가 아직 뷰를 들고 있으면 GC가 닫게 둔다
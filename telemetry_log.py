@@ -0,0 +1,236 @@
+# ----------------------------- 모듈 임포트 -----------------------------
+import mmap
+import os
+import re
+import threading
+import time
+
+from telemetry_record import RecordSchema
+
+
+SEGMENT_SUFFIX = '.seg'
+NAMES_FILE = 'instances.json'  # 인스턴스 이름 -> 숫자 ID (레코드에는 숫자 ID만 실린다)
+INDEX_SUFFIX = '.idx.npy'  # 세그먼트 옆의 희소 시간 인덱스 (telemetry_index.py)
+_SEGMENT_RE = re.compile(r'^(?P<kind>.+)-(?P<index>\d{6})\.seg$')
+
+
+def segment_name(kind, index):
+    return f'{kind}-{index:06d}{SEGMENT_SUFFIX}'
+
+
+def list_segments(directory, kind):
+    """ kind의 세그먼트 파일 경로를 번호 순서로 반환 """
+    found = []
+    for name in os.listdir(directory):
+        match = _SEGMENT_RE.match(name)
+        if match and match.group('kind') == kind:
+            found.append((int(match.group('index')), os.path.join(directory, name)))
+    return [path for _, path in sorted(found)]
+
+
+# ----------------------------- SegmentWriter 클래스 -----------------------------
+class SegmentWriter:
+    """
+    수집기 한 종류의 추가 전용(append-only) 세그먼트 로그
+    - 세그먼트 = RecordSchema 헤더 + 고정 길이 레코드 나열
+    - fsync는 fsync_batch개 또는 fsync_interval초마다 한 번씩 묶어서 수행
+    - 세그먼트가 segment_bytes를 넘으면 새 세그먼트로 교체하고,
+      전체 크기가 max_bytes를 넘으면 가장 오래된 세그먼트부터 지운다
+    """
+
+    def __init__(self, directory, schema, segment_bytes=64 * 1024 * 1024, max_bytes=None,
+                 fsync_batch=256, fsync_interval=1.0):
+        self.directory = directory
+        self.schema = schema
+        self.segment_bytes = segment_bytes
+        self.max_bytes = max_bytes
+        self.fsync_batch = fsync_batch
+        self.fsync_interval = fsync_interval
+        self._header = schema.header()
+        self._lock = threading.Lock()
+        self._file = None
+        self._size = 0
+        self._pending = 0
+        self._last_sync = time.monotonic()
+        existing = list_segments(directory, schema.kind)
+        # 다시 열 때는 이전 세그먼트에 이어 쓰지 않고 다음 번호로 새로 시작
+        self._index = int(_SEGMENT_RE.match(os.path.basename(existing[-1])).group('index')) + 1 \
+            if existing else 0
+        self._open_segment()
+
+    def _open_segment(self):
+        path = os.path.join(self.directory, segment_name(self.schema.kind, self._index))
+        self._file = open(path, 'xb')
+        self._file.write(self._header)
+        self._size = len(self._header)
+
+    def _sync(self):
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._pending = 0
+        self._last_sync = time.monotonic()
+
+    def _rotate(self):
+        self._sync()
+        self._file.close()
+        self._index += 1
+        self._open_segment()
+        self._enforce_size_limit()
+
+    def _enforce_size_limit(self):
+        if self.max_bytes is None:
+            return
+        segments = list_segments(self.directory, self.schema.kind)
+        sizes = [os.path.getsize(path) for path in segments]
+        total = sum(sizes)
+        # 현재 쓰는 세그먼트(마지막)는 지우지 않는다
+        for path, size in zip(segments[:-1], sizes[:-1]):
+            if total <= self.max_bytes:
+                break
+            os.remove(path)
+            if os.path.exists(path + INDEX_SUFFIX):
+                os.remove(path + INDEX_SUFFIX)  # 세그먼트와 함께 그 인덱스도 지운다
+            total -= size
+
+    def _write(self, data, count):
+        with self._lock:
+            if self._size + len(data) > self.segment_bytes and self._size > len(self._header):
+                self._rotate()
+            self._file.write(data)
+            self._size += len(data)
+            self._pending += count
+            if (self._pending >= self.fsync_batch
+                    or time.monotonic() - self._last_sync >= self.fsync_interval):
+                self._sync()
+
+    def append(self, timestamp, instance_id, values):
+        self._write(self.schema.encode(timestamp, instance_id, values), 1)
+
+    def append_many(self, timestamps, instance_ids, values):
+        """ 여러 레코드를 한 번에 기록 (values: shape (n, 채널 수)) """
+        # 세그먼트 경계에서 레코드가 잘리지 않도록 세그먼트 크기 단위로 나눠 쓴다
+        per_segment = max(1, (self.segment_bytes - len(self._header)) // self.schema.size)
+        for start in range(0, len(timestamps), per_segment):
+            stop = start + per_segment
+            ids = instance_ids if isinstance(instance_ids, int) else instance_ids[start:stop]
+            data = self.schema.pack_many(timestamps[start:stop], ids, values[start:stop])
+            self._write(data, len(data) // self.schema.size)
+
+    def flush(self):
+        with self._lock:
+            self._sync()
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._sync()
+                self._file.close()
+                self._file = None
+
+
+# ----------------------------- TelemetryLog 클래스 -----------------------------
+class TelemetryLog:
+    """
+    수집기(info/load/sensor)별 SegmentWriter를 묶은 로그 디렉터리
+    - schemas: {수집기 이름: RecordSchema}
+    - 여러 수집기 스레드가 함께 써도 된다 (수집기마다 잠금 1개)
+    - name_instance()로 알린 인스턴스 이름은 instances.json에 남아
+      이름으로 질의할 수 있다 (TelemetryIndex)
+    """
+
+    def __init__(self, directory, schemas, **writer_options):
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.writers = {
+            kind: SegmentWriter(directory, schema, **writer_options)
+            for kind, schema in schemas.items()
+        }
+        self.names = read_instance_names(directory)
+        self._names_lock = threading.Lock()
+
+    def append(self, kind, timestamp, instance_id, values):
+        self.writers[kind].append(timestamp, instance_id, values)
+
+    def name_instance(self, name, instance_id):
+        """ 인스턴스 이름 -> 숫자 ID 대응을 기록 (바뀐 경우에만 instances.json을 다시 쓴다) """
+        if self.names.get(name) == instance_id:
+            return
+        import json
+        with self._names_lock:
+            self.names[name] = int(instance_id)
+            path = os.path.join(self.directory, NAMES_FILE)
+            with open(path + '.tmp', 'w', encoding='utf-8') as f:
+                json.dump(self.names, f, ensure_ascii=False)
+            os.replace(path + '.tmp', path)
+
+    def flush(self):
+        for writer in self.writers.values():
+            writer.flush()
+
+    def close(self):
+        for writer in self.writers.values():
+            writer.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def read_instance_names(directory):
+    """ 로그 디렉터리의 {인스턴스 이름: 숫자 ID} (기록이 없으면 빈 딕셔너리) """
+    path = os.path.join(directory, NAMES_FILE)
+    if not os.path.exists(path):
+        return {}
+    import json
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+# ----------------------------- TelemetryLogReader 클래스 -----------------------------
+class TelemetryLogReader:
+    """
+    세그먼트를 mmap으로 열어 복사 없이 레코드를 훑는 리더
+    - iter_blocks(): 세그먼트마다 numpy 구조 배열 뷰 1개
+    - iter_records(): 레코드 1개씩 (뷰의 원소)
+    - 쓰다 만 마지막 레코드(비정상 종료)는 건너뛴다
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+
+    def kinds(self):
+        kinds = set()
+        for name in os.listdir(self.directory):
+            match = _SEGMENT_RE.match(name)
+            if match:
+                kinds.add(match.group('kind'))
+        return sorted(kinds)
+
+    def segments(self, kind):
+        return list_segments(self.directory, kind)
+
+    @staticmethod
+    def open_segment(path):
+        """ 세그먼트 1개를 mmap하여 (스키마, 레코드 뷰, mmap 객체)를 반환 """
+        with open(path, 'rb') as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        schema, offset = RecordSchema.from_header(mapped)
+        count = (len(mapped) - offset) // schema.size
+        return schema, schema.unpack_many(mapped, offset=offset, count=count), mapped
+
+    def iter_blocks(self, kind):
+        """ (세그먼트 경로, 레코드 뷰)를 세그먼트 순서대로 생성 """
+        for path in self.segments(kind):
+            _, records, mapped = self.open_segment(path)
+            yield path, records
+            del records
+            try:
+                mapped.close()
+            except BufferError:
+                pass  # 호출자가 아직 뷰를 들고 있으면 GC가 닫게 둔다
+
+    def iter_records(self, kind):
+        for _, records in self.iter_blocks(kind):
+            yield from records
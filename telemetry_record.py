@@ -0,0 +1,249 @@
+# ----------------------------- 모듈 임포트 -----------------------------
+import struct
+import threading
+import zlib
+
+# numpy/json은 여러 레코드 변환(pack_many/unpack_many)이나 JSON 렌더링에서 처음 import한다
+# (레코드 1개 encode/decode만 하는 수집기는 numpy를 불러오지 않는다)
+
+
+# ----------------------------- 바이너리 레코드 형식 -----------------------------
+# 헤더 (리틀 엔디언)
+#   매직 4바이트 b'MREC' | 버전 u16 | 레코드 크기 u16 | 채널 수 u8 | 종류 이름 길이 u8
+#   종류 이름 (utf-8)
+#   채널 스키마 표: [이름 길이 u8 | 이름 (utf-8) | 값 형식 1바이트 ('f' 또는 'd')] * 채널 수
+# 레코드 (고정 길이)
+#   타임스탬프 f64 | 인스턴스 ID u32 | 채널 값 * 채널 수
+RECORD_MAGIC = b'MREC'
+RECORD_VERSION = 1
+_HEADER = struct.Struct('<4sHHBB')
+_NUMPY_TYPES = {'f': '<f4', 'd': '<f8'}
+_NAN = float('nan')  # 값이 없는 채널 (psutil이 None을 돌려준 경우 등)
+
+# 레코드 스트림 (표준 출력처럼 여러 종류가 섞이는 출력 - RecordStreamWriter)
+#   프레임: 프레임 형식 u8 | 본문 길이 u16 | 스키마 키 u32 | 본문
+#   형식 0(스키마): 본문은 header() - 스키마 키(헤더의 CRC32)를 이 스키마에 배정
+#   형식 1(레코드): 본문은 해당 스키마의 고정 길이 레코드 1개
+#   키가 헤더에서 정해지므로 여러 프로세스가 같은 스트림에 써도 키가 겹치지 않는다
+FRAME_SCHEMA = 0
+FRAME_RECORD = 1
+_FRAME = struct.Struct('<BHI')
+
+
+class RecordFormatError(ValueError):
+    """ 헤더나 레코드가 형식에 맞지 않을 때 발생 """
+
+
+# ----------------------------- RecordSchema 클래스 -----------------------------
+class RecordSchema:
+    """
+    수집기 한 종류(sensor, load ...)의 고정 길이 바이너리 레코드 형식
+    - encode()/decode(): 레코드 1개
+    - pack_many()/unpack_many(): numpy로 여러 레코드를 한 번에 변환
+    - header()/from_header(): 버전과 채널 스키마 표가 담긴 스트림 헤더
+      (여러 종류가 섞이는 출력은 RecordStreamWriter/iter_frames()의 프레임 스트림)
+    - to_json(): 사람이 읽을 때만 쓰는 선택적 JSON 렌더링
+    """
+
+    def __init__(self, kind, channels, value_format='d'):
+        if value_format not in _NUMPY_TYPES:
+            raise RecordFormatError(f'지원하지 않는 값 형식: {value_format}')
+        self.kind = kind
+        self.channels = tuple(channels)
+        self.value_format = value_format
+        self._struct = struct.Struct(f'<dI{len(self.channels)}{value_format}')
+        self.size = self._struct.size
+        self._dtype = None
+
+    @property
+    def dtype(self):
+        """ 레코드 1개에 해당하는 numpy 구조 dtype (처음 쓸 때 만든다) """
+        if self._dtype is None:
+            import numpy as np
+            dtype = np.dtype([
+                ('timestamp', '<f8'),
+                ('instance_id', '<u4'),
+                ('values', _NUMPY_TYPES[self.value_format], (len(self.channels),)),
+            ])
+            assert dtype.itemsize == self.size
+            self._dtype = dtype
+        return self._dtype
+
+    def __eq__(self, other):
+        return (isinstance(other, RecordSchema)
+                and (self.kind, self.channels, self.value_format)
+                == (other.kind, other.channels, other.value_format))
+
+    def __repr__(self):
+        return f'RecordSchema({self.kind!r}, {len(self.channels)} channels, {self.value_format!r})'
+
+    # ----- 헤더 -----
+    def header(self):
+        kind = self.kind.encode('utf-8')
+        parts = [_HEADER.pack(RECORD_MAGIC, RECORD_VERSION, self.size, len(self.channels), len(kind)),
+                 kind]
+        for channel in self.channels:
+            name = channel.encode('utf-8')
+            parts.append(struct.pack('<B', len(name)))
+            parts.append(name)
+            parts.append(self.value_format.encode('ascii'))
+        return b''.join(parts)
+
+    @classmethod
+    def from_header(cls, buf, offset=0):
+        """ 헤더를 읽어 (스키마, 헤더 다음 위치)를 반환 """
+        buf = memoryview(buf)
+        try:
+            magic, version, size, count, kind_len = _HEADER.unpack_from(buf, offset)
+        except struct.error as e:
+            raise RecordFormatError(f'헤더가 잘렸습니다: {e}') from None
+        if magic != RECORD_MAGIC:
+            raise RecordFormatError(f'매직 값이 다릅니다: {bytes(magic)!r}')
+        if version != RECORD_VERSION:
+            raise RecordFormatError(f'지원하지 않는 버전: {version}')
+        pos = offset + _HEADER.size
+        kind = bytes(buf[pos:pos + kind_len]).decode('utf-8')
+        pos += kind_len
+        channels = []
+        value_format = None
+        for _ in range(count):
+            name_len = buf[pos]
+            pos += 1
+            channels.append(bytes(buf[pos:pos + name_len]).decode('utf-8'))
+            pos += name_len
+            fmt = chr(buf[pos])
+            pos += 1
+            if value_format not in (None, fmt):
+                raise RecordFormatError('채널마다 값 형식이 다른 스키마는 지원하지 않습니다.')
+            value_format = fmt
+        schema = cls(kind, channels, value_format or 'd')
+        if schema.size != size:
+            raise RecordFormatError(f'레코드 크기 불일치: {size} != {schema.size}')
+        return schema, pos
+
+    # ----- 레코드 1개 -----
+    def encode(self, timestamp, instance_id, values):
+        """ values는 채널 순서의 숫자 나열 또는 채널 이름 -> 값 매핑 (None은 NaN으로 기록) """
+        return self._struct.pack(timestamp, instance_id, *self._channel_values(values))
+
+    def encode_into(self, buf, offset, timestamp, instance_id, values):
+        self._struct.pack_into(buf, offset, timestamp, instance_id, *self._channel_values(values))
+
+    def _channel_values(self, values):
+        if hasattr(values, 'keys'):
+            values = [values[channel] for channel in self.channels]
+        if None in values:
+            values = [_NAN if value is None else value for value in values]
+        return values
+
+    def decode(self, buf, offset=0):
+        """ (타임스탬프, 인스턴스 ID, 값 튜플) 반환 """
+        fields = self._struct.unpack_from(buf, offset)
+        return fields[0], fields[1], fields[2:]
+
+    # ----- 여러 레코드 -----
+    def pack_many(self, timestamps, instance_ids, values):
+        """
+        여러 레코드를 한 번에 바이트열로 변환
+        - values: shape (n, 채널 수) 배열
+        - instance_ids: 스칼라 또는 길이 n 배열
+        """
+        import numpy as np
+        timestamps = np.asarray(timestamps)
+        records = np.empty(len(timestamps), dtype=self.dtype)
+        records['timestamp'] = timestamps
+        records['instance_id'] = instance_ids
+        records['values'] = values
+        return records.tobytes()
+
+    def unpack_many(self, buf, offset=0, count=-1):
+        """ 바이트열을 복사 없이 numpy 구조 배열 뷰로 해석 """
+        import numpy as np
+        return np.frombuffer(buf, dtype=self.dtype, count=count, offset=offset)
+
+    # ----- 선택적 JSON 렌더링 -----
+    def to_json(self, timestamp, instance_id, values, **dumps_kwargs):
+        import json
+        record = {'kind': self.kind, 'timestamp': timestamp, 'instance_id': instance_id}
+        record.update(zip(self.channels, (float(v) for v in values)))
+        return json.dumps(record, ensure_ascii=False, **dumps_kwargs)
+
+
+# ----------------------------- 레코드 스트림 -----------------------------
+class RecordStreamWriter:
+    """
+    여러 종류의 레코드를 한 바이너리 스트림에 프레임으로 섞어 쓴다 (파일 맨 앞 헤더 1개 대신)
+    - 종류마다 처음 한 번 스키마 프레임을 레코드 프레임과 함께 쓰고, 그 뒤로는 레코드 프레임만 쓴다
+    - out: bytes를 받는 write()가 있는 객체 (바이너리 파일 등)
+    - 여러 스레드가 같은 스트림에 써도 스키마 프레임이 그 종류의 첫 레코드보다 먼저 나간다
+    - 텍스트는 섞지 않는다 (섞이면 iter_frames()가 더 읽지 못한다)
+    - out이 BatchingWriter처럼 dropped/errors를 세면, 그 값이 늘 때(큐에서 버려졌거나 sink가
+      실패해 스키마 프레임이 스트림에 닿지 못했을 수 있음) 모든 스키마를 다시 알린다
+    """
+
+    def __init__(self, out):
+        self.out = out
+        self._keys = {}  # (종류, 채널, 값 형식) -> 알린 스키마 키
+        self._lock = threading.Lock()
+        self._lost = self._lost_count()
+
+    def _lost_count(self):
+        return getattr(self.out, 'dropped', 0) + getattr(self.out, 'errors', 0)
+
+    def write(self, schema, timestamp, instance_id, values):
+        """ 레코드 1개를 프레임으로 쓴다 (out.write()의 반환값을 그대로 반환) """
+        return self.write_encoded(schema, schema.encode(timestamp, instance_id, values))
+
+    def write_encoded(self, schema, record):
+        """ schema.encode()로 이미 만든 레코드 바이트열을 프레임으로 쓴다 """
+        identity = (schema.kind, schema.channels, schema.value_format)
+        lost = self._lost_count()
+        if lost != self._lost:
+            with self._lock:
+                self._keys.clear()
+                self._lost = lost
+        key = self._keys.get(identity)
+        if key is not None:
+            return self.out.write(_FRAME.pack(FRAME_RECORD, len(record), key) + record)
+        with self._lock:
+            key = self._keys.get(identity)
+            if key is not None:
+                return self.out.write(_FRAME.pack(FRAME_RECORD, len(record), key) + record)
+            header = schema.header()
+            key = zlib.crc32(header)
+            written = self.out.write(_FRAME.pack(FRAME_SCHEMA, len(header), key) + header
+                                     + _FRAME.pack(FRAME_RECORD, len(record), key) + record)
+            if written is not False:  # 버려졌으면 다음 레코드와 함께 다시 알린다
+                self._keys[identity] = key
+            return written
+
+
+def iter_frames(f, kind=None):
+    """
+    레코드 스트림(RecordStreamWriter 출력)에서 (스키마, 레코드 바이트열)을 차례로 생성
+    - f: 바이너리 파일 객체, 쓰다 만 마지막 프레임에서 멈춘다
+    - 스키마 프레임을 보지 못한 키의 레코드는 건너뛴다
+    - kind를 주면 다른 종류의 레코드 프레임은 읽지 않고 넘긴다 (f가 seek()를 지원해야 함)
+    """
+    schemas = {}
+    while True:
+        head = f.read(_FRAME.size)
+        if len(head) < _FRAME.size:
+            return
+        frame_type, length, key = _FRAME.unpack(head)
+        if kind is not None and frame_type == FRAME_RECORD:
+            schema = schemas.get(key)
+            if schema is None or schema.kind != kind:
+                f.seek(length, 1)
+                continue
+        payload = f.read(length)
+        if len(payload) < length:
+            return
+        if frame_type == FRAME_SCHEMA:
+            schemas[key] = RecordSchema.from_header(payload)[0]
+        elif frame_type == FRAME_RECORD:
+            schema = schemas.get(key)
+            if schema is not None and length == schema.size:
+                yield schema, payload
+        else:
+            raise RecordFormatError(f'알 수 없는 프레임 형식: {frame_type}')
@@ -0,0 +1,23 @@
+# ----------------------------- 모듈 임포트 -----------------------------
+import math
+
+from deadband import EXACT, Deadband
+
+
+NAN = math.nan
+
+
+def test_deadband_threshold():
+    band = Deadband(absolute=0.5, relative=0.1)
+    assert not band.exceeded(10.0, 10.9)
+    assert band.exceeded(10.0, 11.1)
+    assert not band.exceeded(1.0, 1.4)
+    assert band.exceeded(1.0, 1.6)
+
+
+def test_nan_on_one_side_is_a_change():
+    band = Deadband(absolute=1.0)
+    assert band.exceeded(20.0, NAN)
+    assert band.exceeded(NAN, 20.0)
+    assert not band.exceeded(NAN, NAN)
+    assert EXACT.exceeded(0.0, NAN)
@@ -0,0 +1,71 @@
+# ----------------------------- 모듈 임포트 -----------------------------
+import sys
+import threading
+
+import numpy as np
+import pytest
+
+from mars_mission_computer import SENSOR_CHANNELS, SENSOR_KEYS, DummySensor, make_simulator
+
+
+def test_generate_matches_set_env_ranges_and_rounding():
+    block = DummySensor().generate(5000, seed=1)
+    assert block.shape == (len(SENSOR_KEYS), 5000)
+    assert block.dtype == np.float64
+    for row, (_, low, high, ndigits) in zip(block, SENSOR_CHANNELS):
+        assert low <= row.min() and row.max() <= high
+        assert np.array_equal(row, np.round(row, ndigits))
+
+
+def test_generate_is_reproducible_with_seed():
+    sensor = DummySensor()
+    assert np.array_equal(sensor.generate(100, seed=42), sensor.generate(100, seed=42))
+    assert not np.array_equal(sensor.generate(100, seed=42), sensor.generate(100, seed=43))
+    assert sensor.generate(0).shape == (len(SENSOR_KEYS), 0)
+
+
+def test_set_env_fills_every_channel():
+    sensor = DummySensor()
+    sensor.set_env()
+    values = sensor.get_env()
+    assert tuple(values) == SENSOR_KEYS
+    for key, low, high, _ in SENSOR_CHANNELS:
+        assert low <= values[key] <= high
+
+
+@pytest.mark.parametrize('make_sensor', [
+    DummySensor,
+    lambda: make_simulator(seed=0).sensor(0, 5.0),
+], ids=['dummy', 'simulated'])
+def test_published_snapshot_never_changes_while_read(make_sensor):
+    sensor = make_sensor()
+    sensor.set_env()
+    stop = threading.Event()
+    torn = []
+
+    def writer():
+        while not stop.is_set():
+            sensor.set_env()
+
+    def reader():
+        for _ in range(2000):
+            snapshot = sensor.get_env()
+            first = [snapshot[key] for key in SENSOR_KEYS]  # 버스/이력 기록처럼 채널별로 읽는다
+            again = [snapshot[key] for key in SENSOR_KEYS]
+            if again != first or len(snapshot) != len(SENSOR_KEYS):
+                torn.append(first)
+
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)  # 스레드 전환을 자주 일으켜 경합을 드러낸다
+    try:
+        threads = [threading.Thread(target=writer)] + [threading.Thread(target=reader)
+                                                       for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads[1:]:
+            thread.join()
+    finally:
+        stop.set()
+        threads[0].join()
+        sys.setswitchinterval(interval)
+    assert torn == []
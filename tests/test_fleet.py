@@ -0,0 +1,63 @@
+# ----------------------------- 모듈 임포트 -----------------------------
+import numpy as np
+
+from fleet import FLEET_JOBS, Fleet
+from mars_mission_computer import SENSOR_CHANNELS
+from sim_clock import VirtualClock
+
+
+class RecordingFleet(Fleet):
+    def __init__(self, *args, **options):
+        super().__init__(*args, **options)
+        self.calls = []
+        self.load_sampler.cpu_percent = lambda: 12.5   # 호스트 부하와 무관하게
+
+    def step(self, job, rows, now):
+        self.calls.append((now, job, rows.tolist()))
+        super().step(job, rows, now)
+
+
+def test_phases_spread_instances_and_every_instance_runs_each_period():
+    fleet = RecordingFleet(np.arange(1, 51), seed=0, clock=VirtualClock(start=1000.0))
+    samples = fleet.run(40.0)
+    # 센서 5초 주기 x 8회, 부하/정보 20초 주기 x 2회
+    assert samples == 50 * 8 + 50 * 2 + 50 * 2
+    assert fleet.clock.time() == 1040.0
+    sensor = [call for call in fleet.calls if call[1] == 'sensor']
+    assert sensor[:2] == [(1000.0, 'sensor', list(range(0, 50, 5))),
+                          (1001.0, 'sensor', list(range(1, 50, 5)))]
+    column = [name for name, _ in FLEET_JOBS].index('sensor')
+    assert fleet.updated[:, column].tolist() == [1035.0 + i % 5 for i in range(50)]
+
+
+def test_calls_are_in_time_then_job_order():
+    fleet = RecordingFleet(np.arange(1, 31), clock=VirtualClock(start=0.0))
+    fleet.run(60.0)
+    order = {name: i for i, (name, _) in enumerate(FLEET_JOBS)}
+    keys = [(now, order[job]) for now, job, _ in fleet.calls]
+    assert keys == sorted(keys)
+    assert [job for now, job, _ in fleet.calls if now == 0.0] == ['info', 'load', 'sensor']
+
+
+def test_seed_reproduces_sensor_values_within_range():
+    runs = []
+    for _ in range(2):
+        fleet = Fleet(np.arange(1, 21), seed=11, clock=VirtualClock(start=0.0))
+        fleet.run(10.0)
+        runs.append(fleet.sensor.copy())
+    assert np.array_equal(runs[0], runs[1])
+    for column, (_, low, high, ndigits) in enumerate(SENSOR_CHANNELS):
+        values = runs[0][:, column]
+        assert low <= values.min() and values.max() <= high
+        assert np.allclose(values, np.round(values, ndigits))
+    assert Fleet(np.arange(1, 3), clock=VirtualClock()).computers[1].name == 'Fleet-2'
+
+
+def test_first_cpu_reading_skips_the_load_round():
+    fleet = RecordingFleet(np.arange(1, 5), clock=VirtualClock(start=0.0))
+    fleet.load_sampler.cpu_percent = lambda: None
+    fleet.run(1.0)
+    column = [name for name, _ in FLEET_JOBS].index('load')
+    assert not fleet.updated[:, column].any()
+    assert fleet.computers[0].get_load() == {'CPU_실시간_사용량_%': 0.0,
+                                             '메모리_실시간_사용량_%': 0.0}
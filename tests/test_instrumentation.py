@@ -0,0 +1,61 @@
+# ----------------------------- 모듈 임포트 -----------------------------
+import io
+
+from collector_engine import CollectorEngine, MetricSource
+from instrumentation import BUCKET_BOUNDS, Instrumentation, LatencyHistogram
+from output_sink import MemorySink
+from telemetry_record import RecordStreamWriter, iter_frames
+
+
+class CountingSource(MetricSource):
+    name = 'load'
+    schema = ('값',)
+
+    def __init__(self):
+        self.period = 1.0
+        self.reads = 0
+
+    def read(self, now):
+        self.reads += 1
+        return {'값': float(self.reads)}
+
+
+def engine(output_format):
+    computer = CollectorEngine('Base-1', instance_id=1, sources=[CountingSource()],
+                               output_format=output_format, sink=MemorySink())
+    computer.instrumentation = Instrumentation()
+    return computer
+
+
+def test_text_and_binary_paths_record_every_phase():
+    for output_format in ('json', 'binary'):
+        computer = engine(output_format)
+        out = io.BytesIO()
+        computer.binary_out = RecordStreamWriter(out)
+        for _ in range(3):
+            computer.collect('load')
+        phases = computer.instrumentation.report()['load']
+        assert {phase: stats['count'] for phase, stats in phases.items()} == {
+            'acquire': 3, 'publish': 3, 'serialize': 3, 'emit': 3}
+    out.seek(0)
+    assert [schema.decode(raw)[2] for schema, raw in iter_frames(out)] == [
+        (1.0,), (2.0,), (3.0,)]
+
+
+def test_lateness_is_clamped_to_zero():
+    instrumentation = Instrumentation()
+    instrumentation.record_lateness('load', -0.5)
+    instrumentation.record_lateness('load', 0.25)
+    stats = instrumentation.report()['load']['lateness']
+    assert stats['count'] == 2
+    assert stats['max_us'] == 250000.0
+
+
+def test_histogram_percentile_is_bucket_upper_bound():
+    histogram = LatencyHistogram()
+    assert histogram.percentile(50) is None
+    for _ in range(99):
+        histogram.record(1e-4)
+    histogram.record(1.0)
+    assert histogram.percentile(50) == min(b for b in BUCKET_BOUNDS if b >= 1e-4)
+    assert histogram.percentile(100) == min(b for b in BUCKET_BOUNDS if b >= 1.0)
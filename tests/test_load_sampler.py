@@ -0,0 +1,55 @@
+# ----------------------------- 모듈 임포트 -----------------------------
+from collections import namedtuple
+
+from collector_engine import PsutilLoadSource
+from load_sampler import CpuLoadSampler, _busy_and_total
+
+
+LinuxTimes = namedtuple('LinuxTimes', 'user nice system idle iowait irq softirq steal '
+                                      'guest guest_nice')
+OtherTimes = namedtuple('OtherTimes', 'user system idle')
+
+
+def test_guest_time_is_not_counted_twice():
+    # guest(4)/guest_nice(1)는 user(10)/nice(2)에 이미 들어 있다
+    busy, total = _busy_and_total(LinuxTimes(10.0, 2.0, 3.0, 80.0, 5.0, 0.0, 0.0, 0.0,
+                                             4.0, 1.0))
+    assert total == 100.0
+    assert busy == 15.0
+
+
+def test_platforms_without_guest_fields():
+    assert _busy_and_total(OtherTimes(10.0, 5.0, 85.0)) == (15.0, 100.0)
+
+
+class FakeTimes:
+    """ psutil.cpu_times(percpu=True) 대용 - 코어 1개 """
+
+    def __init__(self):
+        self.busy = 100.0
+        self.idle = 900.0
+
+    def __call__(self, percpu=True):
+        return [OtherTimes(self.busy, 0.0, self.idle)]
+
+
+def test_first_sample_is_unavailable_not_zero(monkeypatch):
+    import psutil
+    times = FakeTimes()
+    monkeypatch.setattr(psutil, 'cpu_times', times)
+    sampler = CpuLoadSampler(min_window=0.05)
+    assert sampler.cpu_percent() is None  # 만든 직후: 측정 구간 없음
+    times.busy += 0.01                    # 구간이 min_window보다 짧으면 기준점 유지
+    assert sampler.cpu_percent() is None
+    times.busy += 0.29
+    times.idle += 0.7
+    assert sampler.cpu_percent() == 30.0  # 기준점부터의 1초 전체로 계산
+    times.idle += 0.01
+    assert sampler.cpu_percent() == 30.0  # 짧은 구간: 직전 값
+
+
+def test_load_source_skips_unmeasured_round(monkeypatch):
+    import psutil
+    monkeypatch.setattr(psutil, 'cpu_times', FakeTimes())
+    source = PsutilLoadSource(1.0)
+    assert source.read(0.0) is None
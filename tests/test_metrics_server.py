@@ -0,0 +1,42 @@
+# ----------------------------- 모듈 임포트 -----------------------------
+import threading
+
+from metrics_server import MetricsRegistry
+
+
+def test_sample_timestamps_are_a_separate_family():
+    registry = MetricsRegistry()
+    registry.publish('sensor', 'B', 2, {'temperature': -3.5}, 11.0)
+    registry.publish('load', 'A', 1, {'cpu': 1.5, 'label': 'text'}, 10.0)
+    registry.publish('info', 'A', 1, {'os': 'Mars OS'}, 9.0)
+    assert registry.refresh()
+    lines = registry.snapshot[0].decode().splitlines()
+    types = [line for line in lines if line.startswith('# TYPE')]
+    assert types == ['# TYPE mars_load gauge', '# TYPE mars_sensor gauge',
+                     '# TYPE mars_sample_timestamp_seconds gauge']
+    # 각 계열의 샘플은 자기 TYPE 줄 바로 뒤에 모여 있다
+    family = None
+    for line in lines:
+        if line.startswith('# TYPE'):
+            family = line.split()[2]
+        else:
+            assert line.split('{', 1)[0] == family
+    assert sum(line.startswith('mars_sample_timestamp_seconds') for line in lines) == 3
+    assert not registry.refresh()
+
+
+def test_concurrent_publishes_are_not_lost():
+    registry = MetricsRegistry()
+    registry.refresh()
+
+    def publish(instance):
+        for i in range(2000):
+            registry.publish('load', instance, 0, {'cpu': i}, float(i))
+
+    threads = [threading.Thread(target=publish, args=(f'M-{n}',)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert registry.refresh()
+    assert registry.snapshot[0].decode().count('channel="cpu"} 1999') == 4
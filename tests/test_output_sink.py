@@ -0,0 +1,102 @@
+# ----------------------------- 모듈 임포트 -----------------------------
+import io
+import threading
+import time
+
+import pytest
+
+from output_sink import BatchingWriter, BinaryStdoutSink, OutputSink
+
+
+class BrokenSink(OutputSink):
+    """ 처음 failures번은 파이프가 끊긴 것처럼 실패 """
+
+    def __init__(self, failures):
+        self.failures = failures
+        self.records = []
+
+    def write_batch(self, records):
+        if self.failures:
+            self.failures -= 1
+            raise BrokenPipeError('출력 파이프가 닫혔습니다')
+        self.records.extend(records)
+
+
+def test_sink_errors_are_counted_and_writer_keeps_draining():
+    sink = BrokenSink(failures=1)
+    writer = BatchingWriter(sink, max_batch=2, flush_interval=0.01, queue_size=4)
+    for i in range(100):  # 큐(4개)보다 훨씬 많이 - 쓰기 스레드가 죽으면 여기서 멈춘다
+        assert writer.write(i)
+    writer.flush(timeout=5)
+    assert writer.errors == 1
+    assert isinstance(writer.last_error, BrokenPipeError)
+    assert writer.dropped == 2
+    assert sink.records == list(range(2, 100))
+    writer.close(timeout=5)
+
+
+class ExitingSink(OutputSink):
+    """ 쓰기 스레드를 끝내 버리는 sink (Exception이 아니라 잡히지 않는다) """
+
+    def write_batch(self, records):
+        raise SystemExit
+
+
+@pytest.mark.filterwarnings('ignore::pytest.PytestUnhandledThreadExceptionWarning')
+def test_write_fails_fast_without_writer_thread():
+    writer = BatchingWriter(ExitingSink(), flush_interval=0.01, queue_size=1)
+    writer.write('first')
+    writer._thread.join(5)
+    assert not writer._thread.is_alive()
+    done = threading.Event()
+    threading.Thread(target=lambda: (writer.write('x'), writer.write('y'), done.set()),
+                     daemon=True).start()
+    assert done.wait(5)  # 큐(1개)가 차도 'block' 정책에서 멈추지 않는다
+    assert writer.dropped == 2
+
+
+def test_binary_records_are_batched():
+    out = io.BytesIO()
+    writer = BatchingWriter(BinaryStdoutSink(out), max_batch=3)
+    for chunk in (b'ab', b'cd', b'ef', b'gh'):
+        writer.write(chunk)
+    writer.flush(timeout=5)
+    assert out.getvalue() == b'abcdefgh'
+    writer.close(timeout=5)
+
+
+class SlowSink(OutputSink):
+    def __init__(self, delay):
+        self.delay = delay
+        self.records = []
+
+    def write_batch(self, records):
+        time.sleep(self.delay)
+        self.records.extend(records)
+
+
+def test_drop_oldest_never_evicts_flush_signal():
+    """ 느린 sink + 작은 큐에서 drop_oldest가 flush 신호를 버려 flush()가 멈추던 문제 """
+    sink = SlowSink(0.01)
+    writer = BatchingWriter(sink, max_batch=2, flush_interval=0.001, queue_size=4,
+                            policy='drop_oldest')
+    results = []
+    flusher = threading.Thread(target=lambda: results.append(writer.flush(timeout=5)))
+    for i in range(50):
+        writer.write(i)
+        if i == 10:
+            flusher.start()
+    flusher.join(10)
+    assert results == [True]
+    assert writer.flush(timeout=5)
+    assert len(sink.records) + writer.dropped == 50
+    writer.close(timeout=5)
+
+
+def test_flush_wait_is_bounded():
+    writer = BatchingWriter(SlowSink(1.0), max_batch=1, control_timeout=0.05)
+    writer.write('x')
+    began = time.monotonic()
+    assert writer.flush() is False
+    assert time.monotonic() - began < 0.5
+    writer.close(timeout=5)
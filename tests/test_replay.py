@@ -0,0 +1,82 @@
+# ----------------------------- 모듈 임포트 -----------------------------
+from collector_engine import CollectorEngine, MetricSource
+from output_sink import MemorySink
+from replay import Pacer, Replayer, iter_chunks, iter_recording
+from sim_clock import VirtualClock
+from telemetry_log import TelemetryLog, TelemetryLogReader
+from telemetry_record import RecordSchema, RecordStreamWriter
+
+
+LOAD = RecordSchema('load', ('CPU', 'MEM'))
+SENSOR = RecordSchema('sensor', ('온도',))
+
+
+class ValueSource(MetricSource):
+    def __init__(self, name, channels):
+        self.name = name
+        self.schema = channels
+        self.period = 1.0
+
+    def read(self, now):
+        return dict.fromkeys(self.schema, 0.0)
+
+
+def make_engine(instance_id):
+    return CollectorEngine(f'Base-{instance_id}', instance_id=instance_id, sink=MemorySink(),
+                           sources=[ValueSource('load', LOAD.channels),
+                                    ValueSource('sensor', SENSOR.channels)])
+
+
+def write_stream(path):
+    with open(path, 'wb') as f:
+        stream = RecordStreamWriter(f)
+        for i in range(10):
+            stream.write(LOAD, 100.0 + i, 1 + i % 2, (i, 2 * i))
+            stream.write(SENSOR, 100.5 + i, 1, (-i,))
+
+
+def test_stream_chunks_skip_other_kinds(tmp_path):
+    path = str(tmp_path / 'capture.bin')
+    write_stream(path)
+    chunks = list(iter_chunks(path, chunk_records=4, kind='sensor'))
+    assert {schema.kind for schema, _ in chunks} == {'sensor'}
+    assert [len(records) for _, records in chunks] == [4, 4, 2]
+    timestamps = [t for _, records in iter_recording(path, 'load') for t in records['timestamp']]
+    assert timestamps == [100.0 + i for i in range(10)]
+
+
+def test_replay_preserves_original_timestamps(tmp_path):
+    path = str(tmp_path / 'capture.bin')
+    write_stream(path)
+    computers = [make_engine(1), make_engine(2)]
+    with TelemetryLog(str(tmp_path / 'out'), {'load': LOAD, 'sensor': SENSOR}) as log:
+        for computer in computers:
+            computer.log = log
+        replayer = Replayer(path, computers, speed=None)
+        assert replayer.run() == 20
+    reader = TelemetryLogReader(str(tmp_path / 'out'))
+    load = list(reader.iter_records('load'))
+    assert [float(r['timestamp']) for r in load] == [100.0 + i for i in range(10)]
+    assert [int(r['instance_id']) for r in load] == [1 + i % 2 for i in range(10)]
+    assert [r['values'].tolist() for r in load][3] == [3.0, 6.0]
+    sensor = list(reader.iter_records('sensor'))
+    assert [float(r['timestamp']) for r in sensor] == [100.5 + i for i in range(10)]
+
+
+def test_replay_skips_instances_it_does_not_own(tmp_path):
+    path = str(tmp_path / 'capture.bin')
+    write_stream(path)
+    replayer = Replayer(path, [make_engine(2)], kinds=['load'], speed=None)
+    assert replayer.run() == 5
+    assert replayer.skipped == 5
+
+
+def test_pacer_waits_on_the_given_clock():
+    clock = VirtualClock(1000.0)
+    pacer = Pacer(speed=2.0, clock=clock)
+    pacer.wait(10.0)
+    pacer.wait(14.0)
+    pacer.wait(13.0)  # 이미 지난 시각이면 기다리지 않는다
+    assert clock.time() == 1002.0
+    assert pacer.waited == 2.0
+    assert Pacer(speed=None, clock=clock).wait(50.0) is None
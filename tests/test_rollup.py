@@ -0,0 +1,63 @@
+# ----------------------------- 모듈 임포트 -----------------------------
+import numpy as np
+import pytest
+
+from rollup import RollupEngine
+
+
+TIERS = (('1min', 60.0, 600.0), ('1h', 3600.0, 4 * 3600.0))
+
+
+def feed(engine, start, stop, step=10.0, instance_id=1):
+    for timestamp in np.arange(start, stop, step):
+        engine.observe('sensor', instance_id, {'temp': float(timestamp), 'co2': 1.0}, timestamp)
+
+
+def test_bucket_boundaries_and_open_bucket():
+    engine = RollupEngine({'sensor': ('temp', 'co2')}, TIERS)
+    feed(engine, 7200.0, 7200.0 + 150.0)   # 2:00:00 ~ 2:02:20
+    result = engine.query('sensor', 1, 'temp', 7200.0, 7400.0, tier='1min')
+    assert result['start'].tolist() == [7200.0, 7260.0, 7320.0]
+    assert result['count'].tolist() == [6, 6, 3]    # 마지막은 아직 열린 구간
+    assert result['min'].tolist() == [7200.0, 7260.0, 7320.0]
+    assert result['max'].tolist() == [7250.0, 7310.0, 7340.0]
+    assert result['last'].tolist() == [7250.0, 7310.0, 7340.0]
+    assert result['mean'][0] == pytest.approx(7225.0)
+    hourly = engine.aggregate('sensor', 1, 'temp', 7200.0, 10799.0, tier='1h')
+    assert (hourly['count'], hourly['min'], hourly['max']) == (15, 7200.0, 7340.0)
+
+
+def test_retention_drops_old_buckets_and_oldest_time_ignores_empty_slots():
+    engine = RollupEngine({'sensor': ('temp', 'co2')}, TIERS)
+    minute, hour = engine.stores['sensor'].tiers
+    feed(engine, 6000.0, 6120.0)
+    # 10개 슬롯 중 2개만 찼다 - 빈 슬롯(-1)이 가장 오래된 시각으로 잡히면 안 된다
+    assert minute.oldest_time(0) == 6000.0
+    assert hour.oldest_time(0) == 3600.0
+    feed(engine, 6120.0, 6000.0 + 15 * 60.0)
+    # 보존 기간 600초(10구간)를 넘긴 앞 구간은 덮어써져 사라진다
+    assert minute.oldest_time(0) == 6000.0 + 5 * 60.0
+    starts = engine.query('sensor', 1, 'temp', 0.0, 1e9, tier='1min')['start']
+    assert starts.tolist() == [6000.0 + i * 60.0 for i in range(5, 15)]
+
+
+def test_query_picks_finest_tier_still_covering_start():
+    engine = RollupEngine({'sensor': ('temp', 'co2')}, TIERS)
+    feed(engine, 3600.0, 3600.0 + 3 * 3600.0, step=60.0)
+    end = 3600.0 + 3 * 3600.0
+    assert engine.query('sensor', 1, 'co2', end - 300.0, end)['tier'] == '1min'
+    assert engine.query('sensor', 1, 'co2', end - 3000.0, end)['tier'] == '1h'
+    whole = engine.aggregate('sensor', 1, 'co2', 3600.0, end)
+    assert (whole['tier'], whole['count'], whole['mean']) == ('1h', 180, 1.0)
+    with pytest.raises(KeyError):
+        engine.query('sensor', 1, 'co2', 0.0, end, tier='1day')
+
+
+def test_late_samples_and_instance_growth():
+    engine = RollupEngine({'sensor': ('temp', 'co2')}, TIERS)
+    engine.update('sensor', np.arange(40), np.ones((40, 2)), 120.0)
+    engine.update('sensor', [3], [[5.0, 5.0]], 10.0)   # 이미 지난 구간 - 버림
+    minute = engine.stores['sensor'].tiers[0]
+    assert minute.capacity >= 40
+    assert minute.late == 1
+    assert engine.aggregate('sensor', 39, 'temp', 0.0, 200.0, tier='1min')['count'] == 1
@@ -0,0 +1,56 @@
+# ----------------------------- 모듈 임포트 -----------------------------
+import numpy as np
+import pytest
+
+from sensor_history import SensorHistory
+
+
+CHANNELS = ('temp', 'co2')
+
+
+def filled(capacity, samples):
+    history = SensorHistory(CHANNELS, capacity)
+    for i in range(samples):
+        history.append({'temp': float(i), 'co2': 0.5 * i}, timestamp=100.0 + i)
+    return history
+
+
+def test_append_wraps_around_oldest_first():
+    history = filled(5, 12)
+    assert len(history) == 5
+    timestamps, values = history.last(10)
+    assert timestamps.tolist() == [107.0, 108.0, 109.0, 110.0, 111.0]
+    assert values[0].tolist() == [7.0, 8.0, 9.0, 10.0, 11.0]
+    assert history.last(2)[1][1].tolist() == [5.0, 5.5]
+
+
+def test_extend_matches_append_across_the_wrap():
+    expected = filled(7, 16)
+    history = filled(7, 5)
+    for start, stop in ((5, 9), (9, 16)):   # 두 번째 묶음이 버퍼 끝을 넘어 앞으로 감긴다
+        block = np.array([np.arange(start, stop, dtype=float), 0.5 * np.arange(start, stop)])
+        history.extend(block, 100.0 + np.arange(start, stop))
+    for got, want in zip(history.last(7), expected.last(7)):
+        assert np.array_equal(got, want)
+
+
+def test_extend_larger_than_capacity_keeps_the_tail():
+    history = SensorHistory(CHANNELS, 4)
+    history.extend(np.array([np.arange(10.0), np.arange(10.0)]), np.arange(10.0))
+    assert history.last(4)[0].tolist() == [6.0, 7.0, 8.0, 9.0]
+
+
+def test_range_queries_are_inclusive():
+    history = filled(5, 12)
+    timestamps, values = history.between(108.0, 110.0)
+    assert timestamps.tolist() == [108.0, 109.0, 110.0]
+    assert history.between(0.0, 50.0)[0].size == 0   # 덮어써진 구간
+    stats = history.stats('co2', start_time=109.0)
+    assert stats == {'count': 3, 'min': 4.5, 'max': 5.5, 'mean': 5.0}
+    assert history.stats('temp', last=2)['mean'] == 10.5
+    assert history.stats('temp', end_time=100.0)['count'] == 0
+
+
+def test_capacity_must_be_positive():
+    with pytest.raises(ValueError):
+        SensorHistory(CHANNELS, 0)
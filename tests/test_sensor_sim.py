@@ -0,0 +1,62 @@
+# ----------------------------- 모듈 임포트 -----------------------------
+import numpy as np
+import pytest
+
+from mars_mission_computer import SENSOR_KEYS, make_simulator
+from sensor_sim import SensorSimulator
+
+
+CHANNELS = (('temp', -100.0, 100.0, 1), ('co2', 0.0, 1.0, 3), ('o2', 0.0, 30.0, 2))
+MODEL = {
+    'temp': (0.0, 600.0, 5.0, 20.0, 0.5),
+    'co2': (0.5, 300.0, 0.05, 0.0, 0.0),
+    'o2': (20.0, 300.0, 1.0, 0.0, 0.0),
+}
+
+
+def run(seed, steps=50):
+    simulator = SensorSimulator(CHANNELS, MODEL, correlation={('co2', 'o2'): -0.8},
+                                count=8, seed=seed)
+    return np.array([simulator.step(60.0).copy() for _ in range(steps)])
+
+
+def test_same_seed_reproduces_the_whole_run():
+    assert np.array_equal(run(5), run(5))
+    assert not np.array_equal(run(5), run(6))
+
+
+def test_row_subsets_advance_deterministically():
+    values = []
+    for _ in range(2):
+        simulator = make_simulator(count=6, seed=9)
+        for now in (5.0, 10.0, 15.0):
+            simulator.advance(np.array([0, 2, 4]), now)
+            simulator.advance(np.array([1, 3, 5]), now + 2.5)
+        values.append(simulator.state.copy())
+    assert np.array_equal(values[0], values[1])
+    assert simulator.time.tolist() == [15.0, 17.5] * 3
+
+
+def test_noise_correlation_and_clipping():
+    samples = run(1, steps=400).reshape(-1, 3)
+    rho = np.corrcoef(samples[:, 1], samples[:, 2])[0, 1]
+    assert rho < -0.5
+    low = np.array([channel[1] for channel in CHANNELS])
+    high = np.array([channel[2] for channel in CHANNELS])
+    assert ((samples >= low) & (samples <= high)).all()
+
+
+def test_simulated_sensor_matches_dummy_sensor_interface():
+    sensor = make_simulator(count=2, seed=3).sensor(1, dt=5.0)
+    before = sensor.get_env()
+    sensor.set_env()
+    after = sensor.get_env()
+    assert tuple(after) == SENSOR_KEYS
+    assert after is not before   # 통째로 교체 (DummySensor와 같은 규칙)
+    assert sensor.simulator.time[1] == 5.0
+    assert sensor.read(20.0) is sensor.get_env()
+
+
+def test_invalid_correlation_is_rejected():
+    with pytest.raises(ValueError):
+        SensorSimulator(CHANNELS, MODEL, correlation={('co2', 'o2'): 1.5}, seed=0)
@@ -0,0 +1,89 @@
+# ----------------------------- 모듈 임포트 -----------------------------
+import pickle
+import threading
+
+import pytest
+
+from collector_engine import CollectorEngine, MetricSource
+from output_sink import MemorySink
+from sim_clock import VirtualClock, run_simulation
+
+
+class TickSource(MetricSource):
+    def __init__(self, name, period, events):
+        self.name = name
+        self.period = period
+        self.events = events
+
+    def read(self, now):
+        self.events.append((now, self.engine, self.name))
+        return None
+
+
+def make_engines(clock, events):
+    engines = []
+    for instance_id in (1, 2):
+        sources = [TickSource('fast', 2.0, events), TickSource('slow', 5.0, events)]
+        engine = CollectorEngine(f'Base-{instance_id}', instance_id, sources,
+                                 sink=MemorySink(), clock=clock)
+        for source in sources:
+            source.engine = instance_id
+        engines.append(engine)
+    return engines
+
+
+def test_run_simulation_is_ordered_and_deterministic():
+    runs = []
+    for _ in range(2):
+        events = []
+        clock = VirtualClock(start=100.0)
+        executed = run_simulation(make_engines(clock, events), clock, 10.0)
+        assert clock.time() == 110.0
+        runs.append(events)
+        assert executed == len(events) == 2 * (5 + 2)
+    assert runs[0] == runs[1]
+    # 시각 순서, 같은 시각이면 인스턴스 순서 → 작업(등록) 순서
+    assert runs[0] == sorted(runs[0], key=lambda e: (e[0], e[1], e[2] != 'fast'))
+    assert runs[0][:4] == [(100.0, 1, 'fast'), (100.0, 1, 'slow'),
+                           (100.0, 2, 'fast'), (100.0, 2, 'slow')]
+
+
+# until을 넘어 자려는 스레드는 SystemExit로 끝난다 (threading은 무시, pytest는 경고)
+@pytest.mark.filterwarnings('ignore::pytest.PytestUnhandledThreadExceptionWarning')
+def test_threads_wake_in_time_then_name_order():
+    clock = VirtualClock(start=0.0, until=6.0, participants=2)
+    events = []
+
+    def loop(period):
+        while True:
+            events.append((clock.time(), threading.current_thread().name))
+            clock.sleep(period)
+
+    threads = [threading.Thread(target=loop, args=(period,), name=name)
+               for name, period in (('b-slow', 3.0), ('a-fast', 2.0))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5.0)
+    assert not any(thread.is_alive() for thread in threads)
+    # 처음 두 사건은 스레드 시작 순서에 달렸고, 그 뒤로는 (시각, 스레드 이름) 순서
+    assert sorted(events[:2]) == [(0.0, 'a-fast'), (0.0, 'b-slow')]
+    assert events[2:] == [(2.0, 'a-fast'), (3.0, 'b-slow'), (4.0, 'a-fast'),
+                          (6.0, 'a-fast'), (6.0, 'b-slow')]
+
+
+def test_time_never_moves_backwards():
+    clock = VirtualClock(start=50.0)
+    clock.advance_to(60.0)
+    with pytest.raises(ValueError):
+        clock.advance_to(59.0)
+    clock.sleep(1.5)  # 참여 스레드 1개 - 바로 깨어난다
+    assert clock.time() == 61.5
+
+
+def test_pickled_clock_keeps_time_only():
+    clock = VirtualClock(start=5.0, until=20.0, participants=3)
+    clock.advance_to(7.0)
+    copy = pickle.loads(pickle.dumps(clock))
+    assert (copy.time(), copy.until, copy.participants) == (7.0, 20.0, 3)
+    assert copy._waiting == []
@@ -0,0 +1,73 @@
+# ----------------------------- 모듈 임포트 -----------------------------
+import numpy as np
+import pytest
+
+from stream_analytics import ChannelDetector, StreamAnalytics
+
+
+RANGES = {'co2': (0.0, 0.2), 'o2': (0.0, 10.0)}
+THRESHOLDS = {'co2': (None, 0.09), 'o2': (4.3, None)}
+
+
+def detector(**options):
+    return ChannelDetector('sensor', ('co2', 'o2'), RANGES, THRESHOLDS, **options)
+
+
+def test_threshold_alerts_only_on_entry():
+    sensor = detector()
+    kinds = []
+    for co2, o2 in ((0.05, 5.0), (0.10, 5.0), (0.12, 4.0), (0.11, 4.1), (0.05, 5.0), (0.10, 5.0)):
+        kinds.append([(a.channel, a.kind, a.limit) for a in sensor.update([1], [[co2, o2]], 0.0)])
+    assert kinds == [
+        [],
+        [('co2', 'high', 0.09)],
+        [('o2', 'low', 4.3)],
+        [],                          # 계속 범위 밖 - 다시 알리지 않는다
+        [],                          # 복귀
+        [('co2', 'high', 0.09)],     # 다시 벗어남
+    ]
+
+
+def test_threshold_state_is_per_instance():
+    sensor = detector()
+    assert len(sensor.update([1, 2], [[0.10, 5.0], [0.05, 5.0]], 0.0)) == 1
+    alerts = sensor.update([1, 2], [[0.10, 5.0], [0.10, 5.0]], 1.0)
+    assert [(a.instance_id, a.channel) for a in alerts] == [(2, 'co2')]
+
+
+def test_zscore_spike_after_min_count():
+    sensor = detector(min_count=30, z_threshold=4.0)
+    rng = np.random.default_rng(7)
+    for i in range(29):
+        # min_count 전에는 크게 튀어도 z-점수로 알리지 않는다
+        value = 9.0 if i == 10 else 6.0 + rng.normal(0.0, 0.1)
+        assert not [a for a in sensor.update([1], [[0.05, value]], i) if a.kind == 'zscore']
+    for i in range(29, 60):
+        assert sensor.update([1], [[0.05, 6.0 + rng.normal(0.0, 0.1)]], i) == []
+    spike, = sensor.update([1], [[0.05, 8.0]], 60.0)
+    assert (spike.channel, spike.kind) == ('o2', 'zscore')
+    assert spike.limit > 4.0
+    assert 'z=+' in spike.describe()
+
+
+def test_window_histogram_forgets_old_samples():
+    sensor = detector(window=10, buckets=10)
+    for _ in range(10):
+        sensor.update([1], [[0.01, 1.0]], 0.0)
+    for _ in range(10):
+        sensor.update([1], [[0.15, 8.5]], 0.0)
+    assert int(sensor.histogram[0].sum()) == 20   # 채널 2개 x window 10
+    assert sensor.percentiles(1, 'o2')[50] == pytest.approx(8.5)
+
+
+def test_max_alerts_bounds_the_alert_list():
+    specs = {'sensor': (('co2', 'o2'), RANGES, THRESHOLDS)}
+    kept = StreamAnalytics(specs, max_alerts=2)
+    none = StreamAnalytics(specs, max_alerts=0)
+    for analytics in (kept, none):
+        for i in range(5):
+            assert len(analytics.observe('sensor', i, {'co2': 0.1, 'o2': 5.0}, 0.0)) == 1
+    assert [a.instance_id for a in kept.alerts] == [3, 4]
+    assert none.alerts == []
+    with pytest.raises(ValueError):
+        StreamAnalytics(specs, max_alerts=-1)
@@ -0,0 +1,59 @@
+# ----------------------------- 모듈 임포트 -----------------------------
+import os
+
+import numpy as np
+import pytest
+
+from telemetry_bus import TelemetryRing
+
+
+@pytest.fixture
+def ring():
+    ring = TelemetryRing.create(f'test_ring_{os.getpid()}', nfields=2, capacity=8)
+    yield ring
+    ring.close()
+
+
+def publish(ring, first, count):
+    for seq in range(first, first + count):
+        ring.publish(float(seq), 1, [seq, -seq])
+
+
+def test_wrap_around_is_split_into_two_views(ring):
+    reader = ring.reader()
+    publish(ring, 0, 6)
+    assert [len(view) for view in reader.poll()] == [6]
+    publish(ring, 6, 5)  # 슬롯 6, 7, 0, 1, 2
+    views = reader.poll()
+    assert [len(view) for view in views] == [2, 3]
+    assert np.concatenate([view['seq'] for view in views]).tolist() == list(range(6, 11))
+    assert all(reader.revalidate(view).all() for view in views)
+    assert reader.dropped == 0
+
+
+def test_lagging_reader_counts_dropped(ring):
+    reader = ring.reader(from_start=True)
+    publish(ring, 0, 20)
+    views = reader.poll()
+    records = np.concatenate([reader.copy(view) for view in views])
+    assert records['seq'].tolist() == list(range(12, 20))  # 가장 최근 capacity개
+    assert records['values'][:, 0].tolist() == list(range(12, 20))
+    assert reader.dropped == 12
+    assert reader.poll() == []
+
+
+def test_revalidate_rejects_records_overwritten_after_poll(ring):
+    reader = ring.reader()
+    publish(ring, 0, 8)
+    (view,) = reader.poll()
+    values = view['values'][:, 0].copy()  # 소비자가 필드를 읽는 동안
+    publish(ring, 8, 3)                   # 생산자가 링을 돌아 슬롯 0~2를 덮어쓴다
+    valid = reader.revalidate(view)
+    assert valid.tolist() == [False] * 3 + [True] * 5
+    assert values[valid].tolist() == list(range(3, 8))
+    assert reader.dropped == 3
+    # 덮어쓰는 중인 슬롯(seq = -1)도 무효
+    (view,) = reader.poll()
+    ring.records[8 % ring.capacity]['seq'] = -1
+    assert reader.revalidate(view).tolist() == [False, True, True]
+    assert reader.dropped == 4
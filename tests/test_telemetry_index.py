@@ -0,0 +1,96 @@
+# ----------------------------- 모듈 임포트 -----------------------------
+import os
+
+import numpy as np
+import pytest
+
+from mars_mission_computer import RECORD_SCHEMAS, MissionComputer
+from output_sink import NullSink
+from sim_clock import RealClock
+from telemetry_index import INDEX_SUFFIX, TelemetryIndex, build_index
+from telemetry_log import TelemetryLog, TelemetryLogReader, list_segments
+from telemetry_record import RecordSchema
+
+
+class SteppingClock(RealClock):
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def time(self):
+        return self.now
+
+
+def record(directory, names=('Process-1', 'Process-2', 'Process-3'), samples=50):
+    clock = SteppingClock()
+    with TelemetryLog(directory, RECORD_SCHEMAS) as log:
+        computers = [MissionComputer(name, instance_id=i, sink=NullSink(), clock=clock)
+                     for i, name in enumerate(names, 1)]
+        for computer in computers:
+            computer.log = log
+        for _ in range(samples):
+            clock.now += 1.0
+            for computer in computers:
+                computer.collect('sensor')
+    return computers
+
+
+def test_query_by_instance_name(tmp_path):
+    computers = record(str(tmp_path))
+    index = TelemetryIndex(str(tmp_path))
+    channel = RECORD_SCHEMAS['sensor'].channels[0]
+    by_name = index.aggregate('sensor', 'Process-3', channel, 1010.0, 1030.0)
+    assert by_name == index.aggregate('sensor', 3, channel, 1010.0, 1030.0)
+    assert by_name == index.aggregate('sensor', computers[2], channel, 1010.0, 1030.0)
+    assert by_name['count'] == 21
+    timestamps, _ = index.select('sensor', 'Process-1', channel, 1000.0, 2000.0)
+    assert len(timestamps) == 50
+
+
+def test_explicit_name_map_and_unknown_name(tmp_path):
+    record(str(tmp_path), names=('Process-1',), samples=5)
+    index = TelemetryIndex(str(tmp_path), names={'alpha': 1})
+    channel = RECORD_SCHEMAS['sensor'].channels[0]
+    assert index.aggregate('sensor', 'alpha', channel, 0.0, 2000.0)['count'] == 5
+    with pytest.raises(KeyError):
+        index.aggregate('sensor', 'Process-9', channel, 0.0, 2000.0)
+
+
+def test_growing_segment_is_indexed_incrementally(tmp_path):
+    schema = RecordSchema('probe', ('값',))
+    directory = str(tmp_path)
+    index = TelemetryIndex(directory, block_records=8)
+    with TelemetryLog(directory, {'probe': schema}) as log:
+        for i in range(100):
+            log.append('probe', float(i), 1 + i % 3, (float(i),))
+            if i % 13 == 0:
+                log.flush()
+                assert index.aggregate('probe', 1, '값', 0.0, 1000.0)['count'] == (i + 3) // 3
+    path, = list_segments(directory, 'probe')
+    _, records, extended = index._segment_index(path)
+    assert np.array_equal(extended, build_index(records, 1, 8))
+    # 인덱스 파일에는 다 찬 블록만 남는다
+    assert len(np.load(path + INDEX_SUFFIX)) == int((extended['stop'] - extended['start'] == 8).sum())
+    assert index.aggregate('probe', 2, '값', 0.0, 1000.0)['count'] == 33
+    reopened = TelemetryIndex(directory, block_records=8)
+    assert np.array_equal(reopened._segment_index(path)[2], extended)
+    index.close()
+    reopened.close()
+
+
+def test_index_file_is_removed_with_its_segment(tmp_path):
+    schema = RecordSchema('probe', ('값',))
+    directory = str(tmp_path)
+    segment = len(schema.header()) + 10 * schema.size
+    index = TelemetryIndex(directory)
+    with TelemetryLog(directory, {'probe': schema}, segment_bytes=segment,
+                      max_bytes=2 * segment) as log:
+        for i in range(60):
+            log.append('probe', float(i), 1, (float(i),))
+            if i % 10 == 5:
+                index.build('probe')
+    index.build('probe')
+    segments = list_segments(directory, 'probe')
+    indexes = sorted(name for name in os.listdir(directory) if name.endswith(INDEX_SUFFIX))
+    assert indexes == sorted(os.path.basename(path) + INDEX_SUFFIX for path in segments)
+    assert sorted(index._cache) == segments
+    index.close()
@@ -0,0 +1,66 @@
+# ----------------------------- 모듈 임포트 -----------------------------
+import math
+import os
+
+from collector_engine import CollectorEngine, MetricSource
+from output_sink import MemorySink
+from telemetry_log import TelemetryLog, TelemetryLogReader, list_segments
+from telemetry_record import RecordSchema
+
+
+SCHEMA = RecordSchema('info', ('CPU_코어_수', '메모리_크기_GB'))
+
+
+class PartialInfoSource(MetricSource):
+    """ psutil.cpu_count(logical=False)가 None을 돌려준 호스트의 info """
+
+    name = 'info'
+    binary = False
+    schema = SCHEMA.channels
+
+    def __init__(self):
+        self.period = 1.0
+
+    def read(self, now):
+        return {'CPU_코어_수': None, '메모리_크기_GB': 16.0}
+
+
+class BrokenBus:
+    def publish(self, *args):
+        raise RuntimeError('버스 연결 끊김')
+
+
+def test_append_rotate_and_read_back(tmp_path):
+    with TelemetryLog(str(tmp_path), {'info': SCHEMA},
+                      segment_bytes=len(SCHEMA.header()) + 10 * SCHEMA.size) as log:
+        for i in range(25):
+            log.append('info', 100.0 + i, 7, (i, 2.0 * i))
+    assert len(list_segments(str(tmp_path), 'info')) == 3
+    records = list(TelemetryLogReader(str(tmp_path)).iter_records('info'))
+    assert [float(r['timestamp']) for r in records] == [100.0 + i for i in range(25)]
+    assert records[-1]['values'].tolist() == [24.0, 48.0]
+
+
+def test_size_limit_removes_oldest_segments(tmp_path):
+    segment = len(SCHEMA.header()) + 10 * SCHEMA.size
+    with TelemetryLog(str(tmp_path), {'info': SCHEMA}, segment_bytes=segment,
+                      max_bytes=2 * segment) as log:
+        for i in range(60):
+            log.append('info', float(i), 1, (i, i))
+    paths = list_segments(str(tmp_path), 'info')
+    # 교체할 때 닫힌 세그먼트 합계를 max_bytes 이하로 맞춘다 (쓰는 중인 세그먼트는 제외)
+    assert [os.path.basename(path) for path in paths] == [
+        'info-000003.seg', 'info-000004.seg', 'info-000005.seg']
+
+
+def test_missing_values_are_logged_as_nan_and_output_survives(tmp_path):
+    sink = MemorySink()
+    engine = CollectorEngine('Base-1', instance_id=1, sources=[PartialInfoSource()], sink=sink)
+    engine.bus = BrokenBus()
+    with TelemetryLog(str(tmp_path), {'info': SCHEMA}) as log:
+        engine.log = log
+        engine.collect('info')
+    (record,) = TelemetryLogReader(str(tmp_path)).iter_records('info')
+    assert math.isnan(record['values'][0]) and record['values'][1] == 16.0
+    assert any('버스 기록 에러' in line for line in sink.records)
+    assert any('"메모리_크기_GB": 16.0' in line for line in sink.records)  # JSON 출력도 나감
@@ -0,0 +1,70 @@
+# ----------------------------- 모듈 임포트 -----------------------------
+import io
+
+from output_sink import BatchingWriter, OutputSink
+from replay import iter_recording, recording_kinds
+from telemetry_record import RecordSchema, RecordStreamWriter, iter_frames
+
+
+LOAD = RecordSchema('load', ('cpu', 'memory'))
+SENSOR = RecordSchema('sensor', ('temperature', 'pressure', 'battery'))
+
+
+def test_mixed_kinds_round_trip(tmp_path):
+    """ 크기가 다른 두 종류를 한 스트림에 섞어 써도 종류별로 다시 읽힌다 """
+    out = io.BytesIO()
+    stream = RecordStreamWriter(out)
+    for i in range(10):
+        stream.write(LOAD, 100.0 + i, 1, {'cpu': i, 'memory': 2 * i})
+        stream.write(SENSOR, 100.0 + i, 2, (i, -i, 0.5))
+    out.seek(0)
+    frames = list(iter_frames(out))
+    assert [schema.kind for schema, _ in frames] == ['load', 'sensor'] * 10
+    assert SENSOR.decode(frames[-1][1]) == (109.0, 2, (9.0, -9.0, 0.5))
+
+    path = tmp_path / 'capture.bin'
+    path.write_bytes(out.getvalue() + b'\x01\x10')  # 쓰다 만 프레임
+    assert recording_kinds(str(path)) == ['load', 'sensor']
+    chunks = list(iter_recording(str(path), 'load', chunk_records=4))
+    assert [len(records) for _, records in chunks] == [4, 4, 2]
+    assert chunks[-1][1]['values'][-1].tolist() == [9.0, 18.0]
+
+
+def test_frames_from_unannounced_schema_are_skipped():
+    """ 스키마 프레임을 놓친 종류는 건너뛰고 다른 종류는 계속 읽는다 """
+    first, second = io.BytesIO(), io.BytesIO()
+    RecordStreamWriter(first).write(LOAD, 1.0, 1, (1, 2))
+    stream = RecordStreamWriter(second)
+    stream.write(LOAD, 2.0, 1, (3, 4))
+    stream.write(SENSOR, 2.0, 1, (5, 6, 7))
+    second.seek(0)
+    second.read(len(first.getvalue()) - LOAD.size - 7)  # load 스키마 프레임만 버린다
+    assert [schema.kind for schema, _ in iter_frames(second)] == ['sensor']
+
+
+class FailOnceSink(OutputSink):
+    """ 첫 묶음만 디스크가 가득 찬 것처럼 실패 """
+
+    def __init__(self):
+        self.failed = False
+        self.records = []
+
+    def write_batch(self, records):
+        if not self.failed:
+            self.failed = True
+            raise OSError(28, 'No space left on device')
+        self.records.extend(records)
+
+
+def test_schema_is_announced_again_after_a_lost_batch():
+    sink = FailOnceSink()
+    writer = BatchingWriter(sink, flush_interval=0.01)
+    stream = RecordStreamWriter(writer)
+    stream.write(LOAD, 1.0, 1, (1, 2))  # 스키마 프레임과 함께 사라지는 묶음
+    assert writer.flush(timeout=5)
+    for i in range(5):
+        stream.write(LOAD, 2.0 + i, 1, (i, i))
+    assert writer.flush(timeout=5)
+    decoded = list(iter_frames(io.BytesIO(b''.join(sink.records))))
+    assert [LOAD.decode(record)[0] for _, record in decoded] == [2.0, 3.0, 4.0, 5.0, 6.0]
+    writer.close(timeout=5)
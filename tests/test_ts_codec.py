@@ -0,0 +1,66 @@
+# ----------------------------- 모듈 임포트 -----------------------------
+import numpy as np
+import pytest
+
+from ts_codec import CodecError, decode_block, detect_digits, encode_block
+
+
+def round_trip(timestamps, values, **options):
+    decoded_timestamps, decoded = decode_block(encode_block(timestamps, values, **options))
+    assert decoded.dtype == np.asarray(values).dtype
+    return decoded_timestamps, decoded
+
+
+def test_round_trip_is_lossless_for_rounded_sensor_values():
+    rng = np.random.default_rng(3)
+    timestamps = 1_700_000_000.0 + 5.0 * np.arange(500) + rng.integers(0, 3, 500) / 1000
+    values = np.array([np.round(rng.uniform(18, 30, 500), 2),
+                       np.round(rng.uniform(0.02, 0.1, 500), 3)])
+    decoded_timestamps, decoded = round_trip(timestamps, values)
+    assert np.array_equal(decoded, values)
+    assert np.allclose(decoded_timestamps, timestamps, rtol=0, atol=5e-4)
+    assert len(encode_block(timestamps, values)) < values.nbytes // 2
+
+
+def test_float32_columns_round_trip_exactly():
+    values = np.round(np.linspace(-80, -20, 50), 1).astype(np.float32)[None, :]
+    _, decoded = round_trip(np.arange(50.0), values)
+    assert np.array_equal(decoded, values)
+
+
+def test_nan_and_inf_channels_are_stored_raw():
+    values = np.array([[1.5, np.nan, 2.5], [np.inf, 1.0, -np.inf]])
+    assert detect_digits(values[0]) == -1
+    _, decoded = round_trip([0.0, 1.0, 2.0], values)
+    assert np.array_equal(decoded, values, equal_nan=True)
+
+
+def test_values_beyond_int64_after_scaling_are_stored_raw():
+    values = np.array([[1e300, -1e300, 2e300], [9e15, -9e15, 1.0]])
+    _, decoded = round_trip([0.0, 1.0, 2.0], values)
+    assert np.array_equal(decoded, values)
+    # 자릿수를 직접 줘도 정수화하면 넘치는 채널은 원시 값으로
+    _, decoded = round_trip([0.0, 1.0, 2.0], values, digits=[6, 6])
+    assert np.array_equal(decoded, values)
+
+
+def test_explicit_digits_fall_back_when_lossy():
+    values = np.array([[0.125, 0.25, 0.375]])
+    _, decoded = round_trip([0.0, 1.0, 2.0], values, digits=[1])
+    assert np.array_equal(decoded, values)
+
+
+def test_empty_and_single_sample_blocks():
+    timestamps, values = round_trip([], np.empty((2, 0)))
+    assert timestamps.size == 0 and values.shape == (2, 0)
+    timestamps, values = round_trip([12.5], np.array([[3.25], [7.0]]))
+    assert timestamps.tolist() == [12.5] and values[:, 0].tolist() == [3.25, 7.0]
+
+
+def test_malformed_input_raises_codec_error():
+    with pytest.raises(CodecError):
+        encode_block([0.0, 1.0], np.zeros((2, 3)))
+    with pytest.raises(CodecError):
+        decode_block(b'XXXX' + bytes(16))
+    with pytest.raises(CodecError):
+        decode_block(b'TS')
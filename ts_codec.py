@@ -0,0 +1,161 @@
+# ----------------------------- 모듈 임포트 -----------------------------
+import struct
+
+import numpy as np
+
+
+# ----------------------------- 블록 형식 -----------------------------
+# 헤더 (리틀 엔디언)
+#   매직 4바이트 b'TSC1' | 샘플 수 u32 | 채널 수 u8 | 값 형식 1바이트 ('f' 또는 'd')
+#   | 시각 단위 지수 i8 (시각 단위 = 10 ** 지수 초)
+# 타임스탬프: 첫 시각 i64 | 첫 간격 i64 | 간격의 차이(delta-of-delta) 묶음
+# 채널마다: 소수 자릿수 i8 (-1이면 원시 값) 다음
+#   자릿수 >= 0 : 첫 값(정수화) i64 | 값 차이 묶음
+#   자릿수 == -1: 원시 값 배열 (값 형식 그대로)
+# 묶음(frame of reference): 폭 u8 (0/1/2/4/8) | 기준값(최솟값) i64 | (값 - 기준값)을 폭 바이트 부호 없는 정수로 나열
+BLOCK_MAGIC = b'TSC1'
+_HEADER = struct.Struct('<4sIBcb')
+_PACKED = struct.Struct('<Bq')
+_INT64 = struct.Struct('<q')
+_DIGITS = struct.Struct('<b')
+_NUMPY_TYPES = {'f': np.float32, 'd': np.float64}
+MAX_DIGITS = 6
+_MAX_SCALED = 2 ** 62  # 정수화한 값의 절댓값 상한 (이웃 값의 차이가 i64에 들어가야 함)
+
+
+class CodecError(ValueError):
+    """ 블록이 형식에 맞지 않을 때 발생 """
+
+
+def _pack(values):
+    """ 정수 배열을 (폭, 기준값, 부호 없는 정수 바이트열) 묶음으로 """
+    if len(values) == 0:
+        return _PACKED.pack(0, 0)
+    reference = int(values.min())
+    span = int(values.max()) - reference
+    for width in (0, 1, 2, 4, 8):
+        if span < 1 << (8 * width):
+            break
+    offsets = values - reference
+    body = offsets.astype(f'<u{width}').tobytes() if width else b''
+    return _PACKED.pack(width, reference) + body
+
+
+def _unpack(buf, pos, count):
+    width, reference = _PACKED.unpack_from(buf, pos)
+    pos += _PACKED.size
+    if width == 0:
+        return np.full(count, reference, dtype=np.int64), pos
+    end = pos + count * width
+    offsets = np.frombuffer(buf[pos:end], dtype=f'<u{width}')
+    return offsets.astype(np.int64) + reference, end
+
+
+def detect_digits(column, max_digits=MAX_DIGITS):
+    """
+    10 ** 자릿수를 곱해 정수로 만들었다가 되돌려도 값이 정확히 같은 가장 작은 자릿수
+    - 없으면 -1 (원시 값으로 저장)
+    """
+    column = np.asarray(column)
+    for digits in range(max_digits + 1):
+        scale = 10.0 ** digits
+        restored = (np.rint(column.astype(np.float64) * scale) / scale).astype(column.dtype)
+        if np.array_equal(restored, column):
+            return digits
+    return -1
+
+
+# ----------------------------- 부호화/복호화 -----------------------------
+def encode_block(timestamps, values, digits=None, time_exponent=-3):
+    """
+    채널별 시계열 블록 1개를 압축
+    - timestamps: 길이 n (초), 10 ** time_exponent 초 단위로 반올림하여 저장 (기본 1ms)
+    - values: shape (채널 수, n) 배열 (float32 또는 float64, SensorHistory/generate()와 같은 형태)
+    - digits: 채널별 소수 자릿수 (None이면 채널마다 detect_digits()로 찾음)
+      자릿수로 정수화한 값이 원래 값과 다르면 그 채널은 원시 값으로 저장 (항상 무손실)
+    """
+    timestamps = np.asarray(timestamps, dtype=np.float64)
+    values = np.asarray(values)
+    if values.dtype not in (np.float32, np.float64):
+        values = values.astype(np.float64)
+    if values.ndim != 2 or values.shape[1] != len(timestamps):
+        raise CodecError('values는 shape (채널 수, 샘플 수)여야 합니다.')
+    value_format = 'f' if values.dtype == np.float32 else 'd'
+    count = len(timestamps)
+    parts = [_HEADER.pack(BLOCK_MAGIC, count, values.shape[0], value_format.encode('ascii'),
+                          time_exponent)]
+
+    ticks = np.rint(timestamps / 10.0 ** time_exponent).astype(np.int64)
+    deltas = np.diff(ticks)
+    parts.append(_INT64.pack(int(ticks[0]) if count else 0))
+    parts.append(_INT64.pack(int(deltas[0]) if count > 1 else 0))
+    parts.append(_pack(np.diff(deltas)))
+
+    for row, column in enumerate(values):
+        channel_digits = detect_digits(column) if digits is None else digits[row]
+        if channel_digits >= 0:
+            scale = 10.0 ** channel_digits
+            scaled = np.rint(column.astype(np.float64) * scale)
+            if (not np.array_equal((scaled / scale).astype(values.dtype), column)
+                    or (count and np.abs(scaled).max() >= _MAX_SCALED)):
+                channel_digits = -1  # 정수화할 수 없거나 i64를 넘는 값(inf 포함) - 원시 값으로
+        parts.append(_DIGITS.pack(channel_digits))
+        if channel_digits < 0:
+            parts.append(column.astype(values.dtype.newbyteorder('<')).tobytes())
+            continue
+        scaled = scaled.astype(np.int64)
+        parts.append(_INT64.pack(int(scaled[0]) if count else 0))
+        parts.append(_pack(np.diff(scaled)))
+    return b''.join(parts)
+
+
+def decode_block(data):
+    """ encode_block()의 역변환 - (timestamps float64, values shape (채널 수, n)) 반환 """
+    buf = memoryview(data)
+    try:
+        magic, count, channels, value_format, time_exponent = _HEADER.unpack_from(buf, 0)
+    except struct.error as e:
+        raise CodecError(f'헤더가 잘렸습니다: {e}') from None
+    if magic != BLOCK_MAGIC:
+        raise CodecError(f'매직 값이 다릅니다: {bytes(magic)!r}')
+    dtype = _NUMPY_TYPES.get(value_format.decode('ascii'))
+    if dtype is None:
+        raise CodecError(f'지원하지 않는 값 형식: {value_format!r}')
+    pos = _HEADER.size
+
+    first_tick, = _INT64.unpack_from(buf, pos)
+    first_delta, = _INT64.unpack_from(buf, pos + 8)
+    dod, pos = _unpack(buf, pos + 16, max(count - 2, 0))
+    ticks = np.empty(count, dtype=np.int64)
+    if count:
+        ticks[0] = first_tick
+    if count > 1:
+        deltas = np.empty(count - 1, dtype=np.int64)
+        deltas[0] = first_delta
+        np.cumsum(dod, out=deltas[1:])
+        deltas[1:] += first_delta
+        np.cumsum(deltas, out=ticks[1:])
+        ticks[1:] += first_tick
+    if time_exponent < 0:
+        timestamps = ticks / 10.0 ** -time_exponent
+    else:
+        timestamps = ticks * 10.0 ** time_exponent
+
+    values = np.empty((channels, count), dtype=dtype)
+    for row in range(channels):
+        channel_digits, = _DIGITS.unpack_from(buf, pos)
+        pos += 1
+        if channel_digits < 0:
+            end = pos + count * np.dtype(dtype).itemsize
+            values[row] = np.frombuffer(buf[pos:end], dtype=np.dtype(dtype).newbyteorder('<'))
+            pos = end
+            continue
+        first, = _INT64.unpack_from(buf, pos)
+        diffs, pos = _unpack(buf, pos + 8, max(count - 1, 0))
+        scaled = np.empty(count, dtype=np.int64)
+        if count:
+            scaled[0] = first
+            np.cumsum(diffs, out=scaled[1:])
+            scaled[1:] += first
+        values[row] = scaled / 10.0 ** channel_digits
+    return timestamps, values